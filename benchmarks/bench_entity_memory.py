@@ -0,0 +1,191 @@
+"""Benchmark des entités à slots : mémoire par entité et vitesse d'accès aux attributs.
+
+Projectiles, power-ups, explosions et particules déclarent __slots__ : plus
+de dict par instance. Pour chaque entité, compare la taille de l'objet à
+slots à celle du même objet dict-backed (objet ordinaire portant les mêmes
+attributs dans son __dict__, la disposition d'avant), puis la vitesse de
+lecture/écriture d'attributs et celle des boucles de particules
+(dicts d'avant contre structs à slots).
+
+Les valeurs référencées (rect, surfaces, listes) sont les mêmes dans les
+deux cas et ne sont pas comptées.
+
+Usage : python -m benchmarks.bench_entity_memory [--loops N]
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import timeit
+import tracemalloc
+
+import pygame
+
+PARTICLES = 1000
+
+
+class _DictBacked:
+    """Objet ordinaire : attributs dans un __dict__"""
+
+
+def _slot_names(obj):
+    names = []
+    for cls in type(obj).__mro__:
+        for name in cls.__dict__.get("__slots__", ()):
+            if hasattr(obj, name) and name not in names:
+                names.append(name)
+    return names
+
+
+def dict_backed(obj):
+    """Copie dict-backed d'une instance à slots (mêmes attributs, mêmes valeurs)."""
+    twin = _DictBacked()
+    for name in _slot_names(obj):
+        setattr(twin, name, getattr(obj, name))
+    return twin
+
+
+def dict_size(obj):
+    return sys.getsizeof(obj) + sys.getsizeof(obj.__dict__)
+
+
+def make_entities():
+    """(nom, instance à slots) pour les entités mesurées."""
+    from entities.player import ThrusterParticle
+    from entities.powerup import PowerUp
+    from entities.projectiles import (
+        Projectile, SpreadProjectile, HomingProjectile, Boss8Projectile,
+        CrystalShardProjectile, EdgeRollerProjectile
+    )
+    from graphics.effects import Explosion
+    from systems.sim_clock import SimClock
+
+    explosion = Explosion(100, 100, clock=SimClock())
+    return [
+        ("Projectile", Projectile(400, 500)),
+        ("SpreadProjectile", SpreadProjectile(400, 500)),
+        ("HomingProjectile", HomingProjectile(400, 100)),
+        ("Boss8Projectile", Boss8Projectile(400, 100, 0, 1)),
+        ("CrystalShardProjectile", CrystalShardProjectile(400, 100, 0, 1)),
+        ("EdgeRollerProjectile", EdgeRollerProjectile(400, 100, 400, 500)),
+        ("PowerUp", PowerUp(400, 100)),
+        ("Explosion", explosion),
+        ("ExplosionParticle", explosion.particles[0]),
+        ("ThrusterParticle", ThrusterParticle(400, 500, 0.1, 3.0, 15, 4.5)),
+    ]
+
+
+def print_memory(entities):
+    print(f"{'entité':<24} {'attributs':>9} {'dict (o)':>9} {'slots (o)':>9} {'gain':>7}")
+    for name, obj in entities:
+        before = dict_size(dict_backed(obj))
+        after = sys.getsizeof(obj)
+        print(f"{name:<24} {len(_slot_names(obj)):>9} {before:>9} {after:>9} {1 - after / before:>6.0%}")
+
+
+def allocated(factory, count):
+    """Octets alloués (tracemalloc) par objet créé par factory."""
+    tracemalloc.start()
+    objects = [factory() for _ in range(count)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return size / count
+
+
+def print_particle_allocations():
+    from entities.player import ThrusterParticle
+
+    def old():
+        return {'x': 400.0, 'y': 500, 'vx': 0.1, 'vy': 3.0, 'life': 15, 'max_life': 20, 'size': 4.5}
+
+    def new():
+        return ThrusterParticle(400.0, 500, 0.1, 3.0, 15, 4.5)
+
+    before = allocated(old, PARTICLES)
+    after = allocated(new, PARTICLES)
+    print(f"\nParticule du réacteur ({PARTICLES} allouées) : dict {before:.0f} o, "
+          f"slots {after:.0f} o par particule ({1 - after / before:.0%})")
+
+
+def access_time(obj, loops):
+    """ns par opération : lecture de rect/dx/dy, écriture de dx."""
+    stmt_read = "obj.rect; obj.dx; obj.dy"
+    stmt_write = "obj.dx = 0.5"
+    read = min(timeit.repeat(stmt_read, globals={"obj": obj}, number=loops, repeat=5)) / (3 * loops)
+    write = min(timeit.repeat(stmt_write, globals={"obj": obj}, number=loops, repeat=5)) / loops
+    return read * 1e9, write * 1e9
+
+
+def print_access(entities, loops):
+    print(f"\n{'accès aux attributs':<24} {'lecture dict':>12} {'lecture slots':>13} "
+          f"{'écriture dict':>13} {'écriture slots':>14}   (ns)")
+    for name, obj in entities:
+        if not all(hasattr(obj, attr) for attr in ("rect", "dx", "dy")):
+            continue
+        read_before, write_before = access_time(dict_backed(obj), loops)
+        read_after, write_after = access_time(obj, loops)
+        print(f"{name:<24} {read_before:>12.1f} {read_after:>13.1f} {write_before:>13.1f} {write_after:>14.1f}")
+
+
+def update_dict_particles(particles):
+    """Boucle de Explosion.update avec les dicts d'avant"""
+    for p in particles:
+        p['x'] += p['vx']
+        p['y'] += p['vy']
+        p['vx'] *= 0.95
+        p['vy'] *= 0.95
+        p['radius'] = max(0, p['radius'] - 0.1)
+
+
+def update_slot_particles(particles):
+    """Boucle de Explosion.update avec les particules à slots"""
+    for p in particles:
+        p.x += p.vx
+        p.y += p.vy
+        p.vx *= 0.95
+        p.vy *= 0.95
+        p.radius = max(0, p.radius - 0.1)
+
+
+def print_particle_updates(loops):
+    from graphics.effects import ExplosionParticle
+
+    rng = random.Random(0)
+    dicts, slotted = [], []
+    for _ in range(PARTICLES):
+        angle = rng.uniform(0, 2 * math.pi)
+        values = {'x': 100.0, 'y': 100.0, 'vx': math.cos(angle) * 3, 'vy': math.sin(angle) * 3,
+                  'radius': rng.randint(2, 6), 'color': (255, 100, 0)}
+        dicts.append(dict(values))
+        particle = ExplosionParticle()
+        for key, value in values.items():
+            setattr(particle, key, value)
+        slotted.append(particle)
+
+    frames = max(1, loops // 10000)
+    before = min(timeit.repeat(lambda: update_dict_particles(dicts), number=frames, repeat=5)) / frames
+    after = min(timeit.repeat(lambda: update_slot_particles(slotted), number=frames, repeat=5)) / frames
+    print(f"\nMise à jour de {PARTICLES} particules d'explosion : dict {before * 1e6:.1f} µs, "
+          f"slots {after * 1e6:.1f} µs ({before / after:.2f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--loops", type=int, default=1000000)
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+    entities = make_entities()
+    print_memory(entities)
+    print_particle_allocations()
+    print_access(entities, args.loops)
+    print_particle_updates(args.loops)
+
+
+if __name__ == "__main__":
+    main()
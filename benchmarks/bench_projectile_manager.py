@@ -0,0 +1,96 @@
+"""Benchmark de update_enemy_projectiles : dispatch par introspection vs cache par classe.
+
+Mesure le coût moyen d'une frame de mise à jour des projectiles ennemis
+avec 100, 500 et 2000 projectiles, avec l'ancienne version (inspect.signature
+appelé pour chaque projectile à chaque frame) et la version actuelle.
+
+Usage : python -m benchmarks.bench_projectile_manager [--frames N]
+"""
+import argparse
+import inspect
+import os
+import random
+import time
+
+import pygame
+
+from entities.projectiles import (
+    EnemyProjectile, BossProjectile, Boss2Projectile, HomingProjectile,
+    ZigZagProjectile, GravityProjectile, SplittingProjectile, MirrorProjectile
+)
+from systems.projectile_manager import update_enemy_projectiles
+
+COUNTS = (100, 500, 2000)
+PLAYER_POSITION = (400, 500)
+
+
+def legacy_update_enemy_projectiles(projectiles, player_position, player_positions=None):
+    """Ancienne version : signature de update() introspectée à chaque appel."""
+    for proj in projectiles:
+        params = list(inspect.signature(proj.update).parameters.keys())
+
+        target = player_position
+        if player_positions and 'player_position' in params:
+            target = min(player_positions, key=lambda p: abs(p[0] - proj.rect.centerx))
+
+        if 'player_position' in params and 'other_projectiles' in params:
+            proj.update(target, projectiles)
+        elif 'player_position' in params:
+            proj.update(target)
+        elif 'other_projectiles' in params:
+            proj.update(projectiles)
+        else:
+            proj.update()
+
+    new_split = []
+    for proj in projectiles:
+        if isinstance(proj, SplittingProjectile) and proj.should_split():
+            new_split.extend(proj.split())
+        elif isinstance(proj, MirrorProjectile) and proj.should_split():
+            new_split.extend(proj.split())
+    projectiles.extend(new_split)
+    return projectiles
+
+
+def make_projectiles(count, seed=0):
+    """Mélange représentatif de tirs ennemis (linéaires, à tête chercheuse, ondulants)."""
+    rng = random.Random(seed)
+    factories = [
+        lambda x, y: EnemyProjectile(x, y, 0, 1),
+        lambda x, y: BossProjectile(x, y, rng.uniform(-1, 1), 1),
+        lambda x, y: Boss2Projectile(x, y, rng.uniform(-1, 1), 1),
+        lambda x, y: HomingProjectile(x, y),
+        lambda x, y: ZigZagProjectile(x, y, 1),
+        lambda x, y: GravityProjectile(x, y, rng.uniform(-1, 1), -1),
+    ]
+    return [rng.choice(factories)(rng.randint(0, 800), rng.randint(0, 300))
+            for _ in range(count)]
+
+
+def bench(update_func, count, frames):
+    """Retourne le temps moyen d'une frame en millisecondes."""
+    projectiles = make_projectiles(count)
+    start = time.perf_counter()
+    for _ in range(frames):
+        projectiles = update_func(projectiles, PLAYER_POSITION)
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=60)
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+    print(f"{'projectiles':>12} {'avant (ms)':>12} {'après (ms)':>12} {'gain':>8}")
+    for count in COUNTS:
+        before = bench(legacy_update_enemy_projectiles, count, args.frames)
+        after = bench(update_enemy_projectiles, count, args.frames)
+        print(f"{count:>12} {before:>12.3f} {after:>12.3f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
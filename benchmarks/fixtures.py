@@ -0,0 +1,105 @@
+"""Fabriques de projectiles partagées par le stress test (stress.py) et la suite de benchmarks.
+
+projectile_factories() associe à chaque nom de classe de entities.projectiles
+une fabrique(rng, cible, ancre) qui crée un tir à une position aléatoire :
+tirs du joueur dans la moitié basse de l'écran, tirs ennemis dans le tiers
+haut. Les tirs qui tirent au hasard reçoivent rng, pour que les scénarios
+soient reproductibles.
+"""
+import inspect
+import math
+
+import pygame
+
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from entities import projectiles as shots
+
+PLAYER_SHOTS = ("Projectile", "SpreadProjectile", "RicochetProjectile",
+                "ZigZagPlayerProjectile", "MissileProjectile")
+
+
+class Anchor:
+    """Centre de rotation des orbes cristallins (à défaut du Boss 8)."""
+
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(0, 0, 1, 1)
+        self.rect.center = (x, y)
+
+
+def _direction(rng):
+    """Vecteur unitaire vers le bas, à ±60° de la verticale."""
+    angle = math.radians(90 + rng.uniform(-60, 60))
+    return math.cos(angle), math.sin(angle)
+
+
+def _rng_kwargs(cls):
+    """Fonction rng -> kwargs : le générateur du scénario pour les tirs qui tirent au hasard.
+
+    La signature n'est inspectée qu'une fois par classe (pas à chaque tir).
+    """
+    if "rng" in inspect.signature(cls).parameters:
+        return lambda rng: {"rng": rng}
+    return lambda rng: {}
+
+
+def projectile_factories():
+    """Nom de classe -> fabrique(rng, cible, ancre) ; cible = position du joueur."""
+    top = (0, SCREEN_HEIGHT // 3)
+
+    def pos(rng):
+        return rng.randint(0, SCREEN_WIDTH), rng.randint(*top)
+
+    def aimed(cls):
+        rng_kwargs = _rng_kwargs(cls)
+        return lambda rng, target, anchor: cls(*pos(rng), *_direction(rng), **rng_kwargs(rng))
+
+    def at(cls):
+        rng_kwargs = _rng_kwargs(cls)
+        return lambda rng, target, anchor: cls(*pos(rng), **rng_kwargs(rng))
+
+    def towards(cls):
+        rng_kwargs = _rng_kwargs(cls)
+        return lambda rng, target, anchor: cls(*pos(rng), *target, **rng_kwargs(rng))
+
+    def player_shot(cls, **kwargs):
+        rng_kwargs = _rng_kwargs(cls)
+        return lambda rng, target, anchor: cls(rng.randint(0, SCREEN_WIDTH),
+                                               rng.randint(SCREEN_HEIGHT // 2, SCREEN_HEIGHT),
+                                               **kwargs, **rng_kwargs(rng))
+
+    def spread_shot(rng, target, anchor):
+        angle = rng.choice((-15, 15))
+        return shots.SpreadProjectile(rng.randint(0, SCREEN_WIDTH),
+                                      rng.randint(SCREEN_HEIGHT // 2, SCREEN_HEIGHT), angle=angle)
+
+    factories = {
+        "Projectile": player_shot(shots.Projectile),
+        "SpreadProjectile": spread_shot,
+        "RicochetProjectile": player_shot(shots.RicochetProjectile),
+        "ZigZagPlayerProjectile": player_shot(shots.ZigZagPlayerProjectile),
+        "MissileProjectile": player_shot(shots.MissileProjectile),
+        "HomingProjectile": at(shots.HomingProjectile),
+        "ZigZagProjectile": lambda rng, target, anchor: shots.ZigZagProjectile(*pos(rng), 1),
+        "GravityProjectile": lambda rng, target, anchor: shots.GravityProjectile(
+            *pos(rng), rng.uniform(-1, 1), -rng.uniform(0.2, 1)),
+        "VortexProjectile": towards(shots.VortexProjectile),
+        "BlackHoleProjectile": at(shots.BlackHoleProjectile),
+        "PulseWaveProjectile": at(shots.PulseWaveProjectile),
+        "BallBreakerProjectile": towards(shots.BallBreakerProjectile),
+        "EdgeRollerProjectile": towards(shots.EdgeRollerProjectile),
+        "CurveStalkerProjectile": lambda rng, target, anchor: shots.CurveStalkerProjectile(
+            *pos(rng), anchor.rect.centerx - 80, anchor.rect.centerx + 80, rng.choice(("left", "right"))),
+        "PathChaserProjectile": at(shots.PathChaserProjectile),
+        "PathWanderProjectile": at(shots.PathWanderProjectile),
+        "FieldDodgerProjectile": lambda rng, target, anchor: shots.FieldDodgerProjectile(
+            *anchor.rect.center, *target, rng=rng),
+        "CrystalOrbProjectile": lambda rng, target, anchor: shots.CrystalOrbProjectile(
+            anchor, rng.uniform(0, 2 * math.pi), color_offset=rng.uniform(0, 6)),
+        "PhoenixWaveProjectile": at(shots.PhoenixWaveProjectile),
+    }
+    # Tous les autres tirs ennemis prennent (x, y, dx, dy)
+    for name, cls in vars(shots).items():
+        if (isinstance(cls, type) and issubclass(cls, shots.EnemyProjectile)
+                and cls.__module__ == shots.__name__ and name not in factories):
+            factories[name] = aimed(cls)
+    return factories
@@ -0,0 +1,129 @@
+"""Harnais des benchmarks : enregistrement des cas, mesure, résultats JSON et comparaison.
+
+Un cas est une fabrique enregistrée avec @benchmark : appelée avant chaque
+répétition (préparation non chronométrée), elle retourne la fonction à
+chronométrer, qui effectue `ops` opérations. Le résultat retenu est la
+médiane du temps par opération sur les répétitions, GC coupé pendant la
+mesure (comme timeit).
+"""
+import gc
+import json
+import platform
+import re
+import statistics
+import time
+
+import numpy
+import pygame
+
+DEFAULT_REPEAT = 7
+# Écart relatif de la médiane au-delà duquel un cas est signalé
+DEFAULT_THRESHOLD = 0.10
+
+BENCHMARKS = {}
+
+
+class Benchmark:
+    def __init__(self, name, factory, ops=1, repeat=None):
+        self.name = name
+        self.factory = factory
+        self.ops = ops
+        self.repeat = repeat
+
+
+def benchmark(name, ops=1, repeat=None):
+    """Décorateur : enregistre une fabrique de cas sous un nom (« groupe/cas »)."""
+    def register(factory):
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark déjà enregistré : {name}")
+        BENCHMARKS[name] = Benchmark(name, factory, ops, repeat)
+        return factory
+    return register
+
+
+def measure(bench, repeat=DEFAULT_REPEAT):
+    """Chronomètre un cas ; temps par opération en microsecondes."""
+    repeat = bench.repeat or repeat
+    samples = []
+    for _ in range(repeat):
+        run = bench.factory()
+        gc.collect()
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        samples.append(elapsed / bench.ops * 1e6)
+    return {
+        "median_us": statistics.median(samples),
+        "min_us": min(samples),
+        "max_us": max(samples),
+        "ops": bench.ops,
+        "repeat": repeat,
+    }
+
+
+def select(patterns=None):
+    """Cas dont le nom contient l'un des motifs (expressions régulières), tous par défaut."""
+    if not patterns:
+        return list(BENCHMARKS.values())
+    regexes = [re.compile(pattern) for pattern in patterns]
+    return [bench for name, bench in BENCHMARKS.items() if any(r.search(name) for r in regexes)]
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "numpy": numpy.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+
+def run(patterns=None, repeat=DEFAULT_REPEAT, report=print):
+    """Exécute les cas sélectionnés et retourne le document de résultats ; report reçoit une ligne par cas."""
+    results = {}
+    for bench in select(patterns):
+        result = measure(bench, repeat)
+        results[bench.name] = result
+        report(f"{bench.name:<48} {result['median_us']:>12.2f} µs/op  (min {result['min_us']:.2f})")
+    return {"environment": environment(), "results": results}
+
+
+def save(document, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2, ensure_ascii=False, sort_keys=True)
+
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """Lignes (nom, référence µs, actuel µs, ratio, statut) pour les cas présents des deux côtés.
+
+    statut : "régression", "amélioration" ou "" selon le seuil relatif.
+    """
+    rows = []
+    before_results = baseline["results"]
+    for name, after in current["results"].items():
+        before = before_results.get(name)
+        if before is None:
+            continue
+        ratio = after["median_us"] / max(before["median_us"], 1e-12)
+        if ratio > 1 + threshold:
+            status = "régression"
+        elif ratio < 1 - threshold:
+            status = "amélioration"
+        else:
+            status = ""
+        rows.append((name, before["median_us"], after["median_us"], ratio, status))
+    return rows
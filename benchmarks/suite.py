@@ -0,0 +1,386 @@
+"""Suite de benchmarks sans fenêtre, avec résultats JSON de référence et comparaison.
+
+Cas mesurés (temps médian par opération) :
+- construction et update des projectiles, par classe ;
+- manage_enemy_projectiles avec 100, 500 et 2000 tirs ;
+- passes de collision du World sur une scène chargée ;
+- Explosion.draw ;
+- draw de chacun des fonds animés ;
+- régénération des sprites des boss ;
+- sérialisation et décodage du message STATE.
+
+Usage :
+    python -m benchmarks.suite run [-k motif] [-o resultats.json]
+    python -m benchmarks.suite run --save-baseline
+    python -m benchmarks.suite compare [reference.json] [resultats.json] [--threshold 0.1]
+
+Sans fichier, compare lit la référence enregistrée par --save-baseline
+et mesure l'état actuel. Le code de retour vaut 1 en cas de régression.
+Les temps dépendent de la machine : une référence ne se compare qu'aux
+mesures faites sur la même machine.
+"""
+import argparse
+import inspect
+import os
+import random
+import re
+import sys
+
+import pygame
+
+from benchmarks import harness
+from benchmarks.harness import benchmark
+from systems.quiet import quiet
+
+# Référence par défaut (propre à chaque machine, non versionnée)
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "results", "baseline.json")
+
+PLAYER_POSITION = (400, 850)
+
+CONSTRUCT_COUNT = 500
+UPDATE_COUNT = 500
+UPDATE_FRAMES = 20
+MANAGER_COUNTS = (100, 500, 2000)
+MANAGER_FRAMES = 10
+# Balles du Boss 7 au milieu d'autres tirs : le coût des balles ne doit pas suivre le nombre de tirs
+BALL_COUNT = 20
+BALL_BYSTANDERS = (0, 2000)
+EXPLOSION_COUNT = 50
+DRAW_FRAMES = 10
+SPRITE_CALLS = 5
+STATE_MESSAGES = 20
+
+
+# === Projectiles ===
+
+# Cas mesurés, parmi les fabriques partagées avec le stress test
+PROJECTILE_CASES = (
+    "Projectile", "SpreadProjectile", "RicochetProjectile", "MissileProjectile",
+    "EnemyProjectile", "BossProjectile", "HomingProjectile", "SplittingProjectile",
+    "GravityProjectile", "BouncingProjectile",
+)
+
+
+def _register_projectiles():
+    from benchmarks.fixtures import PLAYER_SHOTS, Anchor, projectile_factories
+    from systems.projectile_manager import update_enemy_projectiles
+
+    factories = projectile_factories()
+    anchor = Anchor(PLAYER_POSITION[0], 150)
+    for name in PROJECTILE_CASES:
+        make = factories[name]
+
+        def construct(make=make):
+            rng = random.Random(0)
+
+            def run():
+                for _ in range(CONSTRUCT_COUNT):
+                    make(rng, PLAYER_POSITION, anchor)
+            return run
+        benchmark(f"projectiles/construction/{name}", ops=CONSTRUCT_COUNT)(construct)
+
+        def update(make=make, player_shot=name in PLAYER_SHOTS):
+            rng = random.Random(0)
+            projectiles = [make(rng, PLAYER_POSITION, anchor) for _ in range(UPDATE_COUNT)]
+            if player_shot:
+                def run():
+                    for _ in range(UPDATE_FRAMES):
+                        for projectile in projectiles:
+                            projectile.update()
+            else:
+                def run():
+                    for _ in range(UPDATE_FRAMES):
+                        update_enemy_projectiles(projectiles, PLAYER_POSITION)
+            return run
+        benchmark(f"projectiles/update/{name}", ops=UPDATE_COUNT * UPDATE_FRAMES)(update)
+
+
+def _register_manager():
+    from benchmarks.bench_projectile_manager import make_projectiles
+    from systems.projectile_manager import manage_enemy_projectiles
+
+    for count in MANAGER_COUNTS:
+        def manage(count=count):
+            projectiles = make_projectiles(count)
+
+            def run():
+                current = projectiles
+                for _ in range(MANAGER_FRAMES):
+                    current = manage_enemy_projectiles(current, PLAYER_POSITION)
+            return run
+        benchmark(f"manage_enemy_projectiles/{count}", ops=MANAGER_FRAMES)(manage)
+
+    for count in BALL_BYSTANDERS:
+        def balls(count=count):
+            from entities.projectiles import BallBreakerProjectile, EnemyProjectile
+            from systems.projectile_manager import update_enemy_projectiles
+
+            rng = random.Random(0)
+            projectiles = [EnemyProjectile(rng.randint(0, 800), rng.randint(0, 300), 0, 0) for _ in range(count)]
+            for _ in range(BALL_COUNT):
+                ball = BallBreakerProjectile(rng.randint(200, 600), rng.randint(300, 700),
+                                             rng.randint(0, 800), rng.randint(0, 1000))
+                ball.spawn_grace = 0
+                projectiles.insert(rng.randint(0, len(projectiles)), ball)
+
+            def run():
+                for _ in range(MANAGER_FRAMES):
+                    update_enemy_projectiles(projectiles, PLAYER_POSITION)
+            return run
+        benchmark(f"manage_enemy_projectiles/balles+{count}", ops=MANAGER_FRAMES)(balls)
+
+
+# === Collisions ===
+
+def busy_world(seed=0):
+    """World à deux joueurs avec une scène chargée : ennemis, tirs, tirs ennemis, explosions."""
+    from entities.enemy import BasicEnemy
+    from entities.projectiles import Projectile, EnemyProjectile, HomingProjectile, GravityProjectile
+    from systems.world import World
+
+    rng = random.Random(seed)
+    world = World(num_players=2, seed=seed, headless=True, combo_enabled=False)
+    for player in world.players:
+        player.hp = 10 ** 6
+    for _ in range(80):
+        enemy = BasicEnemy(rng.randint(20, 780), rng.randint(0, 700))
+        enemy.hp = 10 ** 6
+        world.level.add_enemy(enemy)
+    world.projectiles = [Projectile(rng.randint(0, 800), rng.randint(0, 1000)) for _ in range(400)]
+    world.enemy_projectiles = [
+        rng.choice((HomingProjectile, lambda x, y: GravityProjectile(x, y, rng.uniform(-1, 1), -1)))(
+            rng.randint(0, 800), rng.randint(0, 1000))
+        for _ in range(300)
+    ]
+    for _ in range(1000):
+        world.bullet_pool.spawn(EnemyProjectile, rng.randint(0, 800), rng.randint(0, 1000),
+                                rng.uniform(-1, 1), 1)
+    for _ in range(30):
+        world._explode(rng.randint(0, 800), rng.randint(0, 1000))
+    return world
+
+
+COLLISION_PASSES = (
+    ("tirs_joueur", "_check_projectile_collisions"),
+    ("tirs_ennemis", "_check_enemy_projectile_collisions"),
+    ("ennemis", "_check_enemy_collisions"),
+    ("laser", "_check_laser_collision"),
+)
+
+
+def _register_collisions():
+    from systems.spatial_hash import SpatialHash
+
+    def grid():
+        world = busy_world()
+        enemies = world.level.enemies
+
+        def run():
+            SpatialHash.from_objects(e for e in enemies if e.alive)
+        return run
+    benchmark("collisions/grille", repeat=15)(grid)
+
+    for name, method in COLLISION_PASSES:
+        def collide(method=method):
+            world = busy_world()
+            world.enemy_grid = SpatialHash.from_objects(e for e in world.level.enemies if e.alive)
+            return getattr(world, method)
+        benchmark(f"collisions/{name}", repeat=15)(collide)
+
+
+# === Rendu ===
+
+def _register_explosions():
+    from graphics.effects import Explosion
+    from systems.sim_clock import SimClock
+
+    def draw():
+        rng = random.Random(0)
+        clock = SimClock()
+        surface = pygame.Surface((800, 1000))
+        explosions = [Explosion(rng.randint(0, 800), rng.randint(0, 1000), 300, clock)
+                      for _ in range(EXPLOSION_COUNT)]
+        # Milieu de vie : anneaux, flash et particules visibles
+        clock.advance(6)
+        for explosion in explosions:
+            explosion.update()
+
+        def run():
+            for _ in range(DRAW_FRAMES):
+                for explosion in explosions:
+                    explosion.draw(surface)
+        return run
+    benchmark("rendu/Explosion.draw", ops=EXPLOSION_COUNT * DRAW_FRAMES)(draw)
+
+
+_backgrounds = {}
+
+
+def _register_backgrounds():
+    from graphics import background
+
+    classes = [cls for cls in vars(background).values()
+               if isinstance(cls, type) and cls.__module__ == background.__name__ and "draw" in vars(cls)]
+    for cls in classes:
+        def draw(cls=cls):
+            # Construction coûteuse (textures pré-calculées) : une seule fois par session
+            bg = _backgrounds.get(cls)
+            if bg is None:
+                bg = _backgrounds[cls] = cls()
+            surface = pygame.Surface((800, 1000))
+
+            def run():
+                # update compris, pour que l'animation avance d'une image à l'autre
+                for _ in range(DRAW_FRAMES):
+                    bg.update()
+                    bg.draw(surface)
+            return run
+        benchmark(f"rendu/fond/{cls.__name__}.draw", ops=DRAW_FRAMES)(draw)
+
+
+SPRITE_METHOD = re.compile(r"^_?create_\w*sprite$")
+_bosses = {}
+
+
+def _register_boss_sprites():
+    from entities import bosses
+
+    for cls in vars(bosses).values():
+        if not isinstance(cls, type):
+            continue
+        for attr, method in vars(cls).items():
+            if not (callable(method) and SPRITE_METHOD.match(attr)):
+                continue
+            required = [p for p in list(inspect.signature(method).parameters.values())[1:]
+                        if p.default is inspect.Parameter.empty]
+            if required:
+                continue
+
+            def regenerate(cls=cls, attr=attr):
+                boss = _bosses.get(cls)
+                if boss is None:
+                    boss = _bosses[cls] = cls(400, 150)
+                create = getattr(boss, attr)
+
+                def run():
+                    for _ in range(SPRITE_CALLS):
+                        create()
+                return run
+            benchmark(f"sprites/{cls.__name__}.{attr}", ops=SPRITE_CALLS)(regenerate)
+
+
+# === Réseau ===
+
+def state_lobby(seed=0):
+    """Lobby de serveur en partie sur la scène chargée de busy_world."""
+    from network.server import GameLobby, GameServer, ServerPlayer
+
+    world = busy_world(seed)
+    lobby = GameLobby(lobby_id="bench", name="bench", host_id=1, world=world, game_started=True)
+    for i, player in enumerate(world.players, start=1):
+        lobby.players[i] = ServerPlayer(player_id=i, name=f"Joueur{i}", websocket=None, player=player)
+    return GameServer(), lobby
+
+
+def _register_state():
+    from network.protocol import Message
+
+    def serialize():
+        server, lobby = state_lobby()
+
+        def run():
+            for _ in range(STATE_MESSAGES):
+                server._state_message(lobby).to_bytes()
+        return run
+    benchmark("reseau/STATE.serialisation", ops=STATE_MESSAGES)(serialize)
+
+    def parse():
+        server, lobby = state_lobby()
+        payload = server._state_message(lobby).to_bytes()
+
+        def run():
+            for _ in range(STATE_MESSAGES):
+                Message.from_bytes(payload)
+        return run
+    benchmark("reseau/STATE.decodage", ops=STATE_MESSAGES)(parse)
+
+
+def register_all():
+    _register_projectiles()
+    _register_manager()
+    _register_collisions()
+    _register_explosions()
+    _register_backgrounds()
+    _register_boss_sprites()
+    _register_state()
+
+
+def print_comparison(rows, threshold):
+    print(f"{'cas':<48} {'référence':>12} {'actuel':>12} {'écart':>8}")
+    for name, before, after, ratio, status in rows:
+        print(f"{name:<48} {before:>10.2f}µs {after:>10.2f}µs {(ratio - 1) * 100:>+7.1f}% {status}")
+    regressions = [row for row in rows if row[4] == "régression"]
+    print(f"\n{len(rows)} cas comparés, {len(regressions)} régression(s) au-delà de {threshold:.0%}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="Mesurer les cas")
+    run_parser.add_argument("-k", dest="patterns", action="append", help="Filtre sur le nom (regex, répétable)")
+    run_parser.add_argument("-o", "--output", help="Fichier JSON de résultats")
+    run_parser.add_argument("--save-baseline", action="store_true", help=f"Enregistrer comme référence ({BASELINE_PATH})")
+    run_parser.add_argument("--repeat", type=int, default=harness.DEFAULT_REPEAT)
+
+    compare_parser = sub.add_parser("compare", help="Comparer des résultats à une référence")
+    compare_parser.add_argument("baseline", nargs="?", default=BASELINE_PATH)
+    compare_parser.add_argument("current", nargs="?", help="Résultats à comparer (par défaut : mesure maintenant)")
+    compare_parser.add_argument("-k", dest="patterns", action="append", help="Filtre sur le nom (regex, répétable)")
+    compare_parser.add_argument("--threshold", type=float, default=harness.DEFAULT_THRESHOLD)
+    compare_parser.add_argument("--repeat", type=int, default=harness.DEFAULT_REPEAT)
+
+    sub.add_parser("list", help="Lister les cas")
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    register_all()
+
+    if args.command == "list":
+        for name in harness.BENCHMARKS:
+            print(name)
+        return
+
+    # Les logs du jeu (spawns, boss...) ne doivent pas polluer les mesures
+    stdout = sys.stdout
+
+    def measure(patterns, repeat):
+        with quiet():
+            return harness.run(patterns, repeat, report=lambda line: print(line, file=stdout))
+
+    if args.command == "run":
+        document = measure(args.patterns, args.repeat)
+        if args.output:
+            harness.save(document, args.output)
+        if args.save_baseline:
+            os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+            harness.save(document, BASELINE_PATH)
+            print(f"Référence enregistrée : {BASELINE_PATH}")
+        return
+
+    baseline = harness.load(args.baseline)
+    if args.current:
+        current = harness.load(args.current)
+    else:
+        current = measure(args.patterns, args.repeat)
+        print()
+    regressions = print_comparison(harness.compare(baseline, current, args.threshold), args.threshold)
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
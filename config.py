@@ -4,6 +4,11 @@ import pygame
 SCREEN_WIDTH, SCREEN_HEIGHT = 800, 1000
 FPS = 60
 
+# Boucle à pas fixe : la simulation tourne à FPS, l'affichage jusqu'à MAX_RENDER_FPS
+MAX_RENDER_FPS = 240
+# Pas de simulation rattrapés au plus par image (au-delà, le retard est abandonné)
+MAX_CATCH_UP_STEPS = 5
+
 # Taille minimale de la fenêtre
 MIN_WINDOW_WIDTH = 400
 MIN_WINDOW_HEIGHT = 500
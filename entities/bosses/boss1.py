@@ -1,5 +1,4 @@
 import pygame
-import random
 import math
 
 from config import SCREEN_WIDTH, BLACK
@@ -84,8 +83,8 @@ class Boss(Enemy):
             explosion_interval = max(3, int(15 * (1 - progress * 0.7)))
             if self.death_explosion_timer >= explosion_interval:
                 self.death_explosion_timer = 0
-                rand_x = self.rect.left + random.randint(10, 90)
-                rand_y = self.rect.top + random.randint(10, 90)
+                rand_x = self.rect.left + self.rng.randint(10, 90)
+                rand_y = self.rect.top + self.rng.randint(10, 90)
                 self.death_explosions.append(Explosion(rand_x, rand_y, duration=400))
 
             for exp in self.death_explosions:
@@ -193,7 +192,7 @@ class Boss(Enemy):
         by = self.rect.top + 72
 
         if pattern_index == 0:
-            projectiles.append(self._create_aimed_projectile(player_position))
+            self._fire_aimed(projectiles, player_position)
             print("Boss: Tir direct!")
 
         elif pattern_index == 1:
@@ -202,7 +201,7 @@ class Boss(Enemy):
                 angle_rad = math.radians(angle_deg)
                 dx = math.sin(angle_rad)
                 dy = math.cos(angle_rad)
-                projectiles.append(BossProjectile(bx, by, dx, dy, speed=6))
+                self.fire_projectile(projectiles, BossProjectile, bx, by, dx, dy, speed=6)
             print("Boss: Tir en eventail!")
 
         elif pattern_index == 2:
@@ -211,20 +210,19 @@ class Boss(Enemy):
                 angle = (2 * math.pi / num_projectiles) * i
                 dx = math.cos(angle)
                 dy = math.sin(angle)
-                projectiles.append(BossProjectile(bx, by, dx, dy, speed=5))
+                self.fire_projectile(projectiles, BossProjectile, bx, by, dx, dy, speed=5)
             print("Boss: Tir circulaire!")
 
         elif pattern_index == 3:
             offsets = [(-20, 0), (0, 0), (20, 0)]
             for offset_x, offset_y in offsets:
-                proj = self._create_aimed_projectile(player_position, offset_x, offset_y)
-                projectiles.append(proj)
+                self._fire_aimed(projectiles, player_position, offset_x, offset_y)
             print("Boss: Triple tir!")
 
         return projectiles
 
-    def _create_aimed_projectile(self, player_position, offset_x=0, offset_y=0):
-        """Cree un projectile visant le joueur"""
+    def _fire_aimed(self, projectiles, player_position, offset_x=0, offset_y=0):
+        """Tire un projectile visant le joueur"""
         bx = self.rect.left + 51 + offset_x
         by = self.rect.top + 72 + offset_y
         px, py = player_position
@@ -235,7 +233,7 @@ class Boss(Enemy):
             dist = 1
         dx /= dist
         dy /= dist
-        return BossProjectile(bx, by, dx, dy, speed=7)
+        self.fire_projectile(projectiles, BossProjectile, bx, by, dx, dy, speed=7)
 
     def take_damage(self, amount=1):
         """Applique des degats au boss et declenche l'animation"""
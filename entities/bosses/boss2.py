@@ -1,5 +1,4 @@
 import pygame
-import random
 import math
 
 from config import SCREEN_WIDTH, WHITE
@@ -159,8 +158,8 @@ class Boss2(Enemy):
             explosion_interval = max(2, int(12 * (1 - progress * 0.8)))
             if self.death_explosion_timer >= explosion_interval:
                 self.death_explosion_timer = 0
-                rand_x = self.rect.left + random.randint(10, self.size - 10)
-                rand_y = self.rect.top + random.randint(10, self.size - 10)
+                rand_x = self.rect.left + self.rng.randint(10, self.size - 10)
+                rand_y = self.rect.top + self.rng.randint(10, self.size - 10)
                 self.death_explosions.append(Explosion(rand_x, rand_y, duration=400))
 
             for exp in self.death_explosions:
@@ -230,7 +229,7 @@ class Boss2(Enemy):
                 angle = math.radians(self.spiral_angle + i * 120)
                 dx = math.cos(angle)
                 dy = math.sin(angle)
-                projectiles.append(Boss2Projectile(bx, by, dx, dy, speed=5))
+                self.fire_projectile(projectiles, Boss2Projectile, bx, by, dx, dy, speed=5)
             print("Boss 2: Tir spiral!")
 
         elif pattern_index == 1:
@@ -241,7 +240,7 @@ class Boss2(Enemy):
                 angle_rad = math.radians(angle_deg)
                 dx = math.sin(angle_rad)
                 dy = math.cos(angle_rad)  # cos pour que l'angle 0 soit vers le bas
-                projectiles.append(Boss2Projectile(bx, by, dx, dy, speed=6))
+                self.fire_projectile(projectiles, Boss2Projectile, bx, by, dx, dy, speed=6)
             print("Boss 2: Pluie de feu en V!")
 
         elif pattern_index == 2:
@@ -249,12 +248,12 @@ class Boss2(Enemy):
                 angle_rad = math.radians(angle_deg)
                 dx = math.sin(angle_rad)
                 dy = math.cos(angle_rad)
-                projectiles.append(Boss2Projectile(bx - 30, by, dx, dy, speed=6))
+                self.fire_projectile(projectiles, Boss2Projectile, bx - 30, by, dx, dy, speed=6)
             for angle_deg in [20, 40, 60]:
                 angle_rad = math.radians(angle_deg)
                 dx = math.sin(angle_rad)
                 dy = math.cos(angle_rad)
-                projectiles.append(Boss2Projectile(bx + 30, by, dx, dy, speed=6))
+                self.fire_projectile(projectiles, Boss2Projectile, bx + 30, by, dx, dy, speed=6)
             print("Boss 2: Double vague!")
 
         elif pattern_index == 3:
@@ -263,7 +262,7 @@ class Boss2(Enemy):
                 angle = math.radians(cross_angle + i * 90)
                 dx = math.cos(angle)
                 dy = math.sin(angle)
-                projectiles.append(Boss2Projectile(bx, by, dx, dy, speed=6))
+                self.fire_projectile(projectiles, Boss2Projectile, bx, by, dx, dy, speed=6)
             print("Boss 2: Croix rotative!")
 
         elif pattern_index == 4:
@@ -274,12 +273,12 @@ class Boss2(Enemy):
             if dist > 0:
                 dx /= dist
                 dy /= dist
-            projectiles.append(Boss2Projectile(bx, by, dx, dy, speed=9))
+            self.fire_projectile(projectiles, Boss2Projectile, bx, by, dx, dy, speed=9)
             for offset in [-10, 10]:
                 angle = math.atan2(dy, dx) + math.radians(offset)
                 ndx = math.cos(angle)
                 ndy = math.sin(angle)
-                projectiles.append(Boss2Projectile(bx, by, ndx, ndy, speed=8))
+                self.fire_projectile(projectiles, Boss2Projectile, bx, by, ndx, ndy, speed=8)
             print("Boss 2: Rafale ciblee!")
 
         return projectiles
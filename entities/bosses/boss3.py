@@ -1,5 +1,4 @@
 import pygame
-import random
 import math
 
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE
@@ -111,8 +110,8 @@ class Boss3(Enemy):
             explosion_interval = max(1, int(10 * (1 - progress * 0.9)))
             if self.death_explosion_timer >= explosion_interval:
                 self.death_explosion_timer = 0
-                rand_x = self.rect.left + random.randint(5, self.size - 5)
-                rand_y = self.rect.top + random.randint(5, self.size - 5)
+                rand_x = self.rect.left + self.rng.randint(5, self.size - 5)
+                rand_y = self.rect.top + self.rng.randint(5, self.size - 5)
                 self.death_explosions.append(Explosion(rand_x, rand_y, duration=500))
 
             for exp in self.death_explosions:
@@ -181,7 +180,7 @@ class Boss3(Enemy):
                 angle = math.radians(self.wave_angle + i * 20)
                 dy = 1
                 dx = math.sin(angle) * 0.3
-                projectiles.append(Boss3Projectile(bx + offset, by, dx, dy, speed=6))
+                self.fire_projectile(projectiles, Boss3Projectile, bx + offset, by, dx, dy, speed=6)
             print("Boss 3: Vague sinusoidale!")
 
         elif pattern_index == 1:
@@ -189,12 +188,12 @@ class Boss3(Enemy):
                 angle_rad = math.radians(angle_deg)
                 dx = math.sin(angle_rad)
                 dy = math.cos(angle_rad)
-                projectiles.append(Boss3Projectile(bx, by, dx, dy, speed=7))
+                self.fire_projectile(projectiles, Boss3Projectile, bx, by, dx, dy, speed=7)
             for angle_deg in [-45, -22, 0, 22, 45]:
                 angle_rad = math.radians(angle_deg)
                 dx = math.sin(angle_rad)
                 dy = math.cos(angle_rad)
-                projectiles.append(Boss3Projectile(bx, by - 30, dx, dy, speed=5))
+                self.fire_projectile(projectiles, Boss3Projectile, bx, by - 30, dx, dy, speed=5)
             print("Boss 3: Tir en X!")
 
         elif pattern_index == 2:
@@ -203,11 +202,12 @@ class Boss3(Enemy):
             print("Boss 3: Missiles guides!")
 
         elif pattern_index == 3:
-            hole_position = random.randint(1, 5)
+            hole_position = self.rng.randint(1, 5)
             for i in range(7):
                 if i != hole_position and i != hole_position - 1:
                     offset_x = (i - 3) * 60
-                    projectiles.append(Boss3Projectile(bx + offset_x, by, 0, 1, speed=5))
+                    self.fire_projectile(projectiles, Boss3Projectile,
+                                         bx + offset_x, by, 0, 1, speed=5)
             print("Boss 3: Mur avec trou!")
 
         elif pattern_index == 4:
@@ -216,7 +216,7 @@ class Boss3(Enemy):
                 angle = (2 * math.pi / num_projectiles) * i
                 dx = math.cos(angle)
                 dy = math.sin(angle)
-                projectiles.append(Boss3Projectile(bx, by, dx, dy, speed=4))
+                self.fire_projectile(projectiles, Boss3Projectile, bx, by, dx, dy, speed=4)
             print("Boss 3: Explosion radiale!")
 
         elif pattern_index == 5:
@@ -1,4 +1,3 @@
-import random
 import math
 
 from config import SCREEN_WIDTH
@@ -115,8 +114,8 @@ class Boss4(Enemy):
             explosion_interval = max(1, int(8 * (1 - progress * 0.95)))
             if self.death_explosion_timer >= explosion_interval:
                 self.death_explosion_timer = 0
-                rand_x = self.rect.left + random.randint(0, self.size)
-                rand_y = self.rect.top + random.randint(0, self.size)
+                rand_x = self.rect.left + self.rng.randint(0, self.size)
+                rand_y = self.rect.top + self.rng.randint(0, self.size)
                 self.death_explosions.append(Explosion(rand_x, rand_y, duration=600))
 
             for exp in self.death_explosions:
@@ -152,7 +151,7 @@ class Boss4(Enemy):
             if self.swoop_phase == 0:
                 # Phase d'annonce : tremblement
                 if self.charge_timer <= self.charge_warning_duration:
-                    shake = random.randint(-3, 3)
+                    shake = self.rng.randint(-3, 3)
                     self.rect.x += shake
                 else:
                     # Passer au centrage fluide
@@ -208,7 +207,8 @@ class Boss4(Enemy):
                             a = math.radians(i * 45)
                             dx = math.cos(a)
                             dy = math.sin(a)
-                            enemy_projectiles.append(Boss4Projectile(bx, by, dx, dy, speed=5))
+                            self.fire_projectile(enemy_projectiles, Boss4Projectile,
+                                                 bx, by, dx, dy, speed=5)
                         self.swoop_shots_fired += 1
                         print(f"Boss 4: Swoop burst {self.swoop_shots_fired}!")
                 # Fin du swoop après un tour complet
@@ -315,7 +315,7 @@ class Boss4(Enemy):
                         self.branch_stretch_cycle = 0
                         self.branch_stretch_rotation = 0
                         self.branch_stretch_factor = 1
-                        self.branch_stretch_direction = random.choice([-1, 1])
+                        self.branch_stretch_direction = self.rng.choice([-1, 1])
                         self.branch_stretch_consecutive = 1
                 return False
 
@@ -363,7 +363,7 @@ class Boss4(Enemy):
                                 new_dir = -self.branch_stretch_direction
                                 self.branch_stretch_consecutive = 1
                             else:
-                                new_dir = random.choice([-1, 1])
+                                new_dir = self.rng.choice([-1, 1])
                                 if new_dir == self.branch_stretch_direction:
                                     self.branch_stretch_consecutive += 1
                                 else:
@@ -401,7 +401,7 @@ class Boss4(Enemy):
                 angle = math.radians(self.vortex_angle + i * 90)
                 dx = math.cos(angle)
                 dy = math.sin(angle)
-                projectiles.append(Boss4Projectile(bx, by, dx, dy, speed=4))
+                self.fire_projectile(projectiles, Boss4Projectile, bx, by, dx, dy, speed=4)
             print("Boss 4: Vortex!")
 
         elif pattern_index == 1:
@@ -409,7 +409,8 @@ class Boss4(Enemy):
                 angle_rad = math.radians(angle_deg)
                 dx = math.sin(angle_rad)
                 dy = math.cos(angle_rad)
-                projectiles.append(BouncingProjectile(bx, by, dx, dy, speed=6, bounces=2))
+                self.fire_projectile(projectiles, BouncingProjectile,
+                                     bx, by, dx, dy, speed=6, bounces=2)
             print("Boss 4: Tirs rebondissants!")
 
         elif pattern_index == 2:
@@ -429,7 +430,8 @@ class Boss4(Enemy):
                 delay_factor = abs(i - 4) * 0.1
                 dy = 1
                 dx = delay_factor * (1 if i > 4 else -1)
-                projectiles.append(Boss4Projectile(bx + offset_x, by, dx, dy, speed=7))
+                self.fire_projectile(projectiles, Boss4Projectile,
+                                     bx + offset_x, by, dx, dy, speed=7)
             print("Boss 4: Pluie solaire!")
 
         elif pattern_index == 4:
@@ -441,7 +443,7 @@ class Boss4(Enemy):
                     dx = math.cos(angle)
                     dy = math.sin(angle)
                     speed = 4 if ring == 0 else 6
-                    projectiles.append(Boss4Projectile(bx, by, dx, dy, speed=speed))
+                    self.fire_projectile(projectiles, Boss4Projectile, bx, by, dx, dy, speed=speed)
             print("Boss 4: Double anneau!")
 
         elif pattern_index == 5:
@@ -449,11 +451,11 @@ class Boss4(Enemy):
                 angle = math.radians(72 * i - 90 + self.timer % 72)
                 dx = math.cos(angle)
                 dy = math.sin(angle)
-                projectiles.append(Boss4Projectile(bx, by, dx, dy, speed=8))
+                self.fire_projectile(projectiles, Boss4Projectile, bx, by, dx, dy, speed=8)
                 angle2 = angle + math.radians(36)
                 dx2 = math.cos(angle2)
                 dy2 = math.sin(angle2)
-                projectiles.append(Boss4Projectile(bx, by, dx2, dy2, speed=5))
+                self.fire_projectile(projectiles, Boss4Projectile, bx, by, dx2, dy2, speed=5)
             print("Boss 4: Etoile filante!")
 
         elif pattern_index == 6:
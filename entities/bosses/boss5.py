@@ -1,5 +1,4 @@
 import pygame
-import random
 import math
 
 from config import SCREEN_WIDTH, WHITE
@@ -185,8 +184,8 @@ class Boss5(Enemy):
             explosion_interval = max(1, int(6 * (1 - progress * 0.98)))
             if self.death_explosion_timer >= explosion_interval:
                 self.death_explosion_timer = 0
-                rand_x = self.rect.left + random.randint(-20, self.size + 20)
-                rand_y = self.rect.top + random.randint(-20, self.size + 20)
+                rand_x = self.rect.left + self.rng.randint(-20, self.size + 20)
+                rand_y = self.rect.top + self.rng.randint(-20, self.size + 20)
                 self.death_explosions.append(Explosion(rand_x, rand_y, duration=700))
 
             for exp in self.death_explosions:
@@ -246,8 +245,8 @@ class Boss5(Enemy):
                 self.teleport_timer = 0
                 self.last_teleport = self.timer
                 self.teleport_target = (
-                    random.randint(150, SCREEN_WIDTH - 150),
-                    random.randint(80, 200)
+                    self.rng.randint(150, SCREEN_WIDTH - 150),
+                    self.rng.randint(80, 200)
                 )
                 print("Boss 5: Teleportation!")
 
@@ -278,7 +277,7 @@ class Boss5(Enemy):
                 angle_rad = math.radians(angle_deg)
                 dx = math.sin(angle_rad)
                 dy = math.cos(angle_rad) * 0.3
-                projectiles.append(GravityProjectile(bx, by, dx, dy, speed=6))
+                self.fire_projectile(projectiles, GravityProjectile, bx, by, dx, dy, speed=6)
             print("Boss 5: Tirs paraboliques!")
 
         elif pattern_index == 2:
@@ -302,15 +301,16 @@ class Boss5(Enemy):
                 dy1 = math.sin(angle1)
                 dx2 = math.cos(angle2)
                 dy2 = math.sin(angle2)
-                projectiles.append(Boss5Projectile(bx, by, dx1, dy1, speed=4))
-                projectiles.append(Boss5Projectile(bx, by, dx2, dy2, speed=4))
+                self.fire_projectile(projectiles, Boss5Projectile, bx, by, dx1, dy1, speed=4)
+                self.fire_projectile(projectiles, Boss5Projectile, bx, by, dx2, dy2, speed=4)
             print("Boss 5: Double spirale!")
 
         elif pattern_index == 4:
             for i in range(11):
                 offset_x = (i - 5) * 40
                 wave_offset = math.sin(i * 0.5 + self.timer * 0.1) * 0.3
-                projectiles.append(Boss5Projectile(bx + offset_x, by, wave_offset, 1, speed=6))
+                self.fire_projectile(projectiles, Boss5Projectile,
+                                     bx + offset_x, by, wave_offset, 1, speed=6)
             print("Boss 5: Mur ondulant!")
 
         elif pattern_index == 5:
@@ -327,23 +327,24 @@ class Boss5(Enemy):
             if dist > 0:
                 dx /= dist
                 dy /= dist
-            projectiles.append(Boss5Projectile(cx, cy + 60, dx, dy, speed=7))
+            self.fire_projectile(projectiles, Boss5Projectile, cx, cy + 60, dx, dy, speed=7)
 
         elif pattern_index == 6 and self.rage_mode:
             for i in range(16):
                 angle = (2 * math.pi / 16) * i + self.timer * 0.1
                 dx = math.cos(angle)
                 dy = math.sin(angle)
-                projectiles.append(Boss5Projectile(bx, by, dx, dy, speed=5))
+                self.fire_projectile(projectiles, Boss5Projectile, bx, by, dx, dy, speed=5)
             print("Boss 5: TEMPETE!")
 
         elif pattern_index == 7 and self.rage_mode:
             projectiles.append(ZigZagProjectile(bx, by, 1, speed=6, amplitude=60, frequency=0.1))
-            projectiles.append(GravityProjectile(bx - 50, by, -0.3, 0.2, speed=5))
-            projectiles.append(GravityProjectile(bx + 50, by, 0.3, 0.2, speed=5))
+            self.fire_projectile(projectiles, GravityProjectile, bx - 50, by, -0.3, 0.2, speed=5)
+            self.fire_projectile(projectiles, GravityProjectile, bx + 50, by, 0.3, 0.2, speed=5)
             for i in range(4):
                 angle = math.radians(self.timer * 5 + i * 90)
-                projectiles.append(Boss5Projectile(bx, by, math.cos(angle), math.sin(angle), speed=4))
+                self.fire_projectile(projectiles, Boss5Projectile,
+                                     bx, by, math.cos(angle), math.sin(angle), speed=4)
             print("Boss 5: CHAOS TOTAL!")
 
         return projectiles
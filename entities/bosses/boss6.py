@@ -1,5 +1,4 @@
 import pygame
-import random
 import math
 
 from config import SCREEN_WIDTH
@@ -115,7 +114,7 @@ class Boss6(Enemy):
         if self.pattern_timer >= self.pattern_duration:
             self.pattern_timer = 0
             if self.fury_mode:
-                self.pattern = random.randint(0, 8)
+                self.pattern = self.rng.randint(0, 8)
             else:
                 self.pattern = (self.pattern + 1) % 7
 
@@ -138,7 +137,7 @@ class Boss6(Enemy):
                 angle = (i / 2) * 2 * math.pi + self.timer * 0.08
                 spawn_x = cx + math.cos(angle) * 60
                 spawn_y = cy + math.sin(angle) * 60
-                proj = VortexProjectile(spawn_x, spawn_y, player_pos[0], player_pos[1])
+                proj = VortexProjectile(spawn_x, spawn_y, player_pos[0], player_pos[1], rng=self.rng)
                 projectiles_list.append(proj)
 
         elif self.pattern == 1:
@@ -160,8 +159,8 @@ class Boss6(Enemy):
                 spawn_y = cy + math.sin(angle + offset) * 100
                 dx = -math.cos(angle + offset)
                 dy = -math.sin(angle + offset) + 0.5
-                proj = Boss6Projectile(spawn_x, spawn_y, dx, dy, speed=3)
-                projectiles_list.append(proj)
+                self.fire_projectile(projectiles_list, Boss6Projectile,
+                                     spawn_x, spawn_y, dx, dy, speed=3)
 
         elif self.pattern == 4:
             if not self.black_hole_active and self.black_hole_cooldown == 0:
@@ -173,24 +172,23 @@ class Boss6(Enemy):
                 angle = (i / 6) * 2 * math.pi
                 dx = math.cos(angle)
                 dy = math.sin(angle)
-                proj = Boss6Projectile(cx, cy, dx, dy, speed=4)
-                projectiles_list.append(proj)
+                self.fire_projectile(projectiles_list, Boss6Projectile, cx, cy, dx, dy, speed=4)
 
         elif self.pattern == 5:
             if self.shoot_count % 2 == 0:
                 for i in range(12):
                     x = (i / 11) * SCREEN_WIDTH
                     wave_offset = math.sin(i * 0.5 + self.timer * 0.1) * 30
-                    proj = Boss6Projectile(x, cy + 50 + wave_offset, 0, 1, speed=3)
-                    projectiles_list.append(proj)
+                    self.fire_projectile(projectiles_list, Boss6Projectile,
+                                         x, cy + 50 + wave_offset, 0, 1, speed=3)
 
         elif self.pattern == 6:
             side = 1 if self.shoot_count % 2 == 0 else -1
             start_x = cx + side * 80
             dx = -side * 0.3
             dy = 1
-            proj = Boss6Projectile(start_x, cy + 30, dx, dy, speed=5)
-            projectiles_list.append(proj)
+            self.fire_projectile(projectiles_list, Boss6Projectile,
+                                 start_x, cy + 30, dx, dy, speed=5)
 
         if self.fury_mode:
             if self.pattern == 7:
@@ -200,7 +198,7 @@ class Boss6(Enemy):
                         spawn_x = cx + side * 60 + math.cos(angle) * 40
                         spawn_y = cy + math.sin(angle) * 40
                         proj = VortexProjectile(spawn_x, spawn_y,
-                                               player_pos[0], player_pos[1])
+                                               player_pos[0], player_pos[1], rng=self.rng)
                         projectiles_list.append(proj)
 
             elif self.pattern == 8:
@@ -210,15 +208,14 @@ class Boss6(Enemy):
                 for offset in [0, math.pi/2, math.pi, 3*math.pi/2]:
                     dx = math.cos(angle + offset)
                     dy = math.sin(angle + offset) * 0.5 + 0.5
-                    proj = Boss6Projectile(cx, cy, dx, dy, speed=4)
-                    projectiles_list.append(proj)
+                    self.fire_projectile(projectiles_list, Boss6Projectile, cx, cy, dx, dy, speed=4)
 
     def update_death(self):
         self.death_timer += 1
 
         if self.death_timer % 6 == 0:
-            offset_x = random.randint(-self.size//2, self.size//2)
-            offset_y = random.randint(-self.size//2, self.size//2)
+            offset_x = self.rng.randint(-self.size//2, self.size//2)
+            offset_y = self.rng.randint(-self.size//2, self.size//2)
             exp = Explosion(self.rect.centerx + offset_x,
                           self.rect.centery + offset_y,
                           duration=600)
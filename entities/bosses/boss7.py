@@ -1,5 +1,4 @@
 import pygame
-import random
 import math
 
 from config import SCREEN_WIDTH
@@ -262,8 +261,8 @@ class Boss7(Enemy):
         self.death_timer += 1
 
         if self.death_timer % 8 == 0:
-            offset_x = random.randint(-self.size//2, self.size//2)
-            offset_y = random.randint(-self.size//2, self.size//2)
+            offset_x = self.rng.randint(-self.size//2, self.size//2)
+            offset_y = self.rng.randint(-self.size//2, self.size//2)
             exp = Explosion(self.rect.centerx + offset_x,
                           self.rect.centery + offset_y,
                           duration=600)
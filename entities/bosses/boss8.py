@@ -1,5 +1,4 @@
 import pygame
-import random
 import math
 
 from config import SCREEN_WIDTH, WHITE
@@ -42,9 +41,9 @@ class Boss8(Enemy):
             angle = (2 * math.pi / self.num_fragments) * i
             self.orbital_fragments.append({
                 'angle': angle,
-                'radius': self.fragment_orbit_radius + random.randint(-10, 10),
-                'size': random.randint(8, 14),
-                'color_offset': random.uniform(0, 2 * math.pi),
+                'radius': self.fragment_orbit_radius + self.rng.randint(-10, 10),
+                'size': self.rng.randint(8, 14),
+                'color_offset': self.rng.uniform(0, 2 * math.pi),
                 'active': True
             })
 
@@ -93,14 +92,14 @@ class Boss8(Enemy):
         """Génère les lignes de fissure pour le mode brisé"""
         center = self.size // 2
         for _ in range(12):
-            angle = random.uniform(0, 2 * math.pi)
-            length = random.randint(30, 70)
-            start_dist = random.randint(10, 30)
+            angle = self.rng.uniform(0, 2 * math.pi)
+            length = self.rng.randint(30, 70)
+            start_dist = self.rng.randint(10, 30)
             self.crack_lines.append({
                 'angle': angle,
                 'start': start_dist,
                 'length': length,
-                'offset': random.uniform(0, math.pi)
+                'offset': self.rng.uniform(0, math.pi)
             })
 
     def _get_rainbow_color(self, offset=0):
@@ -320,8 +319,8 @@ class Boss8(Enemy):
             explosion_interval = max(1, int(5 * (1 - progress * 0.98)))
             if self.death_explosion_timer >= explosion_interval:
                 self.death_explosion_timer = 0
-                rand_x = self.rect.left + random.randint(-30, self.size + 30)
-                rand_y = self.rect.top + random.randint(-30, self.size + 30)
+                rand_x = self.rect.left + self.rng.randint(-30, self.size + 30)
+                rand_y = self.rect.top + self.rng.randint(-30, self.size + 30)
                 self.death_explosions.append(Explosion(rand_x, rand_y, duration=800))
 
             for exp in self.death_explosions:
@@ -370,7 +369,7 @@ class Boss8(Enemy):
 
             # Activation du bouclier
             if not self.shield_active and self.shield_cooldown == 0 and self.hp <= self.max_hp * 0.5:
-                if random.random() < 0.002:  # Faible chance par frame
+                if self.rng.random() < 0.002:  # Faible chance par frame
                     self.shield_active = True
                     self.shield_timer = 0
                     print("Boss 8: Bouclier cristallin activé!")
@@ -401,7 +400,7 @@ class Boss8(Enemy):
                 dx = math.sin(angle_rad)
                 dy = math.cos(angle_rad)
                 dist = math.sqrt(dx**2 + dy**2)
-                projectiles.append(CrystalShardProjectile(bx, by, dx / dist, dy / dist, speed=5))
+                projectiles.append(CrystalShardProjectile(bx, by, dx / dist, dy / dist, speed=5, rng=self.rng))
             print("Boss 8: Pendule cristallin!")
 
         elif pattern_index == 1:
@@ -410,7 +409,7 @@ class Boss8(Enemy):
                 angle_rad = math.radians(angle_deg)
                 dx = math.sin(angle_rad)
                 dy = math.cos(angle_rad)
-                projectiles.append(PrismBeamProjectile(bx, by, dx, dy, speed=6))
+                projectiles.append(PrismBeamProjectile(bx, by, dx, dy, speed=6, rng=self.rng))
             print("Boss 8: Rayons prismatiques!")
 
         elif pattern_index == 2:
@@ -440,9 +439,9 @@ class Boss8(Enemy):
             # Tenailles prismatiques : deux bras qui convergent depuis les côtés, à double vitesse
             for speed in [4, 6]:
                 # Bras gauche : part de la gauche, s'oriente vers le centre-bas
-                projectiles.append(CrystalShardProjectile(bx - 130, by, 0.5, 0.87, speed=speed))
+                projectiles.append(CrystalShardProjectile(bx - 130, by, 0.5, 0.87, speed=speed, rng=self.rng))
                 # Bras droit : part de la droite, s'oriente vers le centre-bas
-                projectiles.append(CrystalShardProjectile(bx + 130, by, -0.5, 0.87, speed=speed))
+                projectiles.append(CrystalShardProjectile(bx + 130, by, -0.5, 0.87, speed=speed, rng=self.rng))
             print("Boss 8: Tenailles prismatiques!")
 
         elif pattern_index == 5:
@@ -452,19 +451,19 @@ class Boss8(Enemy):
             # Sub 2 : spectre extérieur — deux rayons larges décoratifs (joueur souffle)
             sub = (self.timer // self.shoot_delay_frames) % 3
             if sub == 0:
-                projectiles.append(PrismBeamProjectile(bx, by, 0, 1, speed=7))
+                projectiles.append(PrismBeamProjectile(bx, by, 0, 1, speed=7, rng=self.rng))
             elif sub == 1:
                 for angle_deg in [-20, 20]:
                     angle_rad = math.radians(angle_deg)
                     dx = math.sin(angle_rad)
                     dy = math.cos(angle_rad)
-                    projectiles.append(CrystalShardProjectile(bx, by, dx, dy, speed=5))
+                    projectiles.append(CrystalShardProjectile(bx, by, dx, dy, speed=5, rng=self.rng))
             else:
                 for angle_deg in [-50, 50]:
                     angle_rad = math.radians(angle_deg)
                     dx = math.sin(angle_rad)
                     dy = math.cos(angle_rad)
-                    projectiles.append(PrismBeamProjectile(bx, by, dx, dy, speed=4))
+                    projectiles.append(PrismBeamProjectile(bx, by, dx, dy, speed=4, rng=self.rng))
             print("Boss 8: Diffraction prismatique!")
 
         elif pattern_index == 6:
@@ -493,17 +492,17 @@ class Boss8(Enemy):
                 angle = (2 * math.pi / 16) * i + self.timer * 0.08
                 dx = math.cos(angle)
                 dy = math.sin(angle)
-                projectiles.append(CrystalShardProjectile(bx, by, dx, dy, speed=6))
+                projectiles.append(CrystalShardProjectile(bx, by, dx, dy, speed=6, rng=self.rng))
             print("Boss 8: EXPLOSION CRISTALLINE!")
 
         elif pattern_index == 8 and self.shattered_mode:
             # Chaos total - mélange de tous les types
-            projectiles.append(PrismBeamProjectile(bx, by, 0, 1, speed=7))
+            projectiles.append(PrismBeamProjectile(bx, by, 0, 1, speed=7, rng=self.rng))
             projectiles.append(ReflectingProjectile(bx - 60, by, 0.2, 1, speed=5, reflections=2))
             projectiles.append(ReflectingProjectile(bx + 60, by, -0.2, 1, speed=5, reflections=2))
             for i in range(6):
                 angle = math.radians(self.timer * 4 + i * 60)
-                projectiles.append(CrystalShardProjectile(bx, by, math.cos(angle), math.sin(angle), speed=5))
+                projectiles.append(CrystalShardProjectile(bx, by, math.cos(angle), math.sin(angle), speed=5, rng=self.rng))
             print("Boss 8: TEMPETE PRISMATIQUE!")
 
         return projectiles
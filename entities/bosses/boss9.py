@@ -1,5 +1,4 @@
 import pygame
-import random
 import math
 
 from config import SCREEN_WIDTH, WHITE
@@ -55,10 +54,10 @@ class Boss9(Enemy):
         for i in range(self.num_flames):
             self.spectral_flames.append({
                 'angle': (2 * math.pi / self.num_flames) * i,
-                'radius': 90 + random.randint(-10, 10),
-                'height': random.randint(20, 40),
-                'speed': random.uniform(0.02, 0.04),
-                'phase': random.uniform(0, 2 * math.pi)
+                'radius': 90 + self.rng.randint(-10, 10),
+                'height': self.rng.randint(20, 40),
+                'speed': self.rng.uniform(0.02, 0.04),
+                'phase': self.rng.uniform(0, 2 * math.pi)
             })
 
         # Plumes qui tombent periodiquement
@@ -360,8 +359,8 @@ class Boss9(Enemy):
 
             # Vibration du boss
             if self.rebirth_transition_timer % 4 < 2:
-                self.rect.x += random.randint(-3, 3)
-                self.rect.y += random.randint(-2, 2)
+                self.rect.x += self.rng.randint(-3, 3)
+                self.rect.y += self.rng.randint(-2, 2)
 
             if self.rebirth_transition_timer >= self.rebirth_transition_duration:
                 self.rebirth_transition = False
@@ -397,7 +396,7 @@ class Boss9(Enemy):
                 self.void_particles.remove(particle)
 
         # Spawn nouvelles particules
-        if len(self.void_particles) < self.max_particles and random.random() < 0.3:
+        if len(self.void_particles) < self.max_particles and self.rng.random() < 0.3:
             self._spawn_void_particle()
 
         # Update des flammes spectrales
@@ -426,8 +425,8 @@ class Boss9(Enemy):
             explosion_interval = max(1, int(4 * (1 - progress * 0.98)))
             if self.death_explosion_timer >= explosion_interval:
                 self.death_explosion_timer = 0
-                rand_x = self.rect.left + random.randint(-30, self.size + 30)
-                rand_y = self.rect.top + random.randint(-30, self.size + 30)
+                rand_x = self.rect.left + self.rng.randint(-30, self.size + 30)
+                rand_y = self.rect.top + self.rng.randint(-30, self.size + 30)
                 self.death_explosions.append(Explosion(rand_x, rand_y, duration=900))
 
             for exp in self.death_explosions:
@@ -481,29 +480,29 @@ class Boss9(Enemy):
 
     def _spawn_feather(self):
         """Fait apparaitre une plume qui tombe"""
-        side = random.choice([-1, 1])
+        side = self.rng.choice([-1, 1])
         feather = {
-            'x': self.rect.centerx + side * random.randint(30, 80),
+            'x': self.rect.centerx + side * self.rng.randint(30, 80),
             'y': self.rect.centery,
-            'speed': random.uniform(1, 3),
-            'angle': random.uniform(0, 2 * math.pi),
-            'rotation': random.uniform(-0.1, 0.1),
-            'size': random.randint(8, 15),
+            'speed': self.rng.uniform(1, 3),
+            'angle': self.rng.uniform(0, 2 * math.pi),
+            'rotation': self.rng.uniform(-0.1, 0.1),
+            'size': self.rng.randint(8, 15),
             'color': (150, 80, 200) if not self.rebirth_mode else (255, 150, 50)
         }
         self.falling_feathers.append(feather)
 
     def _spawn_void_particle(self):
         """Fait apparaitre une particule void"""
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(1, 3)
+        angle = self.rng.uniform(0, 2 * math.pi)
+        speed = self.rng.uniform(1, 3)
         particle = {
-            'x': self.rect.centerx + random.randint(-40, 40),
-            'y': self.rect.centery + random.randint(-40, 40),
+            'x': self.rect.centerx + self.rng.randint(-40, 40),
+            'y': self.rect.centery + self.rng.randint(-40, 40),
             'dx': math.cos(angle) * speed,
             'dy': math.sin(angle) * speed - 1,  # Monte legerement
-            'size': random.randint(3, 8),
-            'life': random.randint(30, 60),
+            'size': self.rng.randint(3, 8),
+            'life': self.rng.randint(30, 60),
             'color': (180, 100, 255) if not self.rebirth_mode else (255, 180, 80)
         }
         self.void_particles.append(particle)
@@ -519,7 +518,7 @@ class Boss9(Enemy):
             for i in range(9):
                 offset_x = (i - 4) * 40
                 angle_offset = math.sin(self.timer * 0.05 + i * 0.4) * 0.3
-                projectiles.append(VoidFeatherProjectile(bx + offset_x, by, angle_offset, 1, speed=5))
+                projectiles.append(VoidFeatherProjectile(bx + offset_x, by, angle_offset, 1, speed=5, rng=self.rng))
             print("Boss 9: Pluie de plumes!")
 
         elif pattern_index == 1:
@@ -528,7 +527,7 @@ class Boss9(Enemy):
                 angle_rad = math.radians(angle_deg)
                 dx = math.sin(angle_rad)
                 dy = math.cos(angle_rad)
-                projectiles.append(SoulFireProjectile(bx, by, dx, dy, speed=6))
+                projectiles.append(SoulFireProjectile(bx, by, dx, dy, speed=6, rng=self.rng))
             print("Boss 9: Flammes de l'ame!")
 
         elif pattern_index == 2:
@@ -567,7 +566,7 @@ class Boss9(Enemy):
                     angle = math.radians(90 + side * (20 + i * 15))
                     dx = math.cos(angle) * side
                     dy = math.sin(angle)
-                    projectiles.append(VoidFeatherProjectile(wing_x, by - 30, dx, abs(dy), speed=6))
+                    projectiles.append(VoidFeatherProjectile(wing_x, by - 30, dx, abs(dy), speed=6, rng=self.rng))
             print("Boss 9: Barrage d'ailes!")
 
         # Patterns du mode renaissance
@@ -577,7 +576,7 @@ class Boss9(Enemy):
                 angle = (2 * math.pi / 20) * i + self.timer * 0.05
                 dx = math.cos(angle)
                 dy = math.sin(angle)
-                projectiles.append(SoulFireProjectile(bx, by, dx, dy, speed=6))
+                projectiles.append(SoulFireProjectile(bx, by, dx, dy, speed=6, rng=self.rng))
             print("Boss 9: EXPLOSION DE RENAISSANCE!")
 
         elif pattern_index == 7 and self.rebirth_mode:
@@ -586,7 +585,7 @@ class Boss9(Enemy):
                 angle1 = math.radians(self.timer * 5 + i * 45)
                 angle2 = math.radians(-self.timer * 5 + i * 45 + 22.5)
                 projectiles.append(Boss9Projectile(bx, by, math.cos(angle1), math.sin(angle1), speed=5))
-                projectiles.append(SoulFireProjectile(bx, by, math.cos(angle2), math.sin(angle2), speed=5))
+                projectiles.append(SoulFireProjectile(bx, by, math.cos(angle2), math.sin(angle2), speed=5, rng=self.rng))
             print("Boss 9: DOUBLE SPIRALE!")
 
         elif pattern_index == 8 and self.rebirth_mode:
@@ -605,7 +604,7 @@ class Boss9(Enemy):
             # Plumes laterales
             for i in range(6):
                 angle = math.radians(self.timer * 3 + i * 60)
-                projectiles.append(VoidFeatherProjectile(bx, by, math.cos(angle), math.sin(angle), speed=5))
+                projectiles.append(VoidFeatherProjectile(bx, by, math.cos(angle), math.sin(angle), speed=5, rng=self.rng))
             print("Boss 9: APOCALYPSE!")
 
         return projectiles
@@ -617,7 +616,7 @@ class Boss9(Enemy):
         self.damage_animation_timer = 0
 
         # Cri du phoenix quand il prend des degats
-        if random.random() < 0.3:
+        if self.rng.random() < 0.3:
             self.screech_waves.append({
                 'x': self.rect.centerx,
                 'y': self.rect.centery,
@@ -8,6 +8,15 @@ from .projectiles import EnemyProjectile
 
 class Enemy:
     """Classe de base pour tous les ennemis."""
+    # Générateur aléatoire de la simulation, remplacé par celui du niveau au spawn
+    rng = random
+    # Pool vectorisé des tirs simples, transmis par le niveau au spawn
+    bullet_pool = None
+    # Passé à False à la mort ; retiré de la liste au balayage de fin de tick
+    alive = True
+    # MovementGroup qui déplace l'ennemi à sa place (voir systems/movement_group.py)
+    movement_group = None
+
     def __init__(self, x, y, speed=3, movement_pattern=None, color=RED):
         self.image = pygame.Surface((40, 40))
         self.image.fill(color)
@@ -30,6 +39,13 @@ class Enemy:
     def draw(self, surface):
         surface.blit(self.image, self.rect)
 
+    def fire_projectile(self, projectiles, projectile_class, *args, **kwargs):
+        """Tire un projectile : dans le pool si sa classe y est gérée, sinon ajouté à projectiles."""
+        if self.bullet_pool is not None and self.bullet_pool.handles(projectile_class):
+            self.bullet_pool.spawn(projectile_class, *args, **kwargs)
+        else:
+            projectiles.append(projectile_class(*args, **kwargs))
+
 
 class BasicEnemy(Enemy):
     """Ennemi de base rouge - utilisé pour les spawns simples."""
@@ -159,10 +175,9 @@ class ShootingEnemy(Enemy):
         else:
             if self.timer - self.last_shot_frame >= self.shoot_delay_frames:
                 self.last_shot_frame = self.timer
-                proj = self.shoot(player_position)
-                enemy_projectiles.append(proj)
+                self.shoot(player_position, enemy_projectiles)
 
-    def shoot(self, player_position):
+    def shoot(self, player_position, enemy_projectiles):
         ex, ey = self.rect.center
         px, py = player_position
         dx = px - ex
@@ -172,7 +187,7 @@ class ShootingEnemy(Enemy):
             dist = 1
         dx /= dist
         dy /= dist
-        return EnemyProjectile(ex, ey, dx, dy, speed=7)
+        self.fire_projectile(enemy_projectiles, EnemyProjectile, ex, ey, dx, dy, speed=7)
 
 
 class TankEnemy(Enemy):
@@ -378,7 +393,7 @@ class SplitterEnemy(Enemy):
         return surface
 
     def split(self):
-        """Retourne une liste de mini-ennemis lors de la destruction"""
+        """Retourne une liste de mini-ennemis lors de la destruction (à ajouter via Level.add_enemy)"""
         if self.is_mini:
             return []
 
@@ -449,8 +464,7 @@ class SniperEnemy(Enemy):
         elif self.phase == 1:
             # Visée - immobile, laser actif
             if self.phase_timer >= 60:
-                proj = self._fire(player_position)
-                enemy_projectiles.append(proj)
+                self._fire(player_position, enemy_projectiles)
                 self.phase = 2
                 self.phase_timer = 0
         elif self.phase == 2:
@@ -460,13 +474,13 @@ class SniperEnemy(Enemy):
                 self.phase = 1
                 self.phase_timer = 0
 
-    def _fire(self, player_position):
+    def _fire(self, player_position, enemy_projectiles):
         ex, ey = self.rect.center
         px, py = player_position
         dx = px - ex
         dy = py - ey
         dist = (dx ** 2 + dy ** 2) ** 0.5 or 1
-        return EnemyProjectile(ex, ey, dx / dist, dy / dist, speed=14)
+        self.fire_projectile(enemy_projectiles, EnemyProjectile, ex, ey, dx / dist, dy / dist, speed=14)
 
     def draw(self, surface):
         # Laser de visée rouge pendant la phase 1
@@ -521,7 +535,7 @@ class MineEnemy(Enemy):
             angle = i * math.pi / 4
             dx = math.cos(angle)
             dy = math.sin(angle)
-            projectiles.append(EnemyProjectile(ex, ey, dx, dy, speed=5))
+            self.fire_projectile(projectiles, EnemyProjectile, ex, ey, dx, dy, speed=5)
         return projectiles
 
 
@@ -640,7 +654,8 @@ class GhostEnemy(Enemy):
                 dx = px - ex
                 dy = py - ey
                 dist = (dx ** 2 + dy ** 2) ** 0.5 or 1
-                enemy_projectiles.append(EnemyProjectile(ex, ey, dx / dist, dy / dist, speed=5))
+                self.fire_projectile(enemy_projectiles, EnemyProjectile,
+                                     ex, ey, dx / dist, dy / dist, speed=5)
 
     def draw(self, surface):
         cycle_pos = self.timer % self.ghost_cycle
@@ -733,7 +748,7 @@ class BomberEnemy(Enemy):
             angle = i * math.pi / 3
             dx = math.cos(angle)
             dy = math.sin(angle)
-            projectiles.append(EnemyProjectile(ex, ey, dx, dy, speed=6))
+            self.fire_projectile(projectiles, EnemyProjectile, ex, ey, dx, dy, speed=6)
         return projectiles
 
     def draw(self, surface):
@@ -787,8 +802,8 @@ class TeleporterEnemy(Enemy):
         self.rect.y += self.speed
 
         if self.timer > 0 and self.timer % self.teleport_interval == 0:
-            new_x = random.randint(80, SCREEN_WIDTH - 80)
-            new_y = random.randint(60, SCREEN_HEIGHT // 2)
+            new_x = self.rng.randint(80, SCREEN_WIDTH - 80)
+            new_y = self.rng.randint(60, SCREEN_HEIGHT // 2)
             self.rect.center = (new_x, new_y)
             self.start_x = new_x
             self.teleport_flash = 15
@@ -797,9 +812,8 @@ class TeleporterEnemy(Enemy):
             base_angle = math.atan2(py - new_y, px - new_x)
             for spread in (-20, 0, 20):
                 angle = base_angle + math.radians(spread)
-                enemy_projectiles.append(
-                    EnemyProjectile(new_x, new_y, math.cos(angle), math.sin(angle), speed=6)
-                )
+                self.fire_projectile(enemy_projectiles, EnemyProjectile,
+                                     new_x, new_y, math.cos(angle), math.sin(angle), speed=6)
 
     def draw(self, surface):
         if self.teleport_flash > 0:
@@ -857,9 +871,8 @@ class PulseEnemy(Enemy):
             ex, ey = self.rect.center
             for i in range(8):
                 angle = i * math.pi / 4
-                enemy_projectiles.append(
-                    EnemyProjectile(ex, ey, math.cos(angle), math.sin(angle), speed=4)
-                )
+                self.fire_projectile(enemy_projectiles, EnemyProjectile,
+                                     ex, ey, math.cos(angle), math.sin(angle), speed=4)
 
     def draw(self, surface):
         # Anneau de charge qui grandit au fil du cycle
@@ -974,9 +987,8 @@ class BurstEnemy(Enemy):
             for i in range(self.burst_count):
                 angle_deg = -spread_total / 2 + i * (spread_total / (self.burst_count - 1))
                 angle_rad = math.radians(90 + angle_deg)
-                enemy_projectiles.append(
-                    EnemyProjectile(ex, ey, math.cos(angle_rad), math.sin(angle_rad), speed=5)
-                )
+                self.fire_projectile(enemy_projectiles, EnemyProjectile,
+                                     ex, ey, math.cos(angle_rad), math.sin(angle_rad), speed=5)
 
     def draw(self, surface):
         cycle = self.timer % self.burst_interval
@@ -1038,9 +1050,9 @@ class SpinnerEnemy(Enemy):
 
         if self.timer % self.fire_interval == 0:
             ex, ey = self.rect.center
-            enemy_projectiles.append(
-                EnemyProjectile(ex, ey, math.cos(self.fire_angle), math.sin(self.fire_angle), speed=4)
-            )
+            self.fire_projectile(enemy_projectiles, EnemyProjectile,
+                                 ex, ey,
+                                 math.cos(self.fire_angle), math.sin(self.fire_angle), speed=4)
             self.fire_angle += math.pi / 6  # +30° à chaque tir -> spirale
 
     def draw(self, surface):
@@ -1113,7 +1125,8 @@ class OrbiterEnemy(Enemy):
             dx = px - ox
             dy = py - oy
             dist = (dx ** 2 + dy ** 2) ** 0.5 or 1
-            enemy_projectiles.append(EnemyProjectile(ox, oy, dx / dist, dy / dist, speed=5))
+            self.fire_projectile(enemy_projectiles, EnemyProjectile,
+                                 ox, oy, dx / dist, dy / dist, speed=5)
             self.active_orb = (self.active_orb + 1) % 3
 
     def draw(self, surface):
@@ -1304,10 +1317,11 @@ class ClonerEnemy(Enemy):
         return surface
 
     def clone(self):
-        """Retourne un décoy positionné à côté."""
-        offset_x = random.choice((-85, 85))
-        return ClonerEnemy(self.rect.centerx + offset_x, self.rect.centery,
-                           speed=3, is_decoy=True)
+        """Retourne un décoy positionné à côté (à ajouter via Level.add_enemy)."""
+        offset_x = self.rng.choice((-85, 85))
+        decoy = ClonerEnemy(self.rect.centerx + offset_x, self.rect.centery,
+                            speed=3, is_decoy=True)
+        return decoy
 
     def update(self):
         self.timer += 1
@@ -1358,11 +1372,14 @@ class HealerEnemy(Enemy):
         pygame.draw.rect(surf, (255, 255, 255), (cx - 10, cy - 3, 20, 6))
         return surf
 
-    def update(self, enemies):
+    def update(self, enemies, grid=None):
+        """grid : SpatialHash des ennemis, pour ne parcourir que les voisins."""
         self.timer += 1
         self.rect.y += self.speed
         self.aura_pulse = (self.aura_pulse + 1) % 90
         if self.timer % self.heal_interval == 0:
+            if grid is not None:
+                enemies = grid.query_radius(self.rect.centerx, self.rect.centery, self.heal_radius)
             for enemy in enemies:
                 if enemy is self:
                     continue
@@ -1415,9 +1432,11 @@ class MagnetEnemy(Enemy):
         self.rect.y += self.speed
         self.pulse_timer = (self.pulse_timer + 1) % 60
 
-    def apply_magnet(self, projectiles):
-        """Attire les projectiles du joueur vers soi."""
+    def apply_magnet(self, projectiles, grid=None):
+        """Attire les projectiles du joueur vers soi (grid : SpatialHash des projectiles)."""
         ex, ey = self.rect.centerx, self.rect.centery
+        if grid is not None:
+            projectiles = grid.query_radius(ex, ey, self.magnet_radius)
         for proj in projectiles:
             dx = ex - proj.rect.centerx
             dy = ey - proj.rect.centery
@@ -1482,9 +1501,8 @@ class OverchargedEnemy(Enemy):
                 angle = math.radians(90 + angle_offset)
                 dx = math.cos(angle)
                 dy = math.sin(angle)
-                enemy_projectiles.append(
-                    EnemyProjectile(self.rect.centerx, self.rect.bottom, dx, dy,
-                                    speed=4 + phase))
+                self.fire_projectile(enemy_projectiles, EnemyProjectile,
+                                     self.rect.centerx, self.rect.bottom, dx, dy, speed=4 + phase)
         center = self.rect.center
         self.image = self._create_sprite(phase)
         self.rect = self.image.get_rect(center=center)
@@ -1554,8 +1572,8 @@ class SentinelEnemy(Enemy):
                 angle = math.radians(self.rotation + i * 120)
                 dx = math.cos(angle)
                 dy = math.sin(angle)
-                enemy_projectiles.append(
-                    EnemyProjectile(self.rect.centerx, self.rect.centery, dx, dy, speed=4))
+                self.fire_projectile(enemy_projectiles, EnemyProjectile,
+                                     self.rect.centerx, self.rect.centery, dx, dy, speed=4)
 
     def draw(self, surface):
         surface.blit(self.image, self.rect)
@@ -1598,7 +1616,7 @@ class EchoEnemy(Enemy):
             angle = base_angle + math.radians(offset)
             dx = math.cos(angle)
             dy = math.sin(angle)
-            enemy_projectiles.append(EnemyProjectile(ex, ey, dx, dy, speed=5))
+            self.fire_projectile(enemy_projectiles, EnemyProjectile, ex, ey, dx, dy, speed=5)
 
     def draw(self, surface):
         surface.blit(self.image, self.rect)
@@ -1717,8 +1735,8 @@ class ShadowEnemy(Enemy):
         self.fire_timer += 1
         if self.halted and self.fire_timer >= self.fire_interval:
             self.fire_timer = 0
-            enemy_projectiles.append(
-                EnemyProjectile(self.rect.centerx, self.rect.bottom, 0, 1, speed=5))
+            self.fire_projectile(enemy_projectiles, EnemyProjectile,
+                                 self.rect.centerx, self.rect.bottom, 0, 1, speed=5)
 
     def draw(self, surface):
         surface.blit(self.image, self.rect)
@@ -1760,8 +1778,8 @@ class DrainerEnemy(Enemy):
             base_angle = math.atan2(py - ey, px - ex)
             for offset in (-15, 0, 15):
                 angle = base_angle + math.radians(offset)
-                enemy_projectiles.append(
-                    EnemyProjectile(ex, ey, math.cos(angle), math.sin(angle), speed=9))
+                self.fire_projectile(enemy_projectiles, EnemyProjectile,
+                                     ex, ey, math.cos(angle), math.sin(angle), speed=9)
         return self.hp <= 0
 
     def update(self):
@@ -1868,8 +1886,8 @@ class GridEnemy(Enemy):
             dirs = [(0, -1), (0, 1), (1, 0), (-1, 0)] if self.volley == 0 \
                 else [(d, -d), (d, d), (-d, d), (-d, -d)]
             for dx, dy in dirs:
-                enemy_projectiles.append(
-                    EnemyProjectile(self.rect.centerx, self.rect.centery, dx, dy, speed=4))
+                self.fire_projectile(enemy_projectiles, EnemyProjectile,
+                                     self.rect.centerx, self.rect.centery, dx, dy, speed=4)
             self.volley = 1 - self.volley
 
     def draw(self, surface):
@@ -1924,9 +1942,9 @@ class FreezerEnemy(Enemy):
             self.fire_timer = 0
             for i in range(6):
                 angle = math.radians(i * 60)
-                enemy_projectiles.append(
-                    EnemyProjectile(self.rect.centerx, self.rect.centery,
-                                    math.cos(angle), math.sin(angle), speed=3))
+                self.fire_projectile(enemy_projectiles, EnemyProjectile,
+                                     self.rect.centerx, self.rect.centery,
+                                     math.cos(angle), math.sin(angle), speed=3)
 
     def draw(self, surface):
         surface.blit(self.image, self.rect)
@@ -2030,10 +2048,9 @@ class ScatterEnemy(Enemy):
             base = math.atan2(py - self.rect.centery, px - self.rect.centerx)
             for i in range(8):
                 angle = base + math.radians(-52 + i * 104 / 7)
-                enemy_projectiles.append(
-                    EnemyProjectile(self.rect.centerx, self.rect.centery,
-                                    math.cos(angle), math.sin(angle),
-                                    speed=random.uniform(2.5, 4.0)))
+                self.fire_projectile(enemy_projectiles, EnemyProjectile,
+                                     self.rect.centerx, self.rect.centery,
+                                     math.cos(angle), math.sin(angle), speed=self.rng.uniform(2.5, 4.0))
 
     def draw(self, surface):
         surface.blit(self.image, self.rect)
@@ -2078,9 +2095,8 @@ class AnchorEnemy(Enemy):
         if self.fire_timer >= self.fire_interval:
             self.fire_timer = 0
             for ox in (-18, 18):
-                enemy_projectiles.append(
-                    EnemyProjectile(self.rect.centerx + ox, self.rect.bottom,
-                                    0, 1, speed=2))
+                self.fire_projectile(enemy_projectiles, EnemyProjectile,
+                                     self.rect.centerx + ox, self.rect.bottom, 0, 1, speed=2)
 
     def draw(self, surface):
         surface.blit(self.image, self.rect)
@@ -2187,9 +2203,9 @@ class RipperEnemy(Enemy):
         self.fire_timer += 1
         if self.fire_timer >= self.fire_interval:
             self.fire_timer = 0
-            enemy_projectiles.append(
-                EnemyProjectile(self.rect.centerx, self.rect.centery,
-                                self.lateral_dir, 0.4, speed=5))
+            self.fire_projectile(enemy_projectiles, EnemyProjectile,
+                                 self.rect.centerx, self.rect.centery,
+                                 self.lateral_dir, 0.4, speed=5)
 
     def draw(self, surface):
         surface.blit(self.image, self.rect)
@@ -2221,9 +2237,9 @@ class ChainEnemy(Enemy):
         """Explose en 6 projectiles lors de la réaction en chaîne."""
         for i in range(6):
             angle = math.radians(i * 60)
-            enemy_projectiles.append(
-                EnemyProjectile(self.rect.centerx, self.rect.centery,
-                                math.cos(angle), math.sin(angle), speed=4))
+            self.fire_projectile(enemy_projectiles, EnemyProjectile,
+                                 self.rect.centerx, self.rect.centery,
+                                 math.cos(angle), math.sin(angle), speed=4)
 
     def update(self, enemy_projectiles):
         self.timer += 1
@@ -2231,8 +2247,8 @@ class ChainEnemy(Enemy):
         self.fire_timer += 1
         if self.fire_timer >= 100:
             self.fire_timer = 0
-            enemy_projectiles.append(
-                EnemyProjectile(self.rect.centerx, self.rect.bottom, 0, 1, speed=4))
+            self.fire_projectile(enemy_projectiles, EnemyProjectile,
+                                 self.rect.centerx, self.rect.bottom, 0, 1, speed=4)
 
     def draw(self, surface):
         surface.blit(self.image, self.rect)
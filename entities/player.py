@@ -5,13 +5,30 @@ import math
 from config import YELLOW, SCREEN_WIDTH, SCREEN_HEIGHT
 from .projectiles import Projectile, SpreadProjectile, RicochetProjectile, ZigZagPlayerProjectile, MissileProjectile
 from resource_path import resource_path
+from systems import object_pool, sim_clock
+
+
+class ThrusterParticle:
+    """Particule du réacteur (slots : pas de dict par particule)"""
+    __slots__ = ("x", "y", "vx", "vy", "life", "max_life", "size")
+
+    def __init__(self, x, y, vx, vy, life, size, max_life=20):
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
+        self.life = life
+        self.max_life = max_life
+        self.size = size
 
 
 class Player:
-    def __init__(self, x, y, player_id=1, is_local=True, headless=False):
+    def __init__(self, x, y, player_id=1, is_local=True, headless=False, rng=None, clock=None):
         self.player_id = player_id
         self.is_local = is_local
         self.headless = headless  # Mode sans graphiques (pour le serveur)
+        self.rng = rng if rng is not None else random  # Générateur de la simulation
+        self.clock = clock or sim_clock.current()  # Horloge des durées (tir, invulnérabilité, power-up)
 
         # Charger le sprite seulement si on n'est pas en mode headless
         if not headless:
@@ -32,7 +49,7 @@ class Player:
             self.image = None
             self.rect = pygame.Rect(x - 25, y - 25, 50, 50)
         self.shoot_delay = 250
-        self.last_shot = pygame.time.get_ticks()
+        self.last_shot = self.clock.get_ticks()
         self.hp = 10
         self.contact_damage = 1
         self.invulnerable = False
@@ -78,7 +95,7 @@ class Player:
             return
         self.is_crashing = True
         self.crash_timer = 0
-        self.crash_fall_direction = random.choice([-1, 1])
+        self.crash_fall_direction = self.rng.choice([-1, 1])
         self.crash_rotation = 0
         self.crash_rotation_speed = 5
         self.crash_explosions = []
@@ -124,43 +141,50 @@ class Player:
         # Garder le joueur dans l'écran
         self.rect.clamp_ip(pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
         if self.invulnerable:
-            now = pygame.time.get_ticks()
+            now = self.clock.get_ticks()
             if now - self.invuln_start >= self.invuln_duration:
                 self.invulnerable = False
 
         if self.power_type != 'normal':
-            now = pygame.time.get_ticks()
+            now = self.clock.get_ticks()
             if now - self.power_start >= self.power_duration:
                 self.power_type = 'normal'
                 print("Power-up expire!")
 
         # Mise a jour de l'effet de reacteur
         self.thruster_timer += 1
-        if self.thruster_timer % 2 == 0:
-            # Creer de nouvelles particules de feu
+        self.update_thruster_particles(self.thruster_timer % 2 == 0)
+
+    def update_thruster_particles(self, emit):
+        """Effet de reacteur : emet (si emit) puis fait vivre les particules de feu.
+
+        Purement visuel : tire du module random, pas du generateur de la
+        simulation, et ne fait rien en mode headless.
+        """
+        if self.headless:
+            return
+        if emit:
             base_x = self.rect.centerx
             base_y = self.rect.bottom - 5
             for _ in range(2):
-                particle = {
-                    'x': base_x + random.uniform(-8, 8),
-                    'y': base_y,
-                    'vx': random.uniform(-0.5, 0.5),
-                    'vy': random.uniform(2, 4),
-                    'life': random.randint(10, 20),
-                    'max_life': 20,
-                    'size': random.uniform(3, 6),
-                }
+                particle = ThrusterParticle(
+                    base_x + random.uniform(-8, 8),
+                    base_y,
+                    random.uniform(-0.5, 0.5),
+                    random.uniform(2, 4),
+                    random.randint(10, 20),
+                    random.uniform(3, 6),
+                )
                 self.thruster_particles.append(particle)
 
-        # Mise a jour des particules existantes
         for p in self.thruster_particles:
-            p['x'] += p['vx']
-            p['y'] += p['vy']
-            p['life'] -= 1
-            p['size'] = max(0, p['size'] - 0.2)
+            p.x += p.vx
+            p.y += p.vy
+            p.life -= 1
+            p.size = max(0, p.size - 0.2)
 
         # Supprimer les particules mortes
-        self.thruster_particles = [p for p in self.thruster_particles if p['life'] > 0]
+        self.thruster_particles = [p for p in self.thruster_particles if p.life > 0]
 
     def _update_crash_animation(self):
         """Met à jour l'animation de crash du vaisseau."""
@@ -176,8 +200,8 @@ class Player:
         self.rect.y += fall_speed_y
 
         # 2. Tremblement
-        shake_x = random.uniform(-3, 3) * (1 - progress * 0.5)
-        shake_y = random.uniform(-2, 2) * (1 - progress * 0.5)
+        shake_x = self.rng.uniform(-3, 3) * (1 - progress * 0.5)
+        shake_y = self.rng.uniform(-2, 2) * (1 - progress * 0.5)
         self.rect.x += shake_x
         self.rect.y += shake_y
 
@@ -212,12 +236,13 @@ class Player:
         if self.crash_explosion_timer >= explosion_interval:
             self.crash_explosion_timer = 0
             # Créer une explosion à une position aléatoire sur le vaisseau
-            offset_x = random.randint(-20, 20)
-            offset_y = random.randint(-20, 20)
+            offset_x = self.rng.randint(-20, 20)
+            offset_y = self.rng.randint(-20, 20)
             exp = Explosion(
                 self.rect.centerx + offset_x,
                 self.rect.centery + offset_y,
-                duration=300
+                duration=300,
+                clock=self.clock
             )
             self.crash_explosions.append(exp)
 
@@ -227,31 +252,12 @@ class Player:
         self.crash_explosions = [exp for exp in self.crash_explosions if not exp.is_finished()]
 
         # 6. Éteindre progressivement les particules de thruster
+        emit = False
         if progress < 0.3:  # Thruster actif pendant 30% de l'animation
             # Continuer les particules normalement
             self.thruster_timer += 1
-            if self.thruster_timer % 2 == 0:
-                base_x = self.rect.centerx
-                base_y = self.rect.bottom - 5
-                for _ in range(2):
-                    particle = {
-                        'x': base_x + random.uniform(-8, 8),
-                        'y': base_y,
-                        'vx': random.uniform(-0.5, 0.5),
-                        'vy': random.uniform(2, 4),
-                        'life': random.randint(10, 20),
-                        'max_life': 20,
-                        'size': random.uniform(3, 6),
-                    }
-                    self.thruster_particles.append(particle)
-
-        # Mettre à jour les particules existantes
-        for p in self.thruster_particles:
-            p['x'] += p['vx']
-            p['y'] += p['vy']
-            p['life'] -= 1
-            p['size'] = max(0, p['size'] - 0.2)
-        self.thruster_particles = [p for p in self.thruster_particles if p['life'] > 0]
+            emit = self.thruster_timer % 2 == 0
+        self.update_thruster_particles(emit)
 
         # 7. Vérifier si l'animation est terminée
         if self.crash_timer >= self.crash_duration:
@@ -262,41 +268,42 @@ class Player:
     def apply_powerup(self, power_type):
         """Applique un power-up au joueur"""
         self.power_type = power_type
-        self.power_start = pygame.time.get_ticks()
+        self.power_start = self.clock.get_ticks()
         print(f"Power-up '{power_type}' active!")
 
     def shoot(self, projectile_list):
-        now = pygame.time.get_ticks()
+        now = self.clock.get_ticks()
         if now - self.last_shot >= self.shoot_delay:
             cx, cy = self.rect.centerx, self.rect.top
+            acquire = object_pool.acquire
 
             if self.power_type == 'normal':
-                projectile_list.append(Projectile(cx, cy))
+                projectile_list.append(acquire(Projectile, cx, cy))
 
             elif self.power_type == 'double':
                 offset = 15
-                projectile_list.append(Projectile(cx - offset, cy))
-                projectile_list.append(Projectile(cx + offset, cy))
+                projectile_list.append(acquire(Projectile, cx - offset, cy))
+                projectile_list.append(acquire(Projectile, cx + offset, cy))
 
             elif self.power_type == 'triple':
                 offset = 20
-                projectile_list.append(Projectile(cx - offset, cy))
-                projectile_list.append(Projectile(cx, cy))
-                projectile_list.append(Projectile(cx + offset, cy))
+                projectile_list.append(acquire(Projectile, cx - offset, cy))
+                projectile_list.append(acquire(Projectile, cx, cy))
+                projectile_list.append(acquire(Projectile, cx + offset, cy))
 
             elif self.power_type == 'spread':
-                projectile_list.append(SpreadProjectile(cx, cy, angle=-15))
-                projectile_list.append(Projectile(cx, cy))
-                projectile_list.append(SpreadProjectile(cx, cy, angle=15))
+                projectile_list.append(acquire(SpreadProjectile, cx, cy, angle=-15))
+                projectile_list.append(acquire(Projectile, cx, cy))
+                projectile_list.append(acquire(SpreadProjectile, cx, cy, angle=15))
 
             elif self.power_type == 'ricochet':
-                projectile_list.append(RicochetProjectile(cx, cy))
+                projectile_list.append(acquire(RicochetProjectile, cx, cy, rng=self.rng))
 
             elif self.power_type == 'zigzag':
-                projectile_list.append(ZigZagPlayerProjectile(cx, cy))
+                projectile_list.append(acquire(ZigZagPlayerProjectile, cx, cy))
 
             elif self.power_type == 'missile':
-                projectile_list.append(MissileProjectile(cx, cy))
+                projectile_list.append(acquire(MissileProjectile, cx, cy))
 
             self.last_shot = now
 
@@ -308,8 +315,8 @@ class Player:
 
         # Dessiner l'effet de reacteur (avant le vaisseau)
         for p in self.thruster_particles:
-            progress = p['life'] / p['max_life']
-            size = int(p['size'])
+            progress = p.life / p.max_life
+            size = int(p.size)
             if size < 1:
                 continue
 
@@ -327,7 +334,7 @@ class Player:
             alpha = int(255 * progress)
             particle_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
             pygame.draw.circle(particle_surf, (r, g, b, alpha), (size, size), size)
-            surface.blit(particle_surf, (int(p['x'] - size), int(p['y'] - size)))
+            surface.blit(particle_surf, (int(p.x - size), int(p.y - size)))
 
         # Dessiner le vaisseau (ignore invulnérable pendant crash)
         if self.image:
@@ -339,7 +346,7 @@ class Player:
                 surface.blit(self.image, self.rect)
 
         if self.power_type != 'normal':
-            time_left = self.power_duration - (pygame.time.get_ticks() - self.power_start)
+            time_left = self.power_duration - (self.clock.get_ticks() - self.power_start)
             progress = time_left / self.power_duration
             bar_width = 50
             bar_height = 5
@@ -6,7 +6,10 @@ from config import CYAN, WHITE
 
 class PowerUp:
     """Power-up qui tombe et ameliore les tirs du joueur"""
+    __slots__ = ("power_type", "image", "color", "rect", "speed", "angle", "alive")
+
     def __init__(self, x, y, power_type='double'):
+        self.alive = True
         self.power_type = power_type
         self.image = pygame.Surface((30, 30))
 
@@ -5,21 +5,55 @@ import random
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, RED, YELLOW, ORANGE, CYAN, WHITE
 
 
+# Tampons de traînée partagés : (classe, fonction couleur, fonction taille, longueur) -> tampons
+_trail_caches = {}
+
+
+def _trail_func_key(func):
+    """Identifie une fonction de traînée par son code et les valeurs qu'elle capture"""
+    closure = tuple(cell.cell_contents for cell in func.__closure__ or ())
+    return func.__code__, func.__defaults__, closure
+
+
+def _build_trail_cache(max_trail_length, trail_color_func, trail_size_func):
+    trail_cache = []
+    for i in range(max_trail_length):
+        progress = i / max_trail_length if max_trail_length > 0 else 0
+        alpha = int(255 * progress)
+        size = trail_size_func(progress)
+        color = trail_color_func(progress, alpha)
+        trail_surf = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
+        pygame.draw.circle(trail_surf, color, (size, size), size)
+        trail_cache.append((trail_surf, size))
+    return trail_cache
+
+
 class TrailedProjectile:
     """Classe de base pour tous les projectiles avec traînée"""
+    # Slots (pas de __dict__ par instance) : à déclarer dans chaque sous-classe
+    # pour tout nouvel attribut ; _in_pool est posé par systems.object_pool
+    __slots__ = ("trail", "max_trail_length", "trail_cache", "alive", "_in_pool")
+
     def __init__(self, max_trail_length, trail_color_func, trail_size_func):
+        # Passé à False quand le projectile est détruit ; retiré au balayage de fin de tick
+        self.alive = True
         self.trail = []
         self.max_trail_length = max_trail_length
-        self.trail_cache = []
 
-        for i in range(max_trail_length):
-            progress = i / max_trail_length if max_trail_length > 0 else 0
-            alpha = int(255 * progress)
-            size = trail_size_func(progress)
-            color = trail_color_func(progress, alpha)
-            trail_surf = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-            pygame.draw.circle(trail_surf, color, (size, size), size)
-            self.trail_cache.append((trail_surf, size))
+        # Les tampons ne dépendent que des paramètres : construits une fois par
+        # combinaison puis partagés par toutes les instances (lecture seule)
+        key = (type(self), _trail_func_key(trail_color_func),
+               _trail_func_key(trail_size_func), max_trail_length)
+        try:
+            trail_cache = _trail_caches.get(key)
+        except TypeError:
+            # Valeur capturée non hashable : pas de partage possible
+            key, trail_cache = None, None
+        if trail_cache is None:
+            trail_cache = _build_trail_cache(max_trail_length, trail_color_func, trail_size_func)
+            if key is not None:
+                _trail_caches[key] = trail_cache
+        self.trail_cache = trail_cache
 
     def update_trail(self):
         """Met à jour la traînée avec la position actuelle"""
@@ -36,6 +70,8 @@ class TrailedProjectile:
 
 
 class Projectile(TrailedProjectile):
+    __slots__ = ("image", "rect", "speed", "is_special_weapon")
+
     def __init__(self, x, y, speed=10):
         super().__init__(
             max_trail_length=6,
@@ -48,6 +84,15 @@ class Projectile(TrailedProjectile):
         self.speed = speed
         self.is_special_weapon = False
 
+    def reset(self, x, y, speed=10):
+        """Réinitialise un projectile recyclé (mêmes paramètres que le constructeur)"""
+        self.alive = True
+        self.trail.clear()
+        self.image.fill(YELLOW)
+        self.rect.center = (x, y)
+        self.speed = speed
+        self.is_special_weapon = False
+
     def update(self):
         self.update_trail()
         self.rect.y -= self.speed
@@ -59,12 +104,21 @@ class Projectile(TrailedProjectile):
 
 class SpreadProjectile(Projectile):
     """Projectile qui se deplace en diagonale pour le tir en eventail"""
+    __slots__ = ("angle", "dx", "dy")
+
     def __init__(self, x, y, speed=10, angle=15):
         super().__init__(x, y, speed)
+        self._aim(angle)
+
+    def reset(self, x, y, speed=10, angle=15):
+        Projectile.reset(self, x, y, speed)
+        self._aim(angle)
+
+    def _aim(self, angle):
         self.angle = angle
         angle_rad = math.radians(angle)
-        self.dx = math.sin(angle_rad) * speed
-        self.dy = -math.cos(angle_rad) * speed
+        self.dx = math.sin(angle_rad) * self.speed
+        self.dy = -math.cos(angle_rad) * self.speed
 
     def update(self):
         self.update_trail()
@@ -74,7 +128,10 @@ class SpreadProjectile(Projectile):
 
 class RicochetProjectile(Projectile):
     """Projectile qui rebondit sur les ennemis dans un angle aleatoire (demi-cercle superieur)"""
-    def __init__(self, x, y, speed=10, max_ricochets=2):
+    __slots__ = ("rng", "max_ricochets", "ricochets_left", "dx", "dy")
+
+    def __init__(self, x, y, speed=10, max_ricochets=2, rng=None):
+        self.rng = rng if rng is not None else random
         super().__init__(x, y, speed)
         self.max_ricochets = max_ricochets
         self.ricochets_left = max_ricochets
@@ -82,6 +139,15 @@ class RicochetProjectile(Projectile):
         self.dy = -1  # Commence vers le haut
         self.image.fill(ORANGE)
 
+    def reset(self, x, y, speed=10, max_ricochets=2, rng=None):
+        self.rng = rng if rng is not None else random
+        Projectile.reset(self, x, y, speed)
+        self.max_ricochets = max_ricochets
+        self.ricochets_left = max_ricochets
+        self.dx = 0
+        self.dy = -1
+        self.image.fill(ORANGE)
+
     def update(self):
         self.update_trail()
         self.rect.x += int(self.dx * self.speed)
@@ -94,7 +160,7 @@ class RicochetProjectile(Projectile):
             return False
 
         # Angle aleatoire dans le demi-cercle superieur (pi a 2*pi)
-        angle = random.uniform(math.pi, 2 * math.pi)
+        angle = self.rng.uniform(math.pi, 2 * math.pi)
         self.dx = math.cos(angle)
         self.dy = math.sin(angle)
         self.ricochets_left -= 1
@@ -103,6 +169,8 @@ class RicochetProjectile(Projectile):
 
 class ZigZagPlayerProjectile(Projectile):
     """Projectile du joueur qui zigzague en changeant de diagonale regulierement"""
+    __slots__ = ("zigzag_interval", "timer", "direction", "diagonal_speed")
+
     def __init__(self, x, y, speed=10, zigzag_interval=15):
         super().__init__(x, y, speed)
         self.image.fill((255, 0, 200))  # Magenta
@@ -111,6 +179,13 @@ class ZigZagPlayerProjectile(Projectile):
         self.direction = 1  # 1 = droite, -1 = gauche
         self.diagonal_speed = 3  # Vitesse horizontale du zigzag
 
+    def reset(self, x, y, speed=10, zigzag_interval=15):
+        Projectile.reset(self, x, y, speed)
+        self.image.fill((255, 0, 200))
+        self.zigzag_interval = zigzag_interval
+        self.timer = 0
+        self.direction = 1
+
     def update(self):
         self.update_trail()
         self.timer += 1
@@ -127,6 +202,8 @@ class ZigZagPlayerProjectile(Projectile):
 class MissileProjectile(Projectile):
     """Projectile missile qui commence lent puis accélère brutalement.
     Explose au point d'impact en infligeant des dégâts AOE."""
+    __slots__ = ("timer", "acceleration_frame", "max_speed", "has_accelerated", "aoe_radius", "aoe_damage")
+
     def __init__(self, x, y):
         super().__init__(x, y, speed=2)  # Commence très lent
         self.image = pygame.Surface((8, 16))
@@ -139,6 +216,11 @@ class MissileProjectile(Projectile):
         self.aoe_radius = 60  # Rayon de l'explosion AOE
         self.aoe_damage = 1
 
+    def reset(self, x, y):
+        Projectile.reset(self, x, y, speed=2)
+        self.timer = 0
+        self.has_accelerated = False
+
     def update(self):
         self.update_trail()
         self.timer += 1
@@ -168,6 +250,8 @@ class MissileProjectile(Projectile):
 
 
 class EnemyProjectile(TrailedProjectile):
+    __slots__ = ("image", "rect", "dx", "dy", "speed")
+
     def __init__(self, x, y, dx, dy, speed=7):
         super().__init__(
             max_trail_length=5,
@@ -181,6 +265,15 @@ class EnemyProjectile(TrailedProjectile):
         self.dy = dy
         self.speed = speed
 
+    def reset(self, x, y, dx, dy, speed=7):
+        """Réinitialise un tir recyclé ; valable pour les sous-classes linéaires sans état propre"""
+        self.alive = True
+        self.trail.clear()
+        self.rect.center = (x, y)
+        self.dx = dx
+        self.dy = dy
+        self.speed = speed
+
     def update(self):
         self.update_trail()
         self.rect.x += int(self.dx * self.speed)
@@ -193,6 +286,8 @@ class EnemyProjectile(TrailedProjectile):
 
 class BossProjectile(EnemyProjectile):
     """Projectiles du Boss - Plus gros et plus visibles"""
+    __slots__ = ()
+
     def __init__(self, x, y, dx, dy, speed=7):
         # Initialiser la classe de base TrailedProjectile directement
         TrailedProjectile.__init__(
@@ -222,6 +317,8 @@ class BossProjectile(EnemyProjectile):
 
 class Boss2Projectile(EnemyProjectile):
     """Projectiles du Boss 2 - Violets et menacants"""
+    __slots__ = ()
+
     def __init__(self, x, y, dx, dy, speed=7):
         TrailedProjectile.__init__(
             self,
@@ -250,6 +347,8 @@ class Boss2Projectile(EnemyProjectile):
 
 class Boss3Projectile(EnemyProjectile):
     """Projectiles du Boss 3 - Cyan/electriques"""
+    __slots__ = ()
+
     def __init__(self, x, y, dx, dy, speed=7):
         TrailedProjectile.__init__(
             self,
@@ -277,6 +376,8 @@ class Boss3Projectile(EnemyProjectile):
 
 class HomingProjectile(EnemyProjectile):
     """Projectile a tete chercheuse pour le Boss 3"""
+    __slots__ = ("homing_duration", "timer", "turn_speed", "launched", "super_speed")
+
     def __init__(self, x, y, speed=4):
         TrailedProjectile.__init__(
             self,
@@ -305,13 +406,14 @@ class HomingProjectile(EnemyProjectile):
             px, py = player_position
             target_dx = px - self.rect.centerx
             target_dy = py - self.rect.centery
-            dist = math.sqrt(target_dx**2 + target_dy**2)
+            dist = math.sqrt(target_dx * target_dx + target_dy * target_dy)
             if dist > 0:
                 target_dx /= dist
                 target_dy /= dist
                 self.dx += (target_dx - self.dx) * self.turn_speed
                 self.dy += (target_dy - self.dy) * self.turn_speed
-                d = math.sqrt(self.dx**2 + self.dy**2)
+                # x * x (arrondi exact) et non x**2 : même résultat que le guidage en lot (systems/steering.py)
+                d = math.sqrt(self.dx * self.dx + self.dy * self.dy)
                 if d > 0:
                     self.dx /= d
                     self.dy /= d
@@ -342,6 +444,8 @@ class HomingProjectile(EnemyProjectile):
 
 class Boss4Projectile(EnemyProjectile):
     """Projectiles du Boss 4 - Dores/solaires"""
+    __slots__ = ()
+
     def __init__(self, x, y, dx, dy, speed=7):
         TrailedProjectile.__init__(
             self,
@@ -370,6 +474,8 @@ class Boss4Projectile(EnemyProjectile):
 
 class BouncingProjectile(EnemyProjectile):
     """Projectile qui rebondit sur les bords de l'ecran"""
+    __slots__ = ("bounces_left",)
+
     def __init__(self, x, y, dx, dy, speed=5, bounces=3):
         TrailedProjectile.__init__(
             self,
@@ -385,6 +491,10 @@ class BouncingProjectile(EnemyProjectile):
         self.speed = speed
         self.bounces_left = bounces
 
+    def reset(self, x, y, dx, dy, speed=5, bounces=3):
+        EnemyProjectile.reset(self, x, y, dx, dy, speed)
+        self.bounces_left = bounces
+
     def update(self):
         self.update_trail()
         self.rect.x += int(self.dx * self.speed)
@@ -407,13 +517,10 @@ class BouncingProjectile(EnemyProjectile):
 
 class SplittingProjectile(EnemyProjectile):
     """Projectile qui se divise apres un certain temps"""
+    __slots__ = ("timer", "split_time", "can_split", "has_split")
+
     def __init__(self, x, y, dx, dy, speed=4, split_time=40, can_split=True):
-        TrailedProjectile.__init__(
-            self,
-            max_trail_length=6,
-            trail_color_func=lambda progress, alpha: (200, int(150 * progress), 255, alpha),
-            trail_size_func=lambda progress: max(2, int(8 * progress)) if can_split else max(1, int(4 * progress))
-        )
+        self._init_trail(can_split)
         self.image = pygame.Surface((16, 16))
         self.image.fill((200, 150, 255))
         self.rect = self.image.get_rect(center=(x, y))
@@ -425,6 +532,23 @@ class SplittingProjectile(EnemyProjectile):
         self.can_split = can_split
         self.has_split = False
 
+    def _init_trail(self, can_split):
+        TrailedProjectile.__init__(
+            self,
+            max_trail_length=6,
+            trail_color_func=lambda progress, alpha: (200, int(150 * progress), 255, alpha),
+            trail_size_func=lambda progress: max(2, int(8 * progress)) if can_split else max(1, int(4 * progress))
+        )
+
+    def reset(self, x, y, dx, dy, speed=4, split_time=40, can_split=True):
+        # La taille de la traînée dépend de can_split
+        self._init_trail(can_split)
+        EnemyProjectile.reset(self, x, y, dx, dy, speed)
+        self.timer = 0
+        self.split_time = split_time
+        self.can_split = can_split
+        self.has_split = False
+
     def update(self):
         self.timer += 1
         self.update_trail()
@@ -436,14 +560,15 @@ class SplittingProjectile(EnemyProjectile):
 
     def split(self):
         """Retourne une liste de nouveaux projectiles"""
+        from systems import object_pool
         self.has_split = True
         new_projectiles = []
         for angle_offset in [-45, 0, 45]:
             angle = math.atan2(self.dy, self.dx) + math.radians(angle_offset)
             ndx = math.cos(angle)
             ndy = math.sin(angle)
-            new_projectiles.append(SplittingProjectile(
-                self.rect.centerx, self.rect.centery,
+            new_projectiles.append(object_pool.acquire(
+                SplittingProjectile, self.rect.centerx, self.rect.centery,
                 ndx, ndy, speed=5, can_split=False
             ))
         return new_projectiles
@@ -461,6 +586,8 @@ class SplittingProjectile(EnemyProjectile):
 
 class Boss5Projectile(EnemyProjectile):
     """Projectiles du Boss 5 - Verts toxiques/acides"""
+    __slots__ = ()
+
     def __init__(self, x, y, dx, dy, speed=7):
         TrailedProjectile.__init__(
             self,
@@ -489,6 +616,8 @@ class Boss5Projectile(EnemyProjectile):
 
 class ZigZagProjectile(EnemyProjectile):
     """Projectile qui zigzague horizontalement"""
+    __slots__ = ("start_x", "amplitude", "frequency", "timer")
+
     def __init__(self, x, y, dy, speed=5, amplitude=50, frequency=0.1):
         TrailedProjectile.__init__(
             self,
@@ -521,6 +650,8 @@ class ZigZagProjectile(EnemyProjectile):
 
 class GravityProjectile(EnemyProjectile):
     """Projectile affecte par la gravite"""
+    __slots__ = ("gravity", "vy")
+
     def __init__(self, x, y, dx, dy, speed=8):
         TrailedProjectile.__init__(
             self,
@@ -537,6 +668,10 @@ class GravityProjectile(EnemyProjectile):
         self.gravity = 0.15
         self.vy = dy * speed
 
+    def reset(self, x, y, dx, dy, speed=8):
+        EnemyProjectile.reset(self, x, y, dx, dy, speed)
+        self.vy = dy * speed
+
     def update(self):
         self.update_trail()
         self.rect.x += int(self.dx * self.speed)
@@ -551,6 +686,8 @@ class GravityProjectile(EnemyProjectile):
 
 class TeleportingProjectile(EnemyProjectile):
     """Projectile qui se teleporte periodiquement"""
+    __slots__ = ("timer", "teleport_interval", "teleport_distance")
+
     def __init__(self, x, y, dx, dy, speed=4):
         TrailedProjectile.__init__(
             self,
@@ -591,6 +728,8 @@ class TeleportingProjectile(EnemyProjectile):
 
 class Boss6Projectile(EnemyProjectile):
     """Projectile du Boss 6 - noir avec aura violette"""
+    __slots__ = ()
+
     def __init__(self, x, y, dx, dy, speed=5):
         TrailedProjectile.__init__(
             self,
@@ -619,11 +758,17 @@ class Boss6Projectile(EnemyProjectile):
 
 class VortexProjectile(EnemyProjectile):
     """Projectile qui orbite autour d'un point central avant de foncer"""
-    def __init__(self, x, y, target_x, target_y, speed=3):
+    __slots__ = (
+        "rng", "center_x", "center_y", "orbit_radius", "orbit_angle", "orbit_speed", "orbit_time",
+        "timer", "target_x", "target_y", "launched",
+    )
+
+    def __init__(self, x, y, target_x, target_y, speed=3, rng=None):
+        self.rng = rng if rng is not None else random
         self.center_x = x
         self.center_y = y
         self.orbit_radius = 50
-        self.orbit_angle = random.uniform(0, 2 * math.pi)
+        self.orbit_angle = self.rng.uniform(0, 2 * math.pi)
         self.orbit_speed = 0.15
         self.orbit_time = 60
         self.timer = 0
@@ -682,6 +827,8 @@ class VortexProjectile(EnemyProjectile):
 
 class BlackHoleProjectile(EnemyProjectile):
     """Projectile stationnaire qui attire les projectiles du joueur"""
+    __slots__ = ("lifetime", "timer", "pull_radius", "pull_strength")
+
     def __init__(self, x, y, lifetime=180):
         TrailedProjectile.__init__(
             self,
@@ -724,6 +871,8 @@ class BlackHoleProjectile(EnemyProjectile):
 
 class MirrorProjectile(EnemyProjectile):
     """Projectile qui se duplique quand il atteint certaines positions"""
+    __slots__ = ("can_split", "split_y", "has_split", "children")
+
     def __init__(self, x, y, dx, dy, speed=4, can_split=True):
         TrailedProjectile.__init__(
             self,
@@ -765,6 +914,8 @@ class MirrorProjectile(EnemyProjectile):
 
 class PulseWaveProjectile(EnemyProjectile):
     """Onde de choc circulaire qui s'etend"""
+    __slots__ = ("radius", "max_radius", "thickness", "center")
+
     def __init__(self, x, y, speed=3):
         TrailedProjectile.__init__(
             self,
@@ -801,6 +952,11 @@ class PulseWaveProjectile(EnemyProjectile):
         dist = math.sqrt(dx*dx + dy*dy)
         return abs(dist - self.radius) < self.thickness + 10
 
+    def get_bounds(self):
+        """Carré englobant tous les points que check_collision peut toucher"""
+        margin = self.thickness + 10
+        return self.rect.inflate(margin * 2, margin * 2)
+
     def draw(self, surface):
         alpha = int(255 * (1 - self.radius / self.max_radius))
         wave_surf = pygame.Surface((self.radius * 2 + 20, self.radius * 2 + 20), pygame.SRCALPHA)
@@ -812,6 +968,8 @@ class PulseWaveProjectile(EnemyProjectile):
 
 class Boss7Projectile(EnemyProjectile):
     """Projectile du Boss 7 - gris neutre"""
+    __slots__ = ()
+
     def __init__(self, x, y, dx, dy, speed=6):
         TrailedProjectile.__init__(
             self,
@@ -846,6 +1004,8 @@ class BallBreakerProjectile(EnemyProjectile):
     Rebondit sur les bords de l'ecran et sur les autres balles.
     Au 5eme rebond: traverse les bords ou explose si c'est une balle.
     """
+    __slots__ = ("bounces_left", "margin", "ball_radius", "spawn_grace")
+
     def __init__(self, x, y, target_x, target_y, speed=8):
         # Calculer direction initiale vers le joueur
         dx = target_x - x
@@ -895,6 +1055,8 @@ class BallBreakerProjectile(EnemyProjectile):
                     # Calcul de la distance entre les centres
                     dx_ball = self.rect.centerx - other.rect.centerx
                     dy_ball = self.rect.centery - other.rect.centery
+                    if abs(dx_ball) >= 48 or abs(dy_ball) >= 48:
+                        continue
                     distance = math.sqrt(dx_ball*dx_ball + dy_ball*dy_ball)
                     # Collision si distance < somme des rayons (24 + 24 = 48)
                     if distance < 48 and distance > 0:
@@ -980,6 +1142,14 @@ class EdgeRollerProjectile(EnemyProjectile):
     3. Quand il remonte et est aligne horizontalement avec le joueur, fait un arc pour orbiter
     4. Apres 1 seconde, fonce vers le joueur et quitte l'ecran
     """
+    __slots__ = (
+        "base_speed", "max_speed", "phase", "roll_direction", "roll_speed", "margin", "clockwise",
+        "global_timer", "orbit_timer", "orbit_duration", "orbit_phase_1_duration",
+        "orbit_phase_2_duration", "orbit_center_x", "orbit_center_y", "orbit_radius",
+        "orbit_angle", "orbit_direction", "final_timer", "final_wait", "target_x", "target_y",
+        "passed_bottom", "orbit_speed_angle",
+    )
+
     # Phases du projectile
     PHASE_CHASE = 0       # Fonce vers le joueur
     PHASE_ROLL = 1        # Longe les bords
@@ -1330,6 +1500,16 @@ class CurveStalkerProjectile(EnemyProjectile):
     5. Monte vers le haut, puis retourne en phase 2 (ou sort si déjà fait)
     6. Rebondit, courbe, puis fonce vers le joueur
     """
+    __slots__ = (
+        "base_speed", "side", "phase", "timer", "margin", "start_x", "start_y", "target_y",
+        "curve_progress", "curve_duration", "player_y_target", "semicircle_center_x",
+        "semicircle_center_y", "semicircle_radius", "semicircle_angle", "semicircle_direction",
+        "semicircle_target_angle", "player_x_at_semicircle", "straight_target_x",
+        "straight_target_y", "phase5_count", "bounce_timer", "bounce_direction_x",
+        "bounce_direction_y", "phase6_subphase", "curve_start_x", "curve_start_y",
+        "phase6_player_x", "phase6_player_y", "target_x",
+    )
+
     # Phases du projectile
     PHASE_CURVE_UP = 1
     PHASE_DIVE = 2
@@ -1698,6 +1878,12 @@ class PathChaserProjectile(EnemyProjectile):
     Phase 2: La balle est lancee depuis le boss et rejoint chaque point en ligne droite.
              Apres le dernier point, elle quitte l'ecran dans la meme direction.
     """
+    __slots__ = (
+        "rng", "float_x", "float_y", "phase", "timer", "boss_x", "boss_y", "waypoints",
+        "visible_points", "current_target_index", "point_appear_frames", "dot_radius",
+        "dot_pulse_timer", "dot_lifetime", "flash_duration",
+    )
+
     PHASE_ANNOUNCE = 1  # Affichage des points
     PHASE_TRAVEL = 2    # La balle se deplace entre les points
     PHASE_EXIT = 3      # La balle quitte l'ecran
@@ -1705,7 +1891,8 @@ class PathChaserProjectile(EnemyProjectile):
     NUM_POINTS = 10
     ANNOUNCE_INTERVAL = 10  # Frames entre chaque apparition de point
 
-    def __init__(self, x, y, speed=9.0):
+    def __init__(self, x, y, speed=9.0, rng=None):
+        self.rng = rng if rng is not None else random
         TrailedProjectile.__init__(
             self,
             max_trail_length=15,
@@ -1747,8 +1934,8 @@ class PathChaserProjectile(EnemyProjectile):
         margin = 40  # Marge par rapport aux bords de l'ecran
 
         for i in range(self.NUM_POINTS):
-            new_x = random.uniform(margin, SCREEN_WIDTH - margin)
-            new_y = random.uniform(margin, SCREEN_HEIGHT - margin)
+            new_x = self.rng.uniform(margin, SCREEN_WIDTH - margin)
+            new_y = self.rng.uniform(margin, SCREEN_HEIGHT - margin)
             points.append((new_x, new_y))
 
         return points
@@ -1923,6 +2110,13 @@ class PathWanderProjectile(EnemyProjectile):
              un arc de cercle (sens horaire). Le diametre du cercle = distance entre
              les deux points consecutifs.
     """
+    __slots__ = (
+        "rng", "float_x", "float_y", "phase", "timer", "boss_x", "boss_y", "waypoints",
+        "visible_points", "current_target_index", "point_appear_frames", "dot_radius",
+        "dot_pulse_timer", "dot_lifetime", "flash_duration", "arc_center_x", "arc_center_y",
+        "arc_radius", "arc_start_angle", "arc_t", "arc_dt",
+    )
+
     PHASE_ANNOUNCE = 1
     PHASE_TRAVEL = 2
     PHASE_EXIT = 3
@@ -1930,7 +2124,8 @@ class PathWanderProjectile(EnemyProjectile):
     NUM_POINTS = 10
     ANNOUNCE_INTERVAL = 10
 
-    def __init__(self, x, y, speed=20.0):
+    def __init__(self, x, y, speed=20.0, rng=None):
+        self.rng = rng if rng is not None else random
         TrailedProjectile.__init__(
             self,
             max_trail_length=18,
@@ -1998,8 +2193,8 @@ class PathWanderProjectile(EnemyProjectile):
             x_min, x_max, y_min, y_max = quadrant_bounds[q]
 
             for _ in range(50):
-                px = random.uniform(x_min, x_max)
-                py = random.uniform(y_min, y_max)
+                px = self.rng.uniform(x_min, x_max)
+                py = self.rng.uniform(y_min, y_max)
 
                 if points:
                     prev_x, prev_y = points[-1]
@@ -2193,10 +2388,16 @@ class FieldDodgerProjectile(EnemyProjectile):
     la position initiale du joueur au moment du tir.
     La hitbox est toujours active meme quand la balle est invisible.
     """
+    __slots__ = (
+        "rng", "float_x", "float_y", "p0", "p2", "p1", "t", "dt", "timer", "is_visible",
+        "flash_alpha", "beyond_curve", "exit_dx", "exit_dy",
+    )
+
     FLASH_INTERVAL = 42   # 0.7s a 60 FPS
     FLASH_DURATION = 12   # 0.2s a 60 FPS
 
-    def __init__(self, boss_x, boss_y, player_x, player_y, speed=3.0):
+    def __init__(self, boss_x, boss_y, player_x, player_y, speed=3.0, rng=None):
+        self.rng = rng if rng is not None else random
         TrailedProjectile.__init__(
             self,
             max_trail_length=10,
@@ -2228,7 +2429,7 @@ class FieldDodgerProjectile(EnemyProjectile):
             dist = 1
         perp_x = -vy / dist
         perp_y = vx / dist
-        offset = dist * 0.5 * random.choice([-1, 1])
+        offset = dist * 0.5 * self.rng.choice([-1, 1])
         mid_x = (boss_x + player_x) / 2
         mid_y = (boss_y + player_y) / 2
         self.p1 = (mid_x + perp_x * offset, mid_y + perp_y * offset)
@@ -2327,6 +2528,8 @@ class FieldDodgerProjectile(EnemyProjectile):
 
 class Boss8Projectile(EnemyProjectile):
     """Projectile du Boss 8 - cristal bleu/cyan prismatique"""
+    __slots__ = ("timer",)
+
     def __init__(self, x, y, dx, dy, speed=5):
         TrailedProjectile.__init__(
             self,
@@ -2363,7 +2566,10 @@ class Boss8Projectile(EnemyProjectile):
 
 class CrystalShardProjectile(EnemyProjectile):
     """Fragment de cristal pointu du Boss 8"""
-    def __init__(self, x, y, dx, dy, speed=5):
+    __slots__ = ("rng", "rotation", "rotation_speed")
+
+    def __init__(self, x, y, dx, dy, speed=5, rng=None):
+        self.rng = rng if rng is not None else random
         TrailedProjectile.__init__(
             self,
             max_trail_length=8,
@@ -2382,7 +2588,7 @@ class CrystalShardProjectile(EnemyProjectile):
         self.dy = dy
         self.speed = speed
         self.rotation = 0
-        self.rotation_speed = random.uniform(5, 15) * (1 if random.random() > 0.5 else -1)
+        self.rotation_speed = self.rng.uniform(5, 15) * (1 if self.rng.random() > 0.5 else -1)
 
     def update(self):
         self.update_trail()
@@ -2400,7 +2606,10 @@ class CrystalShardProjectile(EnemyProjectile):
 
 class PrismBeamProjectile(EnemyProjectile):
     """Rayon prismatique arc-en-ciel du Boss 8"""
-    def __init__(self, x, y, dx, dy, speed=6):
+    __slots__ = ("rng", "timer", "color_phase")
+
+    def __init__(self, x, y, dx, dy, speed=6, rng=None):
+        self.rng = rng if rng is not None else random
         TrailedProjectile.__init__(
             self,
             max_trail_length=15,
@@ -2420,7 +2629,7 @@ class PrismBeamProjectile(EnemyProjectile):
         self.dy = dy
         self.speed = speed
         self.timer = 0
-        self.color_phase = random.uniform(0, 2 * math.pi)
+        self.color_phase = self.rng.uniform(0, 2 * math.pi)
 
     def update(self):
         self.timer += 1
@@ -2447,6 +2656,8 @@ class PrismBeamProjectile(EnemyProjectile):
 
 class ReflectingProjectile(EnemyProjectile):
     """Projectile qui rebondit sur les murs avec effet cristallin"""
+    __slots__ = ("reflections_left", "timer", "margin")
+
     def __init__(self, x, y, dx, dy, speed=5, reflections=3):
         TrailedProjectile.__init__(
             self,
@@ -2518,6 +2729,11 @@ class ReflectingProjectile(EnemyProjectile):
 
 class CrystalOrbProjectile(EnemyProjectile):
     """Orbe cristallin orbital du Boss 8 - cercle qui s'etend lineairement jusqu'a 2000px"""
+    __slots__ = (
+        "boss_ref", "orbit_angle", "orbit_radius", "radius_growth", "angular_velocity",
+        "color_offset", "timer", "dead",
+    )
+
     def __init__(self, boss_ref, angle, color_offset=0,
                  radius_growth=5.0, angular_vel=0.05):
         TrailedProjectile.__init__(
@@ -2619,6 +2835,8 @@ class CrystalOrbProjectile(EnemyProjectile):
 
 class Boss9Projectile(EnemyProjectile):
     """Projectile du Boss 9 - flamme void violette/noire"""
+    __slots__ = ("timer",)
+
     def __init__(self, x, y, dx, dy, speed=5):
         TrailedProjectile.__init__(
             self,
@@ -2654,7 +2872,10 @@ class Boss9Projectile(EnemyProjectile):
 
 class VoidFeatherProjectile(EnemyProjectile):
     """Plume void du Boss 9 - tourne en tombant"""
-    def __init__(self, x, y, dx, dy, speed=5):
+    __slots__ = ("rng", "base_image", "rotation", "rotation_speed", "wobble_timer", "wobble_amplitude")
+
+    def __init__(self, x, y, dx, dy, speed=5, rng=None):
+        self.rng = rng if rng is not None else random
         TrailedProjectile.__init__(
             self,
             max_trail_length=10,
@@ -2682,9 +2903,9 @@ class VoidFeatherProjectile(EnemyProjectile):
         self.dy = dy
         self.speed = speed
         self.rotation = 0
-        self.rotation_speed = random.uniform(3, 8) * (1 if random.random() > 0.5 else -1)
-        self.wobble_timer = random.uniform(0, math.pi * 2)
-        self.wobble_amplitude = random.uniform(0.5, 1.5)
+        self.rotation_speed = self.rng.uniform(3, 8) * (1 if self.rng.random() > 0.5 else -1)
+        self.wobble_timer = self.rng.uniform(0, math.pi * 2)
+        self.wobble_amplitude = self.rng.uniform(0.5, 1.5)
 
     def update(self):
         self.update_trail()
@@ -2706,7 +2927,10 @@ class VoidFeatherProjectile(EnemyProjectile):
 
 class SoulFireProjectile(EnemyProjectile):
     """Flamme d'ame du Boss 9 - change de couleur en volant"""
-    def __init__(self, x, y, dx, dy, speed=6):
+    __slots__ = ("rng", "timer", "color_phase")
+
+    def __init__(self, x, y, dx, dy, speed=6, rng=None):
+        self.rng = rng if rng is not None else random
         TrailedProjectile.__init__(
             self,
             max_trail_length=15,
@@ -2724,7 +2948,7 @@ class SoulFireProjectile(EnemyProjectile):
         self.dy = dy
         self.speed = speed
         self.timer = 0
-        self.color_phase = random.uniform(0, 2 * math.pi)
+        self.color_phase = self.rng.uniform(0, 2 * math.pi)
 
     def _get_flame_color(self):
         """Couleur de flamme qui pulse entre violet et orange"""
@@ -2762,6 +2986,8 @@ class SoulFireProjectile(EnemyProjectile):
 
 class AnnihilationOrbProjectile(EnemyProjectile):
     """Orbe d'annihilation du Boss 9 - gros, lent, et menacant"""
+    __slots__ = ("timer", "core_rotation", "outer_rotation")
+
     def __init__(self, x, y, dx, dy, speed=3):
         TrailedProjectile.__init__(
             self,
@@ -2831,6 +3057,8 @@ class AnnihilationOrbProjectile(EnemyProjectile):
 
 class PhoenixWaveProjectile(EnemyProjectile):
     """Onde de phoenix du Boss 9 - onde expansive en forme d'aile"""
+    __slots__ = ("center", "radius", "max_radius", "thickness", "timer")
+
     def __init__(self, x, y, speed=4):
         TrailedProjectile.__init__(
             self,
@@ -3,44 +3,65 @@ import random
 import math
 
 
+class ExplosionParticle:
+    """Particule d'explosion (slots : pas de dict par particule)"""
+    __slots__ = ("x", "y", "vx", "vy", "radius", "color")
+
+
 class Explosion:
-    def __init__(self, x, y, duration=300):
+    __slots__ = ("particles", "x", "y", "duration", "clock", "start_time", "max_radius", "_in_pool")
+
+    def __init__(self, x, y, duration=300, clock=None):
+        self.particles = []
+        self.reset(x, y, duration, clock)
+
+    def reset(self, x, y, duration=300, clock=None):
+        """(Ré)initialise l'explosion ; les particules existantes sont réutilisées"""
         self.x = x
         self.y = y
         self.duration = duration
-        self.start_time = pygame.time.get_ticks()
+        if clock is None:
+            # Sans horloge fournie : celle de la simulation en cours
+            # (import local : systems importe les boss, qui importent Explosion)
+            from systems import sim_clock
+            clock = sim_clock.current()
+        self.clock = clock
+        self.start_time = self.clock.get_ticks()
         self.max_radius = 30
 
-        self.particles = []
+        particles = self.particles
         num_particles = random.randint(8, 15)
-        for _ in range(num_particles):
+        for i in range(num_particles):
             angle = random.uniform(0, 2 * math.pi)
             speed = random.uniform(1, 4)
-            particle = {
-                'x': x,
-                'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'radius': random.randint(2, 6),
-                'color': random.choice([
-                    (255, 100, 0),
-                    (255, 150, 0),
-                    (255, 200, 50),
-                    (255, 50, 0),
-                ])
-            }
-            self.particles.append(particle)
+            if i < len(particles):
+                particle = particles[i]
+            else:
+                particle = ExplosionParticle()
+                particles.append(particle)
+            particle.x = x
+            particle.y = y
+            particle.vx = math.cos(angle) * speed
+            particle.vy = math.sin(angle) * speed
+            particle.radius = random.randint(2, 6)
+            particle.color = random.choice([
+                (255, 100, 0),
+                (255, 150, 0),
+                (255, 200, 50),
+                (255, 50, 0),
+            ])
+        del particles[num_particles:]
 
     def update(self):
         for p in self.particles:
-            p['x'] += p['vx']
-            p['y'] += p['vy']
-            p['vx'] *= 0.95
-            p['vy'] *= 0.95
-            p['radius'] = max(0, p['radius'] - 0.1)
+            p.x += p.vx
+            p.y += p.vy
+            p.vx *= 0.95
+            p.vy *= 0.95
+            p.radius = max(0, p.radius - 0.1)
 
     def draw(self, surface):
-        elapsed = pygame.time.get_ticks() - self.start_time
+        elapsed = self.clock.get_ticks() - self.start_time
         if elapsed > self.duration:
             return
         progress = elapsed / self.duration
@@ -77,12 +98,12 @@ class Explosion:
         surface.blit(explosion_surf, (self.x - center, self.y - center))
 
         for p in self.particles:
-            if p['radius'] > 0:
+            if p.radius > 0:
                 particle_alpha = int(alpha * 0.8)
-                color_with_alpha = (*p['color'], particle_alpha)
-                particle_surf = pygame.Surface((int(p['radius']*2), int(p['radius']*2)), pygame.SRCALPHA)
-                pygame.draw.circle(particle_surf, color_with_alpha, (int(p['radius']), int(p['radius'])), int(p['radius']))
-                surface.blit(particle_surf, (int(p['x'] - p['radius']), int(p['y'] - p['radius'])))
+                color_with_alpha = (*p.color, particle_alpha)
+                particle_surf = pygame.Surface((int(p.radius*2), int(p.radius*2)), pygame.SRCALPHA)
+                pygame.draw.circle(particle_surf, color_with_alpha, (int(p.radius), int(p.radius)), int(p.radius))
+                surface.blit(particle_surf, (int(p.x - p.radius), int(p.y - p.radius)))
 
     def is_finished(self):
-        return pygame.time.get_ticks() - self.start_time > self.duration
+        return self.clock.get_ticks() - self.start_time > self.duration
@@ -0,0 +1,99 @@
+"""Overlay de performances en jeu (F4) : temps d'image, temps par sous-système, compteurs d'entités.
+
+Les sous-systèmes sont chronométrés par systems.profiling uniquement
+pendant que l'overlay est affiché. Les valeurs sont des moyennes par
+image sur une fenêtre glissante d'une demi-seconde, pour rester lisibles.
+"""
+import pygame
+
+from config import FPS
+from systems.profiling import SubsystemTimer
+
+TOGGLE_KEY = pygame.K_F4
+
+# Nombre d'images par moyenne
+WINDOW = FPS // 2
+# Au-delà du budget d'une image à 60 FPS, la ligne passe en rouge
+FRAME_BUDGET_MS = 1000 / FPS
+
+TEXT_COLOR = (200, 255, 200)
+WARN_COLOR = (255, 120, 100)
+MUTED_COLOR = (150, 170, 150)
+
+
+class PerfHUD:
+    def __init__(self):
+        self.enabled = False
+        self.timer = SubsystemTimer()
+        self.font = None
+        self._frames = 0
+        self._frame_ms = 0.0
+        self._work_ms = 0.0
+        # Dernières moyennes par image (ms)
+        self.frame_ms = 0.0
+        self.work_ms = 0.0
+        self.subsystems = []
+
+    def enable(self, targets):
+        """targets : (objet, méthode, libellé) à chronométrer tant que l'overlay est affiché."""
+        for owner, method, name in targets:
+            self.timer.instrument(owner, method, name)
+        self.enabled = True
+
+    def disable(self):
+        self.timer.restore()
+        self.timer.totals.clear()
+        self._frames = 0
+        self._frame_ms = self._work_ms = 0.0
+        self.subsystems = []
+        self.enabled = False
+
+    def end_frame(self, frame_ms, work_ms):
+        """Fin d'image : durée totale (attente comprise) et temps de travail, en ms."""
+        self._frames += 1
+        self._frame_ms += frame_ms
+        self._work_ms += work_ms
+        if self._frames < WINDOW:
+            return
+        frames = self._frames
+        self.frame_ms = self._frame_ms / frames
+        self.work_ms = self._work_ms / frames
+        totals = self.timer.totals
+        self.subsystems = sorted(((name, seconds * 1000 / frames) for name, seconds in totals.items()),
+                                 key=lambda item: -item[1])
+        measured = sum(ms for _, ms in self.subsystems)
+        self.subsystems.append(("autre", max(0.0, self.work_ms - measured)))
+        self.timer.reset()
+        self._frames = 0
+        self._frame_ms = self._work_ms = 0.0
+
+    def draw(self, surface, counts):
+        """Affiche le panneau ; counts : libellé -> nombre d'entités."""
+        if self.font is None:
+            self.font = pygame.font.SysFont(None, 20)
+
+        fps = 1000 / self.frame_ms if self.frame_ms > 0 else 0
+        lines = [
+            (f"Image: {self.frame_ms:.1f} ms ({fps:.0f} FPS)", TEXT_COLOR),
+            (f"Travail: {self.work_ms:.2f} ms",
+             WARN_COLOR if self.work_ms > FRAME_BUDGET_MS else TEXT_COLOR),
+        ]
+        for name, ms in self.subsystems:
+            lines.append((f"  {name}: {ms:.2f} ms", MUTED_COLOR if ms < 0.05 else TEXT_COLOR))
+        lines.append(("", TEXT_COLOR))
+        for name, count in counts.items():
+            lines.append((f"{name}: {count}", TEXT_COLOR))
+
+        line_height = 17
+        panel_width = 250
+        panel_height = len(lines) * line_height + 10
+        panel_x = 10
+        panel_y = 95
+
+        panel = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        surface.blit(panel, (panel_x, panel_y))
+        for i, (line, color) in enumerate(lines):
+            if line:
+                text = self.font.render(line, True, color)
+                surface.blit(text, (panel_x + 8, panel_y + 5 + i * line_height))
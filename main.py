@@ -6,10 +6,13 @@ from screens.game_screen import GameScreen
 from screens.lobby import LobbyScreen
 from screens.multiplayer_game import MultiplayerGameScreen
 from graphics.shared_background import get_shared_background
+from systems import tracing
 
 
 def main():
     pygame.init()
+    # Traces de performance si SPACEWAVE_TRACE est défini (voir systems/tracing.py)
+    tracing.enable_from_env()
 
     # Créer le système d'affichage redimensionnable
     display = ScalableDisplay()
@@ -2,6 +2,7 @@
 
 import asyncio
 import threading
+import time
 import websockets
 from typing import Optional, Callable, Dict, List, Any
 from queue import Queue, Empty
@@ -11,6 +12,9 @@ from network.protocol import (
     msg_list_lobbies, msg_create_lobby, msg_join_lobby, msg_leave_lobby,
     msg_input, msg_ready
 )
+from network.diagnostics import NetworkStats, get_network_logger
+
+logger = get_network_logger("spacewave.client")
 
 
 class GameClient:
@@ -42,9 +46,14 @@ class GameClient:
             "timer": 0
         }
         self.game_started = False
+        self.game_seed = None  # Graine de la partie en cours (reproductibilité)
         self.game_over = False
         self.victory = False
 
+        # Diagnostics de connexion (RTT, cadence, débit...)
+        self.stats = NetworkStats()
+        self.ping_interval = 1.0
+
         # File de messages à envoyer
         self._send_queue: Queue = Queue()
 
@@ -64,7 +73,6 @@ class GameClient:
         self._network_thread.start()
 
         # Attendre la connexion (avec timeout)
-        import time
         for _ in range(50):  # 5 secondes max
             if self.connected or not self._running:
                 break
@@ -110,8 +118,9 @@ class GameClient:
             # Lancer les tâches de réception et d'envoi
             recv_task = asyncio.create_task(self._receive_loop())
             send_task = asyncio.create_task(self._send_loop())
+            ping_task = asyncio.create_task(self._ping_loop())
 
-            await asyncio.gather(recv_task, send_task)
+            await asyncio.gather(recv_task, send_task, ping_task)
 
         except ConnectionRefusedError:
             print(f"Impossible de se connecter à {host}")
@@ -125,7 +134,10 @@ class GameClient:
         try:
             async for message in self.websocket:
                 # WebSockets reçoit directement les messages complets
-                msg = Message.from_bytes(message.encode('utf-8') if isinstance(message, str) else message)
+                raw = message.encode('utf-8') if isinstance(message, str) else message
+                decode_start = time.perf_counter()
+                msg = Message.from_bytes(raw)
+                self.stats.record_message(len(raw), time.perf_counter() - decode_start)
                 self._process_message(msg)
 
         except asyncio.CancelledError:
@@ -153,6 +165,23 @@ class GameClient:
         except Exception as e:
             print(f"Erreur envoi: {e}")
 
+    async def _ping_loop(self):
+        """Mesure périodiquement le RTT via les ping/pong WebSocket."""
+        try:
+            while self._running and self.connected:
+                start = time.perf_counter()
+                pong_waiter = await self.websocket.ping()
+                await pong_waiter
+                self.stats.record_rtt(time.perf_counter() - start)
+                await asyncio.sleep(self.ping_interval)
+
+        except asyncio.CancelledError:
+            pass
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        except Exception as e:
+            logger.debug("Erreur ping: %s", e)
+
     async def _async_send(self, msg: Message):
         """Envoie un message au serveur."""
         if self.websocket:
@@ -160,8 +189,8 @@ class GameClient:
 
     def _process_message(self, msg: Message):
         """Traite un message reçu du serveur."""
-        # Debug: afficher tous les messages reçus
-        print(f"[CLIENT] Message reçu: {msg.type.value}")
+        # Debug: journaliser tous les messages reçus (désactivé par défaut)
+        logger.debug("Message reçu: %s", msg.type.value)
 
         # === Gestion des lobbies ===
 
@@ -211,9 +240,11 @@ class GameClient:
 
         elif msg.type == MessageType.GAME_START:
             self.game_started = True
+            self.game_seed = msg.data.get("seed")
             print("La partie commence !")
 
         elif msg.type == MessageType.STATE:
+            self.stats.record_snapshot(msg.data.get("timer", 0))
             self.game_state = {
                 "players": msg.data.get("players", []),
                 "enemies": msg.data.get("enemies", []),
@@ -240,11 +271,11 @@ class GameClient:
             self.lobbies_updated = False
             self._send_queue.put(msg_list_lobbies())
 
-    def create_lobby(self, player_name: str, lobby_name: str):
+    def create_lobby(self, player_name: str, lobby_name: str, seed: Optional[int] = None):
         """Crée un nouveau lobby."""
         if self.connected:
             self.lobby_error = None
-            self._send_queue.put(msg_create_lobby(player_name, lobby_name))
+            self._send_queue.put(msg_create_lobby(player_name, lobby_name, seed))
 
     def join_lobby(self, player_name: str, lobby_id: str):
         """Rejoint un lobby existant."""
@@ -0,0 +1,129 @@
+"""Diagnostics réseau côté client (qualité de connexion et journalisation)."""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+# Variable d'environnement pour activer les logs détaillés du réseau
+NET_DEBUG_ENV = "SPACEWAVE_NET_DEBUG"
+
+
+def get_network_logger(name: str) -> logging.Logger:
+    """Retourne un logger réseau, silencieux par défaut.
+
+    Les messages de niveau DEBUG (un par message reçu) ne sont émis que si
+    la variable d'environnement SPACEWAVE_NET_DEBUG est définie.
+    """
+    logger = logging.getLogger(name)
+    if os.environ.get(NET_DEBUG_ENV) and not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("[%(name)s] %(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+    return logger
+
+
+class NetworkStats:
+    """Statistiques de connexion mesurées sur une fenêtre glissante.
+
+    Alimentée par le thread réseau du client et lue par l'écran de jeu,
+    d'où le verrou autour des fenêtres glissantes.
+    """
+
+    def __init__(self, window: float = 1.0, tick_rate: int = 60):
+        self.window = window
+        self.expected_interval = 1.0 / tick_rate
+        self._lock = threading.Lock()
+
+        # (horodatage, taille en octets, temps de décodage en secondes)
+        self._messages: Deque[Tuple[float, int, float]] = deque()
+        # Horodatages de réception des snapshots STATE
+        self._snapshots: Deque[float] = deque()
+
+        self.rtt: Optional[float] = None
+        self.dropped_snapshots = 0
+        self.late_snapshots = 0
+        self.last_server_timer: Optional[int] = None
+        self.last_snapshot_time: Optional[float] = None
+
+        # Snapshots reçus depuis la dernière lecture par l'écran
+        self._pending_snapshots = 0
+        self.buffer_depth = 0
+
+    def _prune(self, now: float):
+        limit = now - self.window
+        while self._messages and self._messages[0][0] < limit:
+            self._messages.popleft()
+        while self._snapshots and self._snapshots[0] < limit:
+            self._snapshots.popleft()
+
+    def record_message(self, size: int, decode_time: float):
+        """Enregistre un message reçu (taille brute et temps de décodage)."""
+        now = time.perf_counter()
+        with self._lock:
+            self._messages.append((now, size, decode_time))
+            self._prune(now)
+
+    def record_snapshot(self, server_timer: int):
+        """Enregistre un snapshot STATE et détecte les pertes et retards."""
+        now = time.perf_counter()
+        with self._lock:
+            # Chaque snapshot compte au plus une fois : une perte allonge aussi
+            # l'intervalle d'arrivée, qui ne doit pas la compter en retard
+            if self.last_server_timer is not None:
+                gap = server_timer - self.last_server_timer
+                if gap > 1:
+                    self.dropped_snapshots += gap - 1
+                elif gap <= 0:
+                    # Snapshot hors d'ordre ou dupliqué
+                    self.late_snapshots += 1
+                elif now - self.last_snapshot_time > 2 * self.expected_interval:
+                    # Snapshot suivant arrivé en retard
+                    self.late_snapshots += 1
+            if self.last_server_timer is None or server_timer > self.last_server_timer:
+                self.last_server_timer = server_timer
+            self.last_snapshot_time = now
+            self._snapshots.append(now)
+            self._pending_snapshots += 1
+            self._prune(now)
+
+    def record_rtt(self, rtt: float):
+        """Enregistre un aller-retour ping/pong (lissé exponentiellement)."""
+        if self.rtt is None:
+            self.rtt = rtt
+        else:
+            self.rtt = self.rtt * 0.8 + rtt * 0.2
+
+    def consume_snapshots(self) -> int:
+        """Appelé une fois par frame : retourne le nombre de snapshots en attente.
+
+        0 signifie que la frame n'a reçu aucun nouvel état (famine),
+        plus de 1 que des snapshots ont été écrasés avant d'être affichés.
+        """
+        with self._lock:
+            self.buffer_depth = self._pending_snapshots
+            self._pending_snapshots = 0
+        return self.buffer_depth
+
+    def summary(self) -> Dict[str, float]:
+        """Retourne les métriques agrégées pour l'affichage."""
+        now = time.perf_counter()
+        with self._lock:
+            self._prune(now)
+            messages = list(self._messages)
+            snapshot_count = len(self._snapshots)
+
+        total_bytes = sum(size for _, size, _ in messages)
+        decode_avg = (sum(d for _, _, d in messages) / len(messages)) if messages else 0.0
+        return {
+            "rtt_ms": self.rtt * 1000 if self.rtt is not None else -1.0,
+            "snapshot_rate": snapshot_count / self.window,
+            "decode_ms": decode_avg * 1000,
+            "bytes_per_s": total_bytes / self.window,
+            "dropped": self.dropped_snapshots,
+            "late": self.late_snapshots,
+            "buffer_depth": self.buffer_depth,
+        }
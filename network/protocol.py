@@ -116,9 +116,9 @@ def msg_list_lobbies() -> Message:
     return Message(MessageType.LIST_LOBBIES)
 
 
-def msg_create_lobby(player_name: str, lobby_name: str) -> Message:
-    """Crée un nouveau lobby."""
-    return Message(MessageType.CREATE_LOBBY, player_name=player_name, lobby_name=lobby_name)
+def msg_create_lobby(player_name: str, lobby_name: str, seed: Optional[int] = None) -> Message:
+    """Crée un nouveau lobby (graine optionnelle pour rejouer une partie)."""
+    return Message(MessageType.CREATE_LOBBY, player_name=player_name, lobby_name=lobby_name, seed=seed)
 
 
 def msg_join_lobby(player_name: str, lobby_id: str) -> Message:
@@ -178,9 +178,9 @@ def msg_player_left(player_id: int) -> Message:
     return Message(MessageType.PLAYER_LEFT, player_id=player_id)
 
 
-def msg_game_start() -> Message:
-    """La partie commence."""
-    return Message(MessageType.GAME_START)
+def msg_game_start(seed: Optional[int] = None) -> Message:
+    """La partie commence (avec la graine de la simulation)."""
+    return Message(MessageType.GAME_START, seed=seed)
 
 
 def msg_state(
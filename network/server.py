@@ -1,9 +1,9 @@
 """Serveur de jeu multijoueur avec gestion des lobbies."""
 
 import asyncio
-import random
 import uuid
 import pygame
+import signal
 import sys
 import os
 import websockets
@@ -13,21 +13,13 @@ from dataclasses import dataclass, field
 # Ajouter le répertoire parent au PYTHONPATH pour trouver config
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config import SCREEN_WIDTH, SCREEN_HEIGHT
-from systems.level import Level
 from entities.player import Player
-from entities.enemy import (
-    Enemy, BasicEnemy, FormationVEnemy, FormationLineEnemy,
-    SineWaveEnemy, ZigZagEnemy, SwoopEnemy, HorizontalEnemy,
-    ShootingEnemy, TankEnemy, DashEnemy, SplitterEnemy
-)
-from entities.bosses import Boss, Boss2, Boss3, Boss4, Boss5, Boss6
-from entities.powerup import PowerUp
-from entities.projectiles import (
-    Projectile, HomingProjectile, SplittingProjectile,
-    MirrorProjectile, BlackHoleProjectile, PulseWaveProjectile
-)
-from graphics.effects import Explosion
+from entities.enemy import DashEnemy, SplitterEnemy
+from entities.bosses import Boss3, Boss4
+from systems.world import World
+from systems.enemy_registry import kind_of
+from systems.replay import InputRecorder, save_if_enabled
+from systems import memory, tracing
 from network.protocol import (
     Message, MessageType,
     msg_lobby_list, msg_lobby_created, msg_lobby_joined, msg_lobby_update, msg_lobby_error,
@@ -73,18 +65,20 @@ class GameLobby:
     host_id: int
     max_players: int = 2
     players: Dict[int, ServerPlayer] = field(default_factory=dict)
+    # Graine de la partie (None = tirée au hasard au démarrage)
+    seed: Optional[int] = None
 
     # État du jeu (None si pas encore démarré)
-    level: Level = None
-    projectiles: List = field(default_factory=list)
-    enemy_projectiles: List = field(default_factory=list)
-    explosions: List = field(default_factory=list)
-    powerups: List = field(default_factory=list)
+    world: Optional[World] = None
 
     game_started: bool = False
     game_over: bool = False
     victory: bool = False
 
+    # Enregistrement des inputs (ordre des joueurs figé au démarrage)
+    recorder: Optional[InputRecorder] = None
+    player_slots: List[int] = field(default_factory=list)
+
     def to_dict(self):
         host = self.players.get(self.host_id)
         return {
@@ -188,7 +182,8 @@ class GameServer:
             lobby = GameLobby(
                 lobby_id=lobby_id,
                 name=lobby_name,
-                host_id=player_id
+                host_id=player_id,
+                seed=msg.data.get("seed")
             )
             self.lobbies[lobby_id] = lobby
 
@@ -273,6 +268,8 @@ class GameServer:
         if player_id in lobby.players:
             del lobby.players[player_id]
 
+        if lobby.world and player.player:
+            lobby.world.remove_player(player.player)
         player.lobby_id = None
         player.ready = False
         player.player = None
@@ -283,8 +280,16 @@ class GameServer:
 
         # Supprimer le lobby s'il est vide
         if not lobby.players:
+            if lobby.game_started:
+                save_if_enabled(lobby.recorder, f"lobby-{lobby.lobby_id}")
             del self.lobbies[lobby.lobby_id]
             print(f"Lobby '{lobby.name}' supprimé (vide)")
+            tracker = memory.tracker()
+            if tracker:
+                # Plus aucune référence au lobby : sa partie doit être libérée
+                label = f"lobby '{lobby.name}' supprimé"
+                del lobby
+                tracker.checkpoint(label)
         elif lobby.host_id == player_id:
             # Transférer l'hôte au premier joueur restant
             new_host_id = next(iter(lobby.players.keys()))
@@ -301,29 +306,25 @@ class GameServer:
         """Démarre une partie dans un lobby."""
         print(f"Démarrage de la partie dans le lobby '{lobby.name}'")
 
-        # Initialiser le niveau
-        lobby.level = Level()
-        lobby.projectiles = []
-        lobby.enemy_projectiles = []
-        lobby.explosions = []
-        lobby.powerups = []
+        # Créer la simulation AVANT de démarrer le jeu (évite condition de course)
+        # Mode headless=True car le serveur n'a pas besoin des sprites
+        lobby.player_slots = list(lobby.players.keys())
+        lobby.world = World(num_players=len(lobby.player_slots), seed=lobby.seed,
+                            headless=True, combo_enabled=False)
+        print(f"Graine de la partie : {lobby.world.level.seed}")
         lobby.game_over = False
         lobby.victory = False
 
-        # Créer les joueurs AVANT de démarrer le jeu (évite condition de course)
-        # Mode headless=True car le serveur n'a pas besoin des sprites
-        positions = [
-            (SCREEN_WIDTH // 3, SCREEN_HEIGHT - 100),
-            (2 * SCREEN_WIDTH // 3, SCREEN_HEIGHT - 100)
-        ]
-        for i, (pid, sp) in enumerate(lobby.players.items()):
-            x, y = positions[i] if i < len(positions) else (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100)
-            sp.player = Player(x, y, player_id=i + 1, is_local=True, headless=True)
+        for pid, player in zip(lobby.player_slots, lobby.world.players):
+            lobby.players[pid].player = player
+
+        lobby.recorder = InputRecorder(lobby.world.level.seed, mode="lobby",
+                                       players=len(lobby.player_slots))
 
         # Marquer le jeu comme démarré seulement après avoir créé les joueurs
         lobby.game_started = True
 
-        await self._broadcast_to_lobby(lobby, msg_game_start())
+        await self._broadcast_to_lobby(lobby, msg_game_start(lobby.world.level.seed))
 
     async def _game_loop(self):
         """Boucle principale du jeu pour tous les lobbies."""
@@ -337,346 +338,54 @@ class GameServer:
                         lobby.game_over = True
                         print(f"[DEBUG] GAME_OVER envoyé au lobby '{lobby.name}'")
                         await self._broadcast_to_lobby(lobby, msg_game_over())
+                        save_if_enabled(lobby.recorder, f"lobby-{lobby.lobby_id}")
                     elif self._check_victory(lobby):
                         lobby.victory = True
                         await self._broadcast_to_lobby(lobby, msg_victory())
+                        save_if_enabled(lobby.recorder, f"lobby-{lobby.lobby_id}")
 
             await asyncio.sleep(1 / self.tick_rate)
 
     def _update_lobby_game(self, lobby: GameLobby):
         """Met à jour la logique du jeu pour un lobby."""
-        # Mettre à jour les joueurs
-        for sp in lobby.players.values():
-            if sp.player:
-                if sp.player.is_crashing:
-                    # Mettre à jour l'animation de crash
-                    crash_finished = sp.player.update()
-                    if crash_finished:
-                        sp.player.is_crashing = False
-                        print(f"[DEBUG] Player {sp.player_id} a fini son animation de crash")
-                elif sp.player.hp > 0:
-                    # Logique normale
-                    sp.player.dx = sp.dx
-                    sp.player.dy = sp.dy
-                    sp.player.update()
-
-                    if sp.shoot:
-                        sp.player.shoot(lobby.projectiles)
-
-        # Mettre à jour le niveau
-        lobby.level.update()
-
-        # Mettre à jour les ennemis
-        self._update_enemies(lobby)
-
-        # Mettre à jour les projectiles
-        self._update_projectiles(lobby)
-
-        # Mettre à jour les powerups
-        self._update_powerups(lobby)
-
-        # Mettre à jour les explosions
-        self._update_explosions(lobby)
-
-        # Vérifier les collisions
-        self._check_collisions(lobby)
-
-    def _update_enemies(self, lobby: GameLobby):
-        """Met à jour les ennemis."""
-        player_centers = [
-            sp.player.rect.center for sp in lobby.players.values()
-            if sp.player and sp.player.hp > 0
-        ]
-        if not player_centers:
-            return
+        frame = self._lobby_inputs(lobby)
+        if lobby.recorder:
+            lobby.recorder.record(frame)
 
-        for enemy in lobby.level.enemies[:]:
-            # Cibler le joueur le plus proche
-            target = min(player_centers, key=lambda p: abs(p[0] - enemy.rect.centerx))
-
-            if isinstance(enemy, Boss6):
-                result = enemy.update(target, lobby.enemy_projectiles)
-                if result is True:
-                    lobby.level.enemies.remove(enemy)
-                    self._create_boss_explosions(lobby, enemy, 40, 200, 1200)
-                    lobby.victory = True
-            elif isinstance(enemy, Boss5):
-                result = enemy.update(target, lobby.enemy_projectiles)
-                if result is True:
-                    lobby.level.enemies.remove(enemy)
-                    self._create_boss_explosions(lobby, enemy, 30, 180, 1000)
-                    lobby.level.boss5_defeated = True
-            elif isinstance(enemy, Boss4):
-                result = enemy.update(target, lobby.enemy_projectiles)
-                if result is True:
-                    lobby.level.enemies.remove(enemy)
-                    self._create_boss_explosions(lobby, enemy, 20, 160, 800)
-                    lobby.level.boss4_defeated = True
-            elif isinstance(enemy, Boss3):
-                result = enemy.update(target, lobby.enemy_projectiles)
-                if result is True:
-                    lobby.level.enemies.remove(enemy)
-                    self._create_boss_explosions(lobby, enemy, 12, 140, 700)
-                    lobby.level.boss3_defeated = True
-            elif isinstance(enemy, Boss2):
-                result = enemy.update(target, lobby.enemy_projectiles)
-                if result is True:
-                    lobby.level.enemies.remove(enemy)
-                    self._create_boss_explosions(lobby, enemy, 8, 120, 600)
-                    lobby.level.boss2_defeated = True
-            elif isinstance(enemy, Boss):
-                # Pour Boss1, passer les positions des deux joueurs séparément
-                # On récupère les joueurs vivants dans l'ordre
-                alive_players = [sp for sp in sorted(lobby.players.values(), key=lambda p: p.player_id)
-                                if sp.player and sp.player.hp > 0]
-                player1_pos = alive_players[0].player.rect.center if len(alive_players) > 0 else None
-                player2_pos = alive_players[1].player.rect.center if len(alive_players) > 1 else None
-                result = enemy.update(player1_pos, lobby.enemy_projectiles, player2_pos)
-                if result is True:
-                    lobby.level.enemies.remove(enemy)
-                    self._create_boss_explosions(lobby, enemy, 5, 100, 500)
-                    lobby.level.boss1_defeated = True
-            elif isinstance(enemy, ShootingEnemy):
-                enemy.update(target, lobby.enemy_projectiles)
-            elif isinstance(enemy, DashEnemy):
-                # DashEnemy a besoin de la position du joueur pour calculer sa trajectoire
-                enemy.update_with_player(target)
-            elif isinstance(enemy, (TankEnemy, SplitterEnemy)):
-                # Ces ennemis utilisent la méthode update standard
-                enemy.update()
-
-    def _create_boss_explosions(self, lobby: GameLobby, enemy, count: int, size: int, duration: int):
-        """Crée des explosions à la mort d'un boss."""
-        for _ in range(count):
-            rand_x = enemy.rect.left + random.randint(0, size)
-            rand_y = enemy.rect.top + random.randint(0, size)
-            lobby.explosions.append({
-                "x": rand_x,
-                "y": rand_y,
-                "duration": duration,
-                "start_time": pygame.time.get_ticks()
-            })
-
-    def _update_projectiles(self, lobby: GameLobby):
-        """Met à jour tous les projectiles."""
-        # Projectiles des joueurs
-        for proj in lobby.projectiles:
-            proj.update()
-        lobby.projectiles = [p for p in lobby.projectiles if p.rect.bottom > 0]
-
-        # Projectiles ennemis
-        player_centers = [
-            sp.player.rect.center for sp in lobby.players.values()
-            if sp.player and sp.player.hp > 0
-        ]
-
-        for e_proj in lobby.enemy_projectiles:
-            if isinstance(e_proj, HomingProjectile) and player_centers:
-                target = min(player_centers, key=lambda p: abs(p[0] - e_proj.rect.centerx))
-                e_proj.update(target)
-            else:
-                e_proj.update()
-
-        # Gérer les projectiles qui se divisent
-        new_split = []
-        for e_proj in lobby.enemy_projectiles:
-            if isinstance(e_proj, SplittingProjectile) and e_proj.should_split():
-                new_split.extend(e_proj.split())
-            elif isinstance(e_proj, MirrorProjectile) and e_proj.should_split():
-                new_split.extend(e_proj.split())
-        lobby.enemy_projectiles.extend(new_split)
-
-        # Filtrer projectiles hors écran et expirés
-        lobby.enemy_projectiles = [p for p in lobby.enemy_projectiles if (
-            p.rect.top < SCREEN_HEIGHT and p.rect.left < SCREEN_WIDTH and
-            p.rect.right > 0 and p.rect.bottom > 0 and
-            not (isinstance(p, HomingProjectile) and p.is_expired()) and
-            not (isinstance(p, BlackHoleProjectile) and p.is_expired()) and
-            not (isinstance(p, PulseWaveProjectile) and p.is_expired())
-        )]
-
-    def _update_powerups(self, lobby: GameLobby):
-        """Met à jour les powerups."""
-        for powerup in lobby.powerups:
-            powerup.update()
-        lobby.powerups = [p for p in lobby.powerups if p.rect.top < SCREEN_HEIGHT]
-
-    def _update_explosions(self, lobby: GameLobby):
-        """Met à jour les explosions."""
-        current_time = pygame.time.get_ticks()
-        lobby.explosions = [
-            exp for exp in lobby.explosions
-            if current_time - exp["start_time"] < exp["duration"]
-        ]
-
-    def _check_collisions(self, lobby: GameLobby):
-        """Vérifie toutes les collisions."""
-        # Projectiles joueurs vs ennemis
-        for proj in lobby.projectiles[:]:
-            for enemy in lobby.level.enemies[:]:
-                if proj.rect.colliderect(enemy.rect):
-                    if isinstance(enemy, (Boss, Boss2, Boss3, Boss4, Boss5, Boss6)):
-                        if enemy.is_dying:
-                            continue
-                        enemy.take_damage(1)
-                        if enemy.hp <= 0 and not enemy.is_dying:
-                            enemy.is_dying = True
-                    else:
-                        # Décrémenter les HP de l'ennemi
-                        enemy.hp -= 1
-
-                        # Si l'ennemi est mort, le retirer
-                        if enemy.hp <= 0:
-                            # Drop de powerup
-                            if hasattr(enemy, 'drops_powerup') and enemy.drops_powerup:
-                                power_types = ['double', 'triple', 'spread']
-                                powerup = PowerUp(enemy.rect.centerx, enemy.rect.centery, random.choice(power_types))
-                                lobby.powerups.append(powerup)
-
-                            # Gestion de la division des SplitterEnemy
-                            if isinstance(enemy, SplitterEnemy) and not enemy.is_mini:
-                                mini_enemies = enemy.split()
-                                lobby.level.enemies.extend(mini_enemies)
-
-                            lobby.level.enemies.remove(enemy)
-
-                    # Créer une explosion d'impact (même si l'ennemi survit)
-                    lobby.explosions.append({
-                        "x": enemy.rect.centerx,
-                        "y": enemy.rect.centery,
-                        "duration": 300,
-                        "start_time": pygame.time.get_ticks()
-                    })
-
-                    if proj in lobby.projectiles:
-                        lobby.projectiles.remove(proj)
-                    break
-
-        # Projectiles ennemis vs joueurs
-        for e_proj in lobby.enemy_projectiles[:]:
-            for sp in lobby.players.values():
-                if not sp.player or sp.player.invulnerable or sp.player.hp <= 0:
-                    continue
-
-                hit = False
-                if isinstance(e_proj, PulseWaveProjectile):
-                    if e_proj.check_collision(sp.player.rect):
-                        hit = True
-                elif e_proj.rect.colliderect(sp.player.rect):
-                    hit = True
-                    if e_proj in lobby.enemy_projectiles:
-                        lobby.enemy_projectiles.remove(e_proj)
-
-                if hit:
-                    sp.player.hp -= 1
-                    if sp.player.hp <= 0 and not sp.player.is_crashing:
-                        sp.player.start_crash()
-                    else:
-                        sp.player.invulnerable = True
-                        sp.player.invuln_start = pygame.time.get_ticks()
-                    break
-
-        # Ennemis vs joueurs
-        for enemy in lobby.level.enemies:
-            for sp in lobby.players.values():
-                if not sp.player or sp.player.invulnerable or sp.player.hp <= 0:
-                    continue
-                if isinstance(enemy, (Boss, Boss2, Boss3, Boss4, Boss5, Boss6)) and enemy.is_dying:
-                    continue
-
-                if enemy.rect.colliderect(sp.player.rect):
-                    damage = 3 if isinstance(enemy, Boss4) and enemy.charging else 1
-                    sp.player.hp -= damage
-                    if sp.player.hp <= 0 and not sp.player.is_crashing:
-                        sp.player.start_crash()
-                    else:
-                        sp.player.invulnerable = True
-                        sp.player.invuln_start = pygame.time.get_ticks()
-
-                    # Les ennemis perdent aussi des HP lors du contact
-                    if isinstance(enemy, (Boss, Boss2, Boss3, Boss4, Boss5, Boss6)):
-                        enemy.take_damage(sp.player.contact_damage)
-                        if enemy.hp <= 0 and not enemy.is_dying:
-                            enemy.is_dying = True
-                    else:
-                        enemy.hp -= sp.player.contact_damage
-                        # Si l'ennemi non-boss est mort, le retirer
-                        if enemy.hp <= 0:
-                            if hasattr(enemy, 'drops_powerup') and enemy.drops_powerup:
-                                power_types = ['double', 'triple', 'spread']
-                                powerup = PowerUp(enemy.rect.centerx, enemy.rect.centery, random.choice(power_types))
-                                lobby.powerups.append(powerup)
-
-                            # Gestion de la division des SplitterEnemy
-                            if isinstance(enemy, SplitterEnemy) and not enemy.is_mini:
-                                mini_enemies = enemy.split()
-                                lobby.level.enemies.extend(mini_enemies)
-
-                            if enemy in lobby.level.enemies:
-                                lobby.level.enemies.remove(enemy)
-
-                    # Explosion de contact
-                    lobby.explosions.append({
-                        "x": (sp.player.rect.centerx + enemy.rect.centerx) // 2,
-                        "y": (sp.player.rect.centery + enemy.rect.centery) // 2,
-                        "duration": 300,
-                        "start_time": pygame.time.get_ticks()
-                    })
-
-        # Powerups vs joueurs
-        for powerup in lobby.powerups[:]:
-            for sp in lobby.players.values():
-                if sp.player and powerup.rect.colliderect(sp.player.rect):
-                    sp.player.apply_powerup(powerup.power_type)
-                    if powerup in lobby.powerups:
-                        lobby.powerups.remove(powerup)
-                    break
-
-        # Laser Boss3
-        for enemy in lobby.level.enemies:
-            if isinstance(enemy, Boss3) and enemy.laser_active:
-                laser_rect = pygame.Rect(enemy.laser_target_x - 25, 0, 50, SCREEN_HEIGHT)
-                for sp in lobby.players.values():
-                    if sp.player and not sp.player.invulnerable and sp.player.hp > 0:
-                        if sp.player.rect.colliderect(laser_rect):
-                            sp.player.hp -= 2
-                            if sp.player.hp <= 0 and not sp.player.is_crashing:
-                                sp.player.start_crash()
-                            else:
-                                sp.player.invulnerable = True
-                                sp.player.invuln_start = pygame.time.get_ticks()
+        inputs = {
+            slot + 1: inp for slot, inp in enumerate(frame) if inp is not None
+        }
+        lobby.world.step(inputs)
+
+    def _lobby_inputs(self, lobby: GameLobby) -> Tuple:
+        """Inputs du tick par joueur (None pour un joueur parti)."""
+        frame = []
+        for pid in lobby.player_slots:
+            sp = lobby.players.get(pid)
+            frame.append((sp.dx, sp.dy, sp.shoot) if sp and sp.player else None)
+        return tuple(frame)
 
     def _check_game_over(self, lobby: GameLobby) -> bool:
         """Vérifie si tous les joueurs sont morts ET ont terminé leur animation de crash."""
-        all_dead = True
-        for sp in lobby.players.values():
-            if sp.player is None:
-                continue
-            # Le joueur est considéré "vivant" s'il a des HP ou si son crash n'est pas terminé
-            if sp.player.hp > 0 or sp.player.is_crashing:
-                all_dead = False
-        if all_dead:
-            print(f"[DEBUG CHECK] Tous les joueurs sont morts et ont fini de crasher -> GAME OVER")
-        return all_dead
+        return lobby.world is not None and lobby.world.game_over
 
     def _check_victory(self, lobby: GameLobby) -> bool:
-        """Vérifie si le Boss 6 est vaincu."""
-        if not lobby.level:
-            return False
-        return (
-            lobby.level.boss5_defeated and
-            lobby.level.boss6_spawned and
-            not any(isinstance(e, Boss6) for e in lobby.level.enemies)
-        )
+        """Vérifie si le Boss 9 est vaincu."""
+        return lobby.world is not None and lobby.world.victory
 
     async def _broadcast_lobby_state(self, lobby: GameLobby):
         """Envoie l'état complet du jeu à tous les joueurs d'un lobby."""
+        await self._broadcast_to_lobby(lobby, self._state_message(lobby))
+
+    def _state_message(self, lobby: GameLobby) -> Message:
+        """Construit le message STATE d'un lobby (snapshot complet de la partie)."""
         # Sérialiser les joueurs
         players_data = [sp.to_dict() for sp in lobby.players.values()]
 
         # Sérialiser les ennemis
         enemies_data = []
-        for enemy in lobby.level.enemies:
+        world = lobby.world
+        for enemy in world.level.enemies:
             enemy_type = type(enemy).__name__
             enemy_data = {
                 "enemy_id": id(enemy),
@@ -688,7 +397,7 @@ class GameServer:
                 "speed": getattr(enemy, 'speed', 3)
             }
             # Données d'animation pour tous les boss
-            if isinstance(enemy, (Boss, Boss2, Boss3, Boss4, Boss5, Boss6)):
+            if kind_of(enemy).is_boss:
                 enemy_data["damage_animation_active"] = getattr(enemy, 'damage_animation_active', False)
                 enemy_data["animation_active"] = getattr(enemy, 'animation_active', False)
             # Données spécifiques aux boss
@@ -712,7 +421,7 @@ class GameServer:
             "x": proj.rect.centerx,
             "y": proj.rect.centery,
             "proj_type": type(proj).__name__
-        } for proj in lobby.projectiles]
+        } for proj in world.projectiles]
 
         enemy_projs_data = [{
             "proj_id": id(proj),
@@ -720,28 +429,39 @@ class GameServer:
             "y": proj.rect.centery,
             "proj_type": type(proj).__name__,
             "radius": getattr(proj, 'radius', 5)
-        } for proj in lobby.enemy_projectiles]
+        } for proj in world.enemy_projectiles]
+        enemy_projs_data.extend({
+            "proj_id": bullet_id,
+            "x": x,
+            "y": y,
+            "proj_type": proj_type,
+            "radius": 5
+        } for bullet_id, x, y, proj_type in world.bullet_pool.snapshot())
 
         # Sérialiser les powerups
         powerups_data = [{
             "x": powerup.rect.centerx,
             "y": powerup.rect.centery,
             "power_type": powerup.power_type
-        } for powerup in lobby.powerups]
+        } for powerup in world.powerups]
 
-        # Explosions (déjà en format dict)
-        explosions_data = lobby.explosions
+        # Sérialiser les explosions
+        explosions_data = [{
+            "x": exp.x,
+            "y": exp.y,
+            "duration": exp.duration,
+            "start_time": exp.start_time
+        } for exp in world.explosions]
 
-        msg = msg_state(
+        return msg_state(
             players=players_data,
             enemies=enemies_data,
             projectiles=projs_data,
             enemy_projectiles=enemy_projs_data,
             powerups=powerups_data,
             explosions=explosions_data,
-            timer=lobby.level.timer if lobby.level else 0
+            timer=world.level.timer
         )
-        await self._broadcast_to_lobby(lobby, msg)
 
     async def _broadcast_to_lobby(self, lobby: GameLobby, msg: Message, exclude: Optional[int] = None):
         """Envoie un message à tous les joueurs d'un lobby."""
@@ -757,12 +477,25 @@ class GameServer:
         await websocket.send(msg.to_bytes())
 
 
+# Points de trace propres au serveur (en plus de ceux de la simulation)
+SERVER_TRACE_POINTS = (
+    (GameServer, "_update_lobby_game", "serveur"),
+    (GameServer, "_broadcast_lobby_state", "serveur"),
+)
+
+
 async def run_server(host: str = "0.0.0.0", port: int = 5555):
     """Lance le serveur de jeu."""
     # Initialiser pygame avec un display minimal (nécessaire pour convert_alpha)
     pygame.init()
     pygame.display.set_mode((1, 1), pygame.HIDDEN)
 
+    # Traces de performance si SPACEWAVE_TRACE est défini ; SIGUSR1 écrit la trace en cours
+    if tracing.enable_from_env(SERVER_TRACE_POINTS) and hasattr(signal, "SIGUSR1"):
+        asyncio.get_running_loop().add_signal_handler(signal.SIGUSR1, tracing.dump)
+    # Suivi mémoire à chaque suppression de lobby si SPACEWAVE_MEMORY est défini
+    memory.enable_from_env()
+
     server = GameServer(host, port)
     await server.start()
 
@@ -1,6 +1,54 @@
 import pygame
 from abc import ABC, abstractmethod
 
+from config import FPS, MAX_RENDER_FPS, MAX_CATCH_UP_STEPS
+from systems import tracing
+
+# Écrit la trace en cours (si le tracing est actif)
+TRACE_DUMP_KEY = pygame.K_F9
+
+# Au-delà de ce déplacement entre deux ticks (téléportation, respawn), pas d'interpolation
+MAX_INTERPOLATED_MOVE = 100
+
+
+class RenderInterpolator:
+    """Affiche les entités entre leur position du tick précédent et l'actuelle.
+
+    capture() mémorise les positions avant un tick de simulation ; pendant
+    draw(), apply() déplace temporairement les rects à la position
+    interpolée puis restore() remet les positions de la simulation.
+
+    previous garde une référence à chaque objet capturé : un objet détruit
+    pendant le tick ne peut pas être libéré et voir son id() repris par un
+    objet créé dans le même tick (qui partirait alors de sa position).
+    """
+    def __init__(self):
+        self.previous = {}
+        self._moved = []
+
+    def capture(self, objects):
+        self.previous = {id(obj): (obj, obj.rect.topleft) for obj in objects}
+
+    def apply(self, objects, alpha):
+        previous = self.previous
+        moved = self._moved
+        for obj in objects:
+            entry = previous.get(id(obj))
+            if entry is None or entry[0] is not obj:
+                continue
+            start = entry[1]
+            rect = obj.rect
+            x, y = rect.topleft
+            dx, dy = x - start[0], y - start[1]
+            if (dx or dy) and abs(dx) + abs(dy) <= MAX_INTERPOLATED_MOVE:
+                moved.append((rect, x, y))
+                rect.topleft = (start[0] + round(dx * alpha), start[1] + round(dy * alpha))
+
+    def restore(self):
+        for rect, x, y in self._moved:
+            rect.topleft = (x, y)
+        self._moved.clear()
+
 
 class Screen(ABC):
     """Classe de base pour tous les écrans du jeu."""
@@ -10,6 +58,11 @@ class Screen(ABC):
         self.scalable_display = scalable_display
         self.next_screen = None
         self.running = True
+        # Fraction du pas de simulation écoulée depuis le dernier update() (0 à 1)
+        self.interpolation = 0.0
+        self.interpolator = RenderInterpolator()
+        # Overlay de performances, créé au premier affichage (voir toggle_perf_hud)
+        self.perf_hud = None
 
     @abstractmethod
     def handle_event(self, event):
@@ -26,35 +79,102 @@ class Screen(ABC):
         """Dessine l'écran."""
         pass
 
+    def interpolated_objects(self):
+        """Entités (avec un rect) à afficher entre deux ticks ; aucune par défaut."""
+        return ()
+
+    def perf_targets(self):
+        """(objet, méthode, libellé) chronométrés par l'overlay de performances."""
+        if self.scalable_display:
+            return [(self.scalable_display, "render", "mise à l'échelle")]
+        return []
+
+    def perf_counts(self):
+        """Compteurs d'entités affichés par l'overlay de performances."""
+        return {}
+
+    def toggle_perf_hud(self):
+        if self.perf_hud is None:
+            from graphics.perf_hud import PerfHUD
+            self.perf_hud = PerfHUD()
+        if self.perf_hud.enabled:
+            self.perf_hud.disable()
+        else:
+            self.perf_hud.enable(self.perf_targets())
+
+    def draw_perf_hud(self):
+        """À appeler en fin de draw() : affiche l'overlay s'il est actif."""
+        if self.perf_hud is not None and self.perf_hud.enabled:
+            self.perf_hud.draw(self.screen, self.perf_counts())
+
     def run(self):
-        """Boucle principale de l'écran. Retourne le prochain écran ou None pour quitter."""
+        """Boucle principale de l'écran. Retourne le prochain écran ou None pour quitter.
+
+        La simulation (update) avance par pas fixes de 1/FPS seconde, autant
+        de fois que le temps écoulé l'exige (au plus MAX_CATCH_UP_STEPS par
+        image) ; l'affichage (draw) a lieu une fois par image, avec les
+        entités interpolées entre les deux derniers ticks.
+        """
         clock = pygame.time.Clock()
-        from config import FPS
+        step_ms = 1000 / FPS
+        accumulator = step_ms  # Premier tour : un tick immédiat
 
         while self.running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return None
-                # Gérer le redimensionnement de la fenêtre
-                if event.type == pygame.VIDEORESIZE and self.scalable_display:
-                    self.scalable_display.handle_resize(event.w, event.h)
-                # Convertir les coordonnées souris pour les événements
-                if self.scalable_display and event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
-                    # Convertir les coordonnées écran en coordonnées jeu
-                    game_x, game_y = self.scalable_display.screen_to_game_coords(*event.pos)
-                    event.pos = (int(game_x), int(game_y))
-                self.handle_event(event)
-
-            self.update()
-            self.draw()
-
-            # Utiliser le système de scaling si disponible
-            if self.scalable_display:
-                self.scalable_display.render()
-            else:
-                pygame.display.flip()
-            clock.tick(FPS)
-
+            with tracing.span("image", "boucle"):
+                with tracing.span("événements", "boucle"):
+                    for event in pygame.event.get():
+                        if event.type == pygame.QUIT:
+                            return None
+                        if event.type == pygame.KEYDOWN and event.key == TRACE_DUMP_KEY and tracing.enabled:
+                            tracing.dump()
+                            continue
+                        # Gérer le redimensionnement de la fenêtre
+                        if event.type == pygame.VIDEORESIZE and self.scalable_display:
+                            self.scalable_display.handle_resize(event.w, event.h)
+                        # Convertir les coordonnées souris pour les événements
+                        if self.scalable_display and event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                            # Convertir les coordonnées écran en coordonnées jeu
+                            game_x, game_y = self.scalable_display.screen_to_game_coords(*event.pos)
+                            event.pos = (int(game_x), int(game_y))
+                        self.handle_event(event)
+
+                steps = 0
+                while accumulator >= step_ms and self.running:
+                    if steps == MAX_CATCH_UP_STEPS:
+                        # Trop de retard (machine lente, fenêtre déplacée) : on l'abandonne
+                        accumulator %= step_ms
+                        break
+                    with tracing.span("update", "boucle"):
+                        self.interpolator.capture(self.interpolated_objects())
+                        self.update()
+                    accumulator -= step_ms
+                    steps += 1
+                self.interpolation = accumulator / step_ms
+
+                with tracing.span("draw", "boucle"):
+                    objects = self.interpolated_objects()
+                    self.interpolator.apply(objects, self.interpolation)
+                    try:
+                        self.draw()
+                    finally:
+                        self.interpolator.restore()
+
+                # Utiliser le système de scaling si disponible
+                with tracing.span("rendu", "boucle"):
+                    if self.scalable_display:
+                        self.scalable_display.render()
+                    else:
+                        pygame.display.flip()
+
+            with tracing.span("attente", "boucle"):
+                frame_ms = clock.tick(MAX_RENDER_FPS)
+            accumulator += frame_ms
+            if self.perf_hud is not None and self.perf_hud.enabled:
+                self.perf_hud.end_frame(frame_ms, clock.get_rawtime())
+
+        if self.perf_hud is not None and self.perf_hud.enabled:
+            # Le ScalableDisplay est partagé avec les écrans suivants
+            self.perf_hud.disable()
         return self.next_screen
 
 
@@ -1,24 +1,16 @@
 import pygame
-import random
 from screens.base import Screen
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, BLACK, WHITE
-from systems.level import Level
-from systems.combo import ComboSystem
-from systems.special_weapon import SpecialWeapon
-from systems.projectile_manager import manage_enemy_projectiles
-from entities.player import Player
-from entities.powerup import PowerUp
-from entities.bosses import Boss, Boss2, Boss3, Boss4, Boss5, Boss6, Boss7, Boss8, Boss9
-from entities.enemy import ShootingEnemy, DashEnemy, SplitterEnemy
-import math
-from entities.projectiles import RicochetProjectile, MissileProjectile, PulseWaveProjectile
-from graphics.effects import Explosion
+from systems.world import World
+from systems.replay import InputRecorder, IDLE_INPUT, save_if_enabled
+from systems.profiling import WORLD_SUBSYSTEMS, resolve
+from graphics.perf_hud import TOGGLE_KEY as PERF_HUD_KEY
 
 
 class GameScreen(Screen):
     """Écran de jeu principal."""
 
-    def __init__(self, screen, scalable_display=None, level_num=1):
+    def __init__(self, screen, scalable_display=None, level_num=1, seed=None, input_source=None):
         super().__init__(screen, scalable_display)
         self.level_num = level_num
         self.game_over = False
@@ -28,17 +20,16 @@ class GameScreen(Screen):
         self.fade_timer = 0
         self.fade_duration = 240  # 4 secondes à 60 FPS
 
-        # Initialisation du jeu
-        self.level = Level()
-        self.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100)
-        self.projectiles = []
-        self.enemy_projectiles = []
-        self.explosions = []
-        self.powerups = []
-        self.combo = ComboSystem()
-        self.special_weapon = SpecialWeapon()
+        # Initialisation du jeu : toute la simulation vit dans le World
+        self.world = World(num_players=1, seed=seed, level_num=level_num)
+        self.level = self.world.level
+        self.player = self.world.players[0]
         self.font = pygame.font.SysFont(None, 36)
 
+        # Inputs rejoués (itérateur de (dx, dy, shoot)) à la place du clavier
+        self.input_source = input_source
+        self.recorder = InputRecorder(self.level.seed, level_num=level_num)
+
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN or event.type == pygame.KEYDOWN:
             if self.game_over or self.victory:
@@ -49,412 +40,90 @@ class GameScreen(Screen):
             if event.key == pygame.K_ESCAPE:
                 if not self.game_over and not self.victory:
                     self.paused = not self.paused
+            elif event.key == PERF_HUD_KEY:
+                self.toggle_perf_hud()
 
     def update(self):
         if self.paused or self.game_over or self.victory:
             return
 
-        # Si l'animation de crash est en cours, continuer le jeu mais sans contrôler le joueur
-        if self.player_crashing:
-            crash_finished = self.player.update()
-            # Incrémenter le timer du fondu pendant le crash
-            if self.fade_timer < self.fade_duration:
-                self.fade_timer += 1
-            if crash_finished:
-                self.game_over = True
-                self.player_crashing = False
-        else:
-            # Gestion des inputs clavier (seulement si pas en crash)
-            keys = pygame.key.get_pressed()
-            self.player.handle_input(keys)
-
-            # Tir avec Espace ou clic souris
-            if self.player.wants_to_shoot or pygame.mouse.get_pressed()[0]:
-                self.player.shoot(self.projectiles)
-
-            self.player.update()
-
-        # Le jeu continue normalement (ennemis, projectiles, etc.)
-        self.level.update()
-
-        for projectile in self.projectiles:
-            projectile.update()
-
-        # Détecter les tirs qui quittent l'écran sans toucher
-        projectiles_avant = len(self.projectiles)
-        removed = [p for p in self.projectiles if p.rect.bottom <= 0]
-        self.projectiles = [p for p in self.projectiles if p.rect.bottom > 0]
-        tirs_rates = sum(1 for p in removed if not getattr(p, 'is_special_weapon', False))
-        if tirs_rates > 0:
-            self.combo.miss()
-
-        self._update_enemies()
-        self._update_enemy_projectiles()
-        self._check_projectile_collisions()
-        self._check_enemy_projectile_collisions()
-        self._check_enemy_collisions()
-        self._check_laser_collision()
-        self._update_explosions()
-        self._update_powerups()
-        self.combo.update()
-        self.special_weapon.update()
-
-    def _update_enemies(self):
-        for enemy in self.level.enemies[:]:
-            if isinstance(enemy, Boss):
-                result = enemy.update(self.player.rect.center, self.enemy_projectiles)
-                if result is True:
-                    self.level.enemies.remove(enemy)
-                    for _ in range(5):
-                        rand_x = enemy.rect.left + random.randint(0, 100)
-                        rand_y = enemy.rect.top + random.randint(0, 100)
-                        self.explosions.append(Explosion(rand_x, rand_y, duration=500))
-                    self.level.boss1_defeated = True
-            elif isinstance(enemy, Boss2):
-                result = enemy.update(self.player.rect.center, self.enemy_projectiles)
-                if result is True:
-                    self.level.enemies.remove(enemy)
-                    for _ in range(8):
-                        rand_x = enemy.rect.left + random.randint(0, 120)
-                        rand_y = enemy.rect.top + random.randint(0, 120)
-                        self.explosions.append(Explosion(rand_x, rand_y, duration=600))
-                    self.level.boss2_defeated = True
-            elif isinstance(enemy, Boss3):
-                result = enemy.update(self.player.rect.center, self.enemy_projectiles)
-                if result is True:
-                    self.level.enemies.remove(enemy)
-                    for _ in range(12):
-                        rand_x = enemy.rect.left + random.randint(0, 140)
-                        rand_y = enemy.rect.top + random.randint(0, 140)
-                        self.explosions.append(Explosion(rand_x, rand_y, duration=700))
-                    self.level.boss3_defeated = True
-            elif isinstance(enemy, Boss4):
-                result = enemy.update(self.player.rect.center, self.enemy_projectiles)
-                if result is True:
-                    self.level.enemies.remove(enemy)
-                    for _ in range(20):
-                        rand_x = enemy.rect.left + random.randint(0, 160)
-                        rand_y = enemy.rect.top + random.randint(0, 160)
-                        self.explosions.append(Explosion(rand_x, rand_y, duration=800))
-                    self.level.boss4_defeated = True
-            elif isinstance(enemy, Boss5):
-                result = enemy.update(self.player.rect.center, self.enemy_projectiles)
-                if result is True:
-                    self.level.enemies.remove(enemy)
-                    for _ in range(30):
-                        rand_x = enemy.rect.left + random.randint(0, 180)
-                        rand_y = enemy.rect.top + random.randint(0, 180)
-                        self.explosions.append(Explosion(rand_x, rand_y, duration=1000))
-                    self.level.boss5_defeated = True
-            elif isinstance(enemy, Boss6):
-                result = enemy.update(self.player.rect.center, self.enemy_projectiles)
-                if result is True:
-                    self.level.enemies.remove(enemy)
-                    for _ in range(40):
-                        rand_x = enemy.rect.left + random.randint(0, 200)
-                        rand_y = enemy.rect.top + random.randint(0, 200)
-                        self.explosions.append(Explosion(rand_x, rand_y, duration=1200))
-                    self.level.boss6_defeated = True
-            elif isinstance(enemy, Boss7):
-                result = enemy.update(self.player.rect.center, self.enemy_projectiles)
-                if result is True:
-                    self.level.enemies.remove(enemy)
-                    for _ in range(50):
-                        rand_x = enemy.rect.left + random.randint(0, 180)
-                        rand_y = enemy.rect.top + random.randint(0, 180)
-                        self.explosions.append(Explosion(rand_x, rand_y, duration=1300))
-                    self.level.boss7_defeated = True
-            elif isinstance(enemy, Boss8):
-                result = enemy.update(self.player.rect.center, self.enemy_projectiles)
-                if result is True:
-                    self.level.enemies.remove(enemy)
-                    for _ in range(60):
-                        rand_x = enemy.rect.left + random.randint(0, 200)
-                        rand_y = enemy.rect.top + random.randint(0, 200)
-                        self.explosions.append(Explosion(rand_x, rand_y, duration=1500))
-                    self.level.boss8_defeated = True
-            elif isinstance(enemy, Boss9):
-                result = enemy.update(self.player.rect.center, self.enemy_projectiles)
-                if result is True:
-                    self.level.enemies.remove(enemy)
-                    for _ in range(70):
-                        rand_x = enemy.rect.left + random.randint(0, 220)
-                        rand_y = enemy.rect.top + random.randint(0, 220)
-                        self.explosions.append(Explosion(rand_x, rand_y, duration=1800))
-                    self.victory = True
-            elif isinstance(enemy, ShootingEnemy):
-                enemy.update(self.player.rect.center, self.enemy_projectiles)
-            elif isinstance(enemy, DashEnemy):
-                enemy.update_with_player(self.player.rect.center)
-
-    def _update_enemy_projectiles(self):
-        # Utiliser le gestionnaire centralisé pour mettre à jour et filtrer les projectiles
-        self.enemy_projectiles = manage_enemy_projectiles(
-            self.enemy_projectiles,
-            self.player.rect.center
-        )
-
-    def _check_projectile_collisions(self):
-        for projectile in self.projectiles[:]:
-            for enemy in self.level.enemies[:]:
-                if projectile.rect.colliderect(enemy.rect):
-                    if isinstance(enemy, (Boss, Boss2, Boss3, Boss4, Boss5, Boss6, Boss7, Boss8, Boss9)) and enemy.is_dying:
-                        continue
-
-                    # Gerer le missile : explosion AOE au point d'impact
-                    if isinstance(projectile, MissileProjectile):
-                        impact_x, impact_y = projectile.rect.centerx, projectile.rect.centery
-                        try:
-                            self.projectiles.remove(projectile)
-                        except ValueError:
-                            pass
-                        self.explosions.append(Explosion(impact_x, impact_y))
-                        new_count = self.combo.hit()
-                        if self.special_weapon.check_trigger(new_count):
-                            self.special_weapon.activate(self.player, self.projectiles)
-                        # Degats AOE a tous les ennemis dans le rayon
-                        for aoe_enemy in self.level.enemies[:]:
-                            dx = aoe_enemy.rect.centerx - impact_x
-                            dy = aoe_enemy.rect.centery - impact_y
-                            dist = math.sqrt(dx * dx + dy * dy)
-                            if dist <= projectile.aoe_radius:
-                                if isinstance(aoe_enemy, (Boss, Boss2, Boss3, Boss4, Boss5, Boss6, Boss7, Boss8, Boss9)):
-                                    if not aoe_enemy.is_dying:
-                                        aoe_enemy.take_damage(projectile.aoe_damage)
-                                        if aoe_enemy.hp <= 0:
-                                            aoe_enemy.is_dying = True
-                                else:
-                                    aoe_enemy.hp -= projectile.aoe_damage
-                                    if aoe_enemy.hp <= 0:
-                                        if aoe_enemy.drops_powerup:
-                                            power_types = ['double', 'triple', 'spread', 'ricochet', 'missile']
-                                            chosen_power = random.choice(power_types)
-                                            powerup = PowerUp(aoe_enemy.rect.centerx, aoe_enemy.rect.centery, chosen_power)
-                                            self.powerups.append(powerup)
-                                        if isinstance(aoe_enemy, SplitterEnemy):
-                                            mini_enemies = aoe_enemy.split()
-                                            self.level.enemies.extend(mini_enemies)
-                                        if aoe_enemy in self.level.enemies:
-                                            self.level.enemies.remove(aoe_enemy)
-                                        self.explosions.append(Explosion(aoe_enemy.rect.centerx, aoe_enemy.rect.centery))
-                    # Gerer le ricochet : le projectile rebondit au lieu d'etre detruit
-                    elif isinstance(projectile, RicochetProjectile):
-                        can_continue = projectile.ricochet()
-                        if not can_continue:
-                            try:
-                                self.projectiles.remove(projectile)
-                            except ValueError:
-                                pass
-
-                        new_count = self.combo.hit()
-                        if self.special_weapon.check_trigger(new_count):
-                            self.special_weapon.activate(self.player, self.projectiles)
-                        if isinstance(enemy, (Boss, Boss2, Boss3, Boss4, Boss5, Boss6, Boss7, Boss8, Boss9)):
-                            enemy.take_damage(1)
-                            if enemy.hp <= 0 and not enemy.is_dying:
-                                enemy.is_dying = True
-                        else:
-                            enemy.hp -= 1
-                            if enemy.hp <= 0:
-                                if enemy.drops_powerup:
-                                    power_types = ['double', 'triple', 'spread', 'ricochet', 'missile']
-                                    chosen_power = random.choice(power_types)
-                                    powerup = PowerUp(enemy.rect.centerx, enemy.rect.centery, chosen_power)
-                                    self.powerups.append(powerup)
-                                if isinstance(enemy, SplitterEnemy):
-                                    mini_enemies = enemy.split()
-                                    self.level.enemies.extend(mini_enemies)
-                                self.level.enemies.remove(enemy)
-                                self.explosions.append(Explosion(enemy.rect.centerx, enemy.rect.centery))
-                            else:
-                                self.explosions.append(Explosion(enemy.rect.centerx, enemy.rect.centery, duration=150))
-                    else:
-                        try:
-                            self.projectiles.remove(projectile)
-                        except ValueError:
-                            pass
-
-                        new_count = self.combo.hit()
-                        if self.special_weapon.check_trigger(new_count):
-                            self.special_weapon.activate(self.player, self.projectiles)
-                        if isinstance(enemy, (Boss, Boss2, Boss3, Boss4, Boss5, Boss6, Boss7, Boss8, Boss9)):
-                            enemy.take_damage(1)
-                            if enemy.hp <= 0 and not enemy.is_dying:
-                                enemy.is_dying = True
-                        else:
-                            enemy.hp -= 1
-                            if enemy.hp <= 0:
-                                if enemy.drops_powerup:
-                                    power_types = ['double', 'triple', 'spread', 'ricochet', 'missile']
-                                    chosen_power = random.choice(power_types)
-                                    powerup = PowerUp(enemy.rect.centerx, enemy.rect.centery, chosen_power)
-                                    self.powerups.append(powerup)
-                                # Gérer la division du SplitterEnemy
-                                if isinstance(enemy, SplitterEnemy):
-                                    mini_enemies = enemy.split()
-                                    self.level.enemies.extend(mini_enemies)
-                                self.level.enemies.remove(enemy)
-                                self.explosions.append(Explosion(enemy.rect.centerx, enemy.rect.centery))
-                            else:
-                                self.explosions.append(Explosion(enemy.rect.centerx, enemy.rect.centery, duration=150))
-                    break
-
-    def _check_enemy_projectile_collisions(self):
-        for e_proj in self.enemy_projectiles[:]:
-            if isinstance(e_proj, PulseWaveProjectile):
-                if e_proj.check_collision(self.player.rect):
-                    if not self.player.invulnerable:
-                        self.player.hp -= 1
-                        if self.player.hp <= 0:
-                            if not self.player.is_crashing:
-                                self.player.start_crash()
-                                self.player_crashing = True
-                                self.fade_timer = 0
-                        else:
-                            self.player.invulnerable = True
-                            self.player.invuln_start = pygame.time.get_ticks()
-            elif e_proj.rect.colliderect(self.player.rect):
-                try:
-                    self.enemy_projectiles.remove(e_proj)
-                except ValueError:
-                    pass
-                if not self.player.invulnerable:
-                    self.player.hp -= 1
-                    if self.player.hp <= 0:
-                        if not self.player.is_crashing:
-                            self.player.start_crash()
-                            self.player_crashing = True
-                    else:
-                        self.player.invulnerable = True
-                        self.player.invuln_start = pygame.time.get_ticks()
-
-    def _check_enemy_collisions(self):
-        for enemy in self.level.enemies[:]:
-            if enemy.rect.colliderect(self.player.rect):
-                if isinstance(enemy, (Boss, Boss2, Boss3, Boss4, Boss5, Boss6, Boss7, Boss8, Boss9)) and enemy.is_dying:
-                    continue
-                if isinstance(enemy, Boss4) and enemy.charging:
-                    if not self.player.invulnerable:
-                        self.player.hp -= 3
-                        if self.player.hp <= 0:
-                            if not self.player.is_crashing:
-                                self.player.start_crash()
-                                self.player_crashing = True
-                                self.fade_timer = 0
-                        else:
-                            self.player.invulnerable = True
-                            self.player.invuln_start = pygame.time.get_ticks()
-                    continue
-                if not self.player.invulnerable:
-                    self.player.hp -= self.player.contact_damage
-                    if isinstance(enemy, (Boss, Boss2, Boss3, Boss4, Boss5, Boss6, Boss7, Boss8, Boss9)):
-                        enemy.take_damage(self.player.contact_damage)
-                        if enemy.hp <= 0 and not enemy.is_dying:
-                            enemy.is_dying = True
-                    else:
-                        enemy.hp -= self.player.contact_damage
-                    impact_x = (self.player.rect.centerx + enemy.rect.centerx) // 2
-                    impact_y = (self.player.rect.centery + enemy.rect.centery) // 2
-                    self.explosions.append(Explosion(impact_x, impact_y))
-                    if enemy.hp <= 0 and not isinstance(enemy, (Boss, Boss2, Boss3, Boss4, Boss5, Boss6, Boss7, Boss8, Boss9)):
-                        if hasattr(enemy, 'drops_powerup') and enemy.drops_powerup:
-                            power_types = ['double', 'triple', 'spread']
-                            chosen_power = random.choice(power_types)
-                            powerup = PowerUp(enemy.rect.centerx, enemy.rect.centery, chosen_power)
-                            self.powerups.append(powerup)
-                        # Gérer la division du SplitterEnemy
-                        if isinstance(enemy, SplitterEnemy):
-                            mini_enemies = enemy.split()
-                            self.level.enemies.extend(mini_enemies)
-                        self.level.enemies.remove(enemy)
-                    if self.player.hp <= 0:
-                        if not self.player.is_crashing:
-                            self.player.start_crash()
-                            self.player_crashing = True
-                            self.fade_timer = 0
-                    else:
-                        self.player.invulnerable = True
-                        self.player.invuln_start = pygame.time.get_ticks()
-
-    def _check_laser_collision(self):
-        # Collision laser du Boss3 avec le joueur
-        for enemy in self.level.enemies:
-            if isinstance(enemy, Boss3) and enemy.laser_active and not self.player.invulnerable:
-                laser_rect = pygame.Rect(enemy.laser_target_x - 25, 0, 50, SCREEN_HEIGHT)
-                if self.player.rect.colliderect(laser_rect):
-                    self.player.hp -= 2
-                    if self.player.hp <= 0:
-                        if not self.player.is_crashing:
-                            self.player.start_crash()
-                            self.player_crashing = True
-                            self.fade_timer = 0
-                    else:
-                        self.player.invulnerable = True
-                        self.player.invuln_start = pygame.time.get_ticks()
+        # Inputs du tick, enregistrés pour pouvoir rejouer la partie
+        player_input = self._read_player_input()
+        self.recorder.record((player_input,))
 
-        # Collision laser du joueur (arme speciale) avec les ennemis
-        if self.special_weapon.active_laser:
-            for enemy in self.level.enemies[:]:
-                if self.special_weapon.check_laser_collision(enemy):
-                    if isinstance(enemy, (Boss, Boss2, Boss3, Boss4, Boss5, Boss6, Boss7, Boss8, Boss9)):
-                        if enemy.is_dying:
-                            continue
-                        enemy.take_damage(1)
-                        if enemy.hp <= 0 and not enemy.is_dying:
-                            enemy.is_dying = True
-                    else:
-                        enemy.hp -= 1
-                        if enemy.hp <= 0:
-                            if hasattr(enemy, 'drops_powerup') and enemy.drops_powerup:
-                                power_types = ['double', 'triple', 'spread', 'ricochet', 'missile']
-                                chosen_power = random.choice(power_types)
-                                powerup = PowerUp(enemy.rect.centerx, enemy.rect.centery, chosen_power)
-                                self.powerups.append(powerup)
-                            if isinstance(enemy, SplitterEnemy):
-                                mini_enemies = enemy.split()
-                                self.level.enemies.extend(mini_enemies)
-                            self.level.enemies.remove(enemy)
-                            self.explosions.append(Explosion(enemy.rect.centerx, enemy.rect.centery))
+        self.world.step({self.player.player_id: player_input})
 
-    def _update_explosions(self):
-        for exp in self.explosions:
-            exp.update()
-        self.explosions = [exp for exp in self.explosions if not exp.is_finished()]
-
-    def _update_powerups(self):
-        for powerup in self.powerups:
-            powerup.update()
-        self.powerups = [p for p in self.powerups if p.rect.top < SCREEN_HEIGHT]
-
-        for powerup in self.powerups[:]:
-            if powerup.rect.colliderect(self.player.rect):
-                self.player.apply_powerup(powerup.power_type)
-                try:
-                    self.powerups.remove(powerup)
-                except ValueError:
-                    pass
+        # Animation de crash : le jeu continue, avec un fondu au noir
+        if self.player.is_crashing:
+            if not self.player_crashing:
+                self.player_crashing = True
+                self.fade_timer = 0
+            elif self.fade_timer < self.fade_duration:
+                self.fade_timer += 1
+        if self.world.game_over:
+            self.game_over = True
+            self.player_crashing = False
+        if self.world.victory:
+            self.victory = True
+
+        if self.game_over or self.victory:
+            save_if_enabled(self.recorder, "solo")
+
+    def interpolated_objects(self):
+        world = self.world
+        return [*world.players, *world.level.enemies, *world.projectiles,
+                *world.enemy_projectiles, *world.powerups]
+
+    def perf_targets(self):
+        targets = [(*resolve(self.world, path), name) for name, path in WORLD_SUBSYSTEMS]
+        background = self.level.background
+        targets += [
+            (background, "update", "fond (màj)"),
+            (background, "draw", "fond (dessin)"),
+            (self, "_draw_explosions", "explosions (dessin)"),
+            (self, "_draw_ui", "HUD"),
+        ]
+        return targets + super().perf_targets()
+
+    def perf_counts(self):
+        world = self.world
+        explosions = world.explosions + self.player.crash_explosions
+        return {
+            "Ennemis": len(world.level.enemies),
+            "Tirs ennemis": len(world.enemy_projectiles) + len(world.bullet_pool),
+            "Tirs joueur": len(world.projectiles),
+            "Explosions": len(explosions),
+            "Particules": sum(len(exp.particles) for exp in explosions)
+                          + len(self.player.thruster_particles),
+        }
+
+    def _read_player_input(self):
+        """Retourne (dx, dy, shoot) pour ce tick, depuis le replay ou le clavier."""
+        if self.input_source is not None:
+            return next(self.input_source, IDLE_INPUT)
+        if self.player_crashing:
+            return IDLE_INPUT
+        self.player.handle_input(pygame.key.get_pressed())
+        # Tir avec Espace ou clic souris
+        shoot = self.player.wants_to_shoot or pygame.mouse.get_pressed()[0]
+        return (self.player.dx, self.player.dy, bool(shoot))
 
     def draw(self):
         self.screen.fill(BLACK)
         self.level.draw(self.screen)
 
-        for projectile in self.projectiles:
+        for projectile in self.world.projectiles:
             projectile.draw(self.screen)
-        for e_proj in self.enemy_projectiles:
+        for e_proj in self.world.enemy_projectiles:
             e_proj.draw(self.screen)
-        for powerup in self.powerups:
+        # Sans tick de simulation (pause, fin de partie), les tirs restent à leur position
+        frozen = self.paused or self.game_over or self.victory
+        self.world.bullet_pool.draw(self.screen, 1.0 if frozen else self.interpolation)
+        for powerup in self.world.powerups:
             powerup.draw(self.screen)
         self.player.draw(self.screen)
-        for exp in self.explosions:
-            exp.draw(self.screen)
-
-        # UI
-        timer_text = self.font.render(f"Timer: {self.level.timer}", True, WHITE)
-        self.screen.blit(timer_text, (10, 10))
-        hp_text = self.font.render(f"HP: {self.player.hp}", True, WHITE)
-        self.screen.blit(hp_text, (10, 50))
-        self.combo.draw(self.screen, self.font)
-        self.special_weapon.draw(self.screen, self.font)
+        self._draw_explosions()
+        self._draw_ui()
 
         # Fondu au noir progressif pendant le crash (4 secondes) et reste noir après
         if self.fade_timer > 0:
@@ -471,6 +140,19 @@ class GameScreen(Screen):
             self._draw_victory()
         elif self.paused:
             self._draw_pause()
+        self.draw_perf_hud()
+
+    def _draw_explosions(self):
+        for exp in self.world.explosions:
+            exp.draw(self.screen)
+
+    def _draw_ui(self):
+        timer_text = self.font.render(f"Timer: {self.level.timer}", True, WHITE)
+        self.screen.blit(timer_text, (10, 10))
+        hp_text = self.font.render(f"HP: {self.player.hp}", True, WHITE)
+        self.screen.blit(hp_text, (10, 50))
+        self.world.combo.draw(self.screen, self.font)
+        self.world.special_weapon.draw(self.screen, self.font)
 
     def _draw_game_over(self):
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
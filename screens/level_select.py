@@ -2,6 +2,8 @@ import pygame
 from screens.base import Screen, Button
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, WHITE
 from graphics.shared_background import get_shared_background, set_background_speed
+from systems.level import WAVE_NAMES
+from systems.level_data import level_exists, level_path, load_compiled
 
 
 class LevelButton(Button):
@@ -62,13 +64,20 @@ class LevelSelectScreen(Screen):
         set_background_speed(2)  # Vitesse standard pour la sélection
         self.selected_level = None
 
-        # Configuration des niveaux (pour l'instant, un seul débloqué)
-        # Structure prête pour le multijoueur : on pourra ajouter des niveaux facilement
-        self.levels = [
-            {"num": 1, "locked": False, "name": "Première vague"},
-            {"num": 2, "locked": True, "name": "À venir..."},
-            {"num": 3, "locked": True, "name": "À venir..."},
-        ]
+        # Un niveau est débloqué dès que son fichier levels/levelN.json existe
+        self.levels = []
+        for num in (1, 2, 3):
+            if not level_exists(num):
+                self.levels.append({"num": num, "locked": True, "name": "À venir..."})
+                continue
+            try:
+                name = load_compiled(level_path(num), WAVE_NAMES).name
+            except (OSError, ValueError) as e:
+                # Fichier illisible ou invalide (JSON, vague inconnue...) : niveau verrouillé
+                print(f"Niveau {num} invalide : {e}")
+                self.levels.append({"num": num, "locked": True, "name": "Niveau invalide"})
+                continue
+            self.levels.append({"num": num, "locked": False, "name": name})
 
         # Créer les boutons de niveau
         self.level_buttons = []
@@ -2,7 +2,6 @@
 
 import pygame
 import math
-import random
 from screens.base import Screen
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, WHITE, CYAN, RED, YELLOW
 from graphics.shared_background import get_shared_background, set_background_speed
@@ -13,16 +12,21 @@ from entities.enemy import (
     SineWaveEnemy, ZigZagEnemy, SwoopEnemy, HorizontalEnemy,
     ShootingEnemy, TankEnemy, DashEnemy, SplitterEnemy
 )
-from entities.bosses import Boss, Boss2, Boss3, Boss4, Boss5, Boss6
+from entities.bosses import Boss, Boss2, Boss3, Boss4, Boss5, Boss6, Boss7, Boss8, Boss9
 from entities.powerup import PowerUp
 from entities.projectiles import (
     Projectile, EnemyProjectile, BossProjectile, Boss2Projectile, Boss3Projectile,
-    Boss4Projectile, Boss5Projectile, Boss6Projectile, HomingProjectile,
+    Boss4Projectile, Boss5Projectile, Boss6Projectile, Boss7Projectile,
+    Boss8Projectile, Boss9Projectile, HomingProjectile,
     BouncingProjectile, SplittingProjectile, ZigZagProjectile, GravityProjectile,
     TeleportingProjectile, VortexProjectile, BlackHoleProjectile, MirrorProjectile,
     PulseWaveProjectile
 )
 from network.client import GameClient
+from systems import object_pool
+from systems.sim_clock import SimClock
+from graphics.perf_hud import TOGGLE_KEY as PERF_HUD_KEY
+from systems.bullet_pool import POOLED_CLASSES
 
 
 class SyncedProjectile(Projectile):
@@ -31,6 +35,10 @@ class SyncedProjectile(Projectile):
         super().__init__(x, y)
         self.speed = 0
 
+    def reset(self, x, y):
+        super().reset(x, y)
+        self.speed = 0
+
     def sync_position(self, x, y):
         """Met à jour la position et le trail."""
         self.trail.append(self.rect.center)
@@ -49,6 +57,9 @@ PROJECTILE_CLASSES = {
     "Boss4Projectile": Boss4Projectile,
     "Boss5Projectile": Boss5Projectile,
     "Boss6Projectile": Boss6Projectile,
+    "Boss7Projectile": Boss7Projectile,
+    "Boss8Projectile": Boss8Projectile,
+    "Boss9Projectile": Boss9Projectile,
     "HomingProjectile": HomingProjectile,
     "BouncingProjectile": BouncingProjectile,
     "SplittingProjectile": SplittingProjectile,
@@ -64,9 +75,12 @@ PROJECTILE_CLASSES = {
 
 def create_synced_enemy_projectile(x, y, proj_type, radius=5):
     """Crée un projectile ennemi en utilisant la vraie classe."""
-    proj_class = PROJECTILE_CLASSES.get(proj_type)
+    proj_class = PROJECTILE_CLASSES.get(proj_type, EnemyProjectile)
 
-    if proj_class == BlackHoleProjectile:
+    # Tirs simples : recyclés (ils apparaissent et disparaissent en masse)
+    if proj_class in POOLED_CLASSES:
+        return object_pool.acquire(proj_class, x, y, 0, 1)
+    elif proj_class == BlackHoleProjectile:
         proj = proj_class(x, y)
         return proj
     elif proj_class == PulseWaveProjectile:
@@ -82,17 +96,12 @@ def create_synced_enemy_projectile(x, y, proj_type, radius=5):
     elif proj_class == ZigZagProjectile:
         proj = proj_class(x, y, 1)
         return proj
-    elif proj_class == GravityProjectile:
-        proj = proj_class(x, y, 0, 1)
-        return proj
     elif proj_class == TeleportingProjectile:
         proj = proj_class(x, y, 0, 1)
         return proj
-    elif proj_class:
+    else:
         proj = proj_class(x, y, 0, 1)
         return proj
-    else:
-        return EnemyProjectile(x, y, 0, 1)
 
 
 class SyncedEnemyProjectile:
@@ -102,6 +111,10 @@ class SyncedEnemyProjectile:
         self.projectile = create_synced_enemy_projectile(x, y, proj_type, radius)
         self.timer = 0
 
+    def release(self):
+        """Rend le projectile à son pool quand le serveur l'a retiré."""
+        object_pool.release(self.projectile)
+
     def sync_position(self, x, y, radius=None):
         """Met à jour la position et le trail."""
         self.timer += 1
@@ -160,7 +173,11 @@ class MultiplayerGameScreen(Screen):
         self.enemy_projectiles = {}  # proj_id -> SyncedEnemyProjectile
         self.powerups = {}  # (x, y) -> PowerUp
         self.explosions = []
-        self.explosion_cache = set()
+        # Explosions déjà reçues : clé serveur -> instant local de réception
+        self.explosion_cache = {}
+
+        # Horloge locale des animations (crash, explosions), avancée à chaque update
+        self.clock = SimClock()
 
         # Mapping des types d'ennemis vers leurs classes
         self.enemy_classes = {
@@ -182,13 +199,26 @@ class MultiplayerGameScreen(Screen):
             "Boss4": Boss4,
             "Boss5": Boss5,
             "Boss6": Boss6,
+            "Boss7": Boss7,
+            "Boss8": Boss8,
+            "Boss9": Boss9,
         }
 
         self.font = pygame.font.SysFont(None, 36)
         self.small_font = pygame.font.SysFont(None, 28)
+        self.diag_font = pygame.font.SysFont(None, 22)
+
+        # Overlay de diagnostic réseau (F3)
+        self.show_net_overlay = False
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_F3:
+                self.show_net_overlay = not self.show_net_overlay
+                return
+            if event.key == PERF_HUD_KEY:
+                self.toggle_perf_hud()
+                return
             if event.key == pygame.K_ESCAPE:
                 if self.game_over or self.victory:
                     self.next_screen = "menu"
@@ -201,9 +231,15 @@ class MultiplayerGameScreen(Screen):
                 self.next_screen = "menu"
                 self.running = False
 
+    def interpolated_objects(self):
+        return [*self.players.values(), *self.enemies.values(), *self.projectiles.values(),
+                *(synced.projectile for synced in self.enemy_projectiles.values()),
+                *self.powerups.values()]
+
     def update(self):
         if self.paused:
             return
+        self.clock.advance()
 
         if not self.client.connected:
             self.game_over = True
@@ -241,6 +277,9 @@ class MultiplayerGameScreen(Screen):
         shoot = keys[pygame.K_SPACE] or pygame.mouse.get_pressed()[0]
         self.client.send_input(dx, dy, shoot)
 
+        # Snapshots reçus depuis la frame précédente (profondeur du buffer)
+        self.client.stats.consume_snapshots()
+
         # Synchroniser les entités depuis le serveur
         self._sync_players()
         self._sync_enemies()
@@ -260,12 +299,48 @@ class MultiplayerGameScreen(Screen):
         if self.player_crashing and self.fade_timer < self.fade_duration:
             self.fade_timer += 1
 
-        # Mettre à jour les explosions locales
+        self._update_explosions()
+        self.background.update()
+
+    def _update_explosions(self):
+        """Met à jour les explosions locales et rend au pool celles qui sont terminées."""
+        running = []
         for exp in self.explosions:
             exp.update()
-        self.explosions = [exp for exp in self.explosions if not exp.is_finished()]
-
-        self.background.update()
+            if exp.is_finished():
+                object_pool.release(exp)
+            else:
+                running.append(exp)
+        self.explosions = running
+
+    def perf_targets(self):
+        targets = [
+            (self, "_sync_players", "sync joueurs"),
+            (self, "_sync_enemies", "sync ennemis"),
+            (self, "_sync_projectiles", "sync tirs"),
+            (self, "_sync_powerups", "sync power-ups"),
+            (self, "_sync_explosions", "sync explosions"),
+            (self, "_update_explosions", "explosions"),
+            (self, "_draw_explosions", "explosions (dessin)"),
+            (self.background, "update", "fond (màj)"),
+            (self.background, "draw", "fond (dessin)"),
+            (self, "_draw_ui", "HUD"),
+        ]
+        return targets + super().perf_targets()
+
+    def perf_counts(self):
+        explosions = list(self.explosions)
+        particles = 0
+        for player in self.players.values():
+            explosions += player.crash_explosions
+            particles += len(player.thruster_particles)
+        return {
+            "Ennemis": len(self.enemies),
+            "Tirs ennemis": len(self.enemy_projectiles),
+            "Tirs joueur": len(self.projectiles),
+            "Explosions": len(explosions),
+            "Particules": particles + sum(len(exp.particles) for exp in explosions),
+        }
 
     def _sync_players(self):
         """Synchronise les joueurs depuis le serveur."""
@@ -277,7 +352,8 @@ class MultiplayerGameScreen(Screen):
             y = p_data.get("y", 0)
 
             if pid not in self.players:
-                self.players[pid] = Player(x, y, player_id=pid, is_local=(pid == self.client.player_id))
+                self.players[pid] = Player(x, y, player_id=pid, is_local=(pid == self.client.player_id),
+                                           clock=self.clock)
 
             player = self.players[pid]
             player.rect.centerx = x
@@ -298,26 +374,7 @@ class MultiplayerGameScreen(Screen):
             else:
                 # particules du thruster
                 player.thruster_timer += 1
-                if player.thruster_timer % 2 == 0:
-                    base_x = player.rect.centerx
-                    base_y = player.rect.bottom - 5
-                    for _ in range(2):
-                        particle = {
-                            'x': base_x + random.uniform(-8, 8),
-                            'y': base_y,
-                            'vx': random.uniform(-0.5, 0.5),
-                            'vy': random.uniform(2, 4),
-                            'life': random.randint(10, 20),
-                            'max_life': 20,
-                            'size': random.uniform(3, 6),
-                        }
-                        player.thruster_particles.append(particle)
-                for p in player.thruster_particles:
-                    p['x'] += p['vx']
-                    p['y'] += p['vy']
-                    p['life'] -= 1
-                    p['size'] = max(0, p['size'] - 0.2)
-                player.thruster_particles = [p for p in player.thruster_particles if p['life'] > 0]
+                player.update_thruster_particles(player.thruster_timer % 2 == 0)
 
     def _sync_enemies(self):
         """Synchronise les ennemis depuis le serveur."""
@@ -363,10 +420,10 @@ class MultiplayerGameScreen(Screen):
                     enemy.is_mini = is_mini
 
             # Synchroniser les animations des boss
-            if isinstance(enemy, (Boss, Boss2, Boss3, Boss4, Boss5, Boss6)):
+            if isinstance(enemy, (Boss, Boss2, Boss3, Boss4, Boss5, Boss6, Boss7, Boss8, Boss9)):
                 # Déclencher l'animation de dégâts si le serveur l'indique
                 damage_anim = e_data.get("damage_animation_active", False)
-                if damage_anim and not enemy.damage_animation_active:
+                if damage_anim and not getattr(enemy, 'damage_animation_active', True):
                     enemy.damage_animation_active = True
                     enemy.damage_animation_timer = 0
 
@@ -415,13 +472,13 @@ class MultiplayerGameScreen(Screen):
             y = p_data.get("y", 0)
 
             if pid not in self.projectiles:
-                self.projectiles[pid] = SyncedProjectile(x, y)
+                self.projectiles[pid] = object_pool.acquire(SyncedProjectile, x, y)
 
             self.projectiles[pid].sync_position(x, y)
 
         for pid in list(self.projectiles.keys()):
             if pid not in server_proj_ids:
-                del self.projectiles[pid]
+                object_pool.release(self.projectiles.pop(pid))
 
         # Projectiles ennemis
         server_enemy_projs = self.client.game_state.get("enemy_projectiles", [])
@@ -442,7 +499,7 @@ class MultiplayerGameScreen(Screen):
 
         for pid in list(self.enemy_projectiles.keys()):
             if pid not in server_enemy_proj_ids:
-                del self.enemy_projectiles[pid]
+                self.enemy_projectiles.pop(pid).release()
 
     def _sync_powerups(self):
         """Synchronise les powerups depuis le serveur."""
@@ -672,20 +729,22 @@ class MultiplayerGameScreen(Screen):
     def _sync_explosions(self):
         """Synchronise les explosions depuis le serveur."""
         server_explosions = self.client.game_state.get("explosions", [])
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
 
         for exp_data in server_explosions:
             x = exp_data.get("x", 0)
             y = exp_data.get("y", 0)
-            start_time = exp_data.get("start_time", current_time)
+            start_time = exp_data.get("start_time", 0)
             duration = exp_data.get("duration", 300)
 
             key = (x, y, start_time)
             if key not in self.explosion_cache:
-                self.explosion_cache.add(key)
-                self.explosions.append(Explosion(x, y, duration=duration))
+                self.explosion_cache[key] = current_time
+                self.explosions.append(object_pool.acquire(Explosion, x, y, duration, self.clock))
 
-        self.explosion_cache = {k for k in self.explosion_cache if current_time - k[2] < 2000}
+        # start_time est sur l'horloge du serveur : on expire selon l'instant de réception
+        self.explosion_cache = {k: seen for k, seen in self.explosion_cache.items()
+                                if current_time - seen < 2000}
 
     def draw(self):
         self.screen.fill(BLACK)
@@ -714,11 +773,7 @@ class MultiplayerGameScreen(Screen):
             if player.hp > 0 or player.is_crashing:
                 player.draw(self.screen)
 
-        # Dessiner les explosions
-        for exp in self.explosions:
-            exp.draw(self.screen)
-
-        # UI
+        self._draw_explosions()
         self._draw_ui()
 
         # Fondu au noir progressif pendant le crash (4 secondes) et reste noir après
@@ -737,6 +792,11 @@ class MultiplayerGameScreen(Screen):
             self._draw_victory()
         elif self.paused:
             self._draw_pause()
+        self.draw_perf_hud()
+
+    def _draw_explosions(self):
+        for exp in self.explosions:
+            exp.draw(self.screen)
 
     def _draw_boss_health_bar(self, boss):
         """Dessine la barre de vie d'un boss."""
@@ -787,6 +847,36 @@ class MultiplayerGameScreen(Screen):
         controls = self.small_font.render("ZQSD + Espace", True, (100, 100, 130))
         self.screen.blit(controls, (SCREEN_WIDTH - 130, SCREEN_HEIGHT - 30))
 
+        if self.show_net_overlay:
+            self._draw_net_overlay()
+
+    def _draw_net_overlay(self):
+        """Dessine l'overlay de diagnostic réseau (RTT, snapshots, débit...)."""
+        stats = self.client.stats.summary()
+        rtt = f"{stats['rtt_ms']:.0f} ms" if stats['rtt_ms'] >= 0 else "--"
+        lines = [
+            f"RTT: {rtt}",
+            f"Snapshots: {stats['snapshot_rate']:.0f}/s",
+            f"Décodage: {stats['decode_ms']:.2f} ms",
+            f"Entrant: {stats['bytes_per_s'] / 1024:.1f} Ko/s",
+            f"Perdus: {stats['dropped']}  Retard: {stats['late']}",
+            f"Buffer: {stats['buffer_depth']}",
+        ]
+
+        line_height = 20
+        panel_width = 190
+        panel_height = len(lines) * line_height + 12
+        panel_x = SCREEN_WIDTH - panel_width - 10
+        panel_y = 40
+
+        panel = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 160))
+        self.screen.blit(panel, (panel_x, panel_y))
+
+        for i, line in enumerate(lines):
+            text = self.diag_font.render(line, True, (180, 220, 255))
+            self.screen.blit(text, (panel_x + 8, panel_y + 6 + i * line_height))
+
     def _draw_game_over(self):
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 180))
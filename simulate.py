@@ -0,0 +1,254 @@
+"""Simulation accélérée de la campagne, sans fenêtre : benchmark du débit de la logique de jeu.
+
+Joue la campagne de la première vague jusqu'au Boss 9 avec un pilote
+automatique, aussi vite que le CPU le permet, puis affiche :
+- le nombre de frames simulées par seconde ;
+- le nombre d'entités par phase (vagues entre deux boss, combat de chaque boss) ;
+- le temps passé dans chaque sous-système de World.step.
+
+Par défaut le joueur est invulnérable (ses PV sont remis au maximum à
+chaque tick) pour que la partie aille jusqu'au bout : un boss qui ne
+meurt plus, ou qui devient lent, se voit immédiatement.
+
+Avec --memory, la mémoire est suivie (tracemalloc) à chaque transition de
+boss : mémoire retenue, lignes dont les allocations ont grossi, instances
+par classe d'entité. Avec --soak N, la campagne est jouée N fois de suite
+et le code de retour vaut 1 si la mémoire retenue après chaque campagne
+grossit sans limite.
+
+Usage : python simulate.py [--seed N] [--players N] [--max-ticks N] [--mortal] [--json fichier]
+        python simulate.py --memory [--soak N] [--leak-tolerance Kio]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import pygame
+
+from config import FPS
+from systems.autopilot import Autopilot
+from systems.enemy_registry import is_boss
+from systems.level_data import level_exists, level_path
+from systems.memory import MemoryTracker, print_checkpoint, unbounded_growth
+from systems.profiling import WORLD_SUBSYSTEMS, SubsystemTimer
+from systems.quiet import quiet
+
+# Compteurs d'entités relevés à chaque tick
+COUNTERS = ("ennemis", "tirs ennemis", "tirs joueur", "explosions", "power-ups")
+
+# Croissance moyenne par campagne (Kio) au-delà de laquelle le soak échoue
+LEAK_TOLERANCE_KIB = 256
+
+
+def boss_label(enemy):
+    name = type(enemy).__name__
+    return "Boss1" if name == "Boss" else name
+
+
+class PhaseStats:
+    """Nombre de ticks et moyenne / maximum de chaque compteur d'entités sur une phase."""
+
+    def __init__(self, name):
+        self.name = name
+        self.ticks = 0
+        self.totals = dict.fromkeys(COUNTERS, 0)
+        self.peaks = dict.fromkeys(COUNTERS, 0)
+
+    def add(self, counts):
+        self.ticks += 1
+        for key, value in counts.items():
+            self.totals[key] += value
+            if value > self.peaks[key]:
+                self.peaks[key] = value
+
+    def to_dict(self):
+        return {
+            "ticks": self.ticks,
+            "mean": {key: self.totals[key] / max(self.ticks, 1) for key in COUNTERS},
+            "max": dict(self.peaks),
+        }
+
+
+def entity_counts(world):
+    return {
+        "ennemis": len(world.level.enemies),
+        "tirs ennemis": len(world.enemy_projectiles) + len(world.bullet_pool),
+        "tirs joueur": len(world.projectiles),
+        "explosions": len(world.explosions),
+        "power-ups": len(world.powerups),
+    }
+
+
+def run_campaign(seed=0, num_players=1, level_num=1, max_ticks=200000, mortal=False, profile=True,
+                 memory=None):
+    """Joue la campagne au pilote automatique et retourne le rapport (dict sérialisable en JSON).
+
+    memory : MemoryTracker démarré, qui reçoit un point de contrôle à chaque transition de boss.
+    """
+    from systems.world import World
+
+    world = World(num_players=num_players, seed=seed, headless=True,
+                  combo_enabled=(num_players == 1), level_num=level_num)
+    pilots = [Autopilot(player.player_id) for player in world.players]
+    max_hp = {player.player_id: player.hp for player in world.players}
+    profiler = SubsystemTimer()
+    if profile:
+        profiler.instrument_paths(world, WORLD_SUBSYSTEMS)
+    subsystems = profiler.totals
+
+    phases = {}
+    bosses_seen = []
+    phase = None
+    step_time = 0.0
+    pilot_time = 0.0
+    perf_counter = time.perf_counter
+    start = perf_counter()
+
+    while world.level.timer < max_ticks and not (world.victory or world.game_over):
+        if not mortal:
+            for player in world.players:
+                player.hp = max_hp[player.player_id]
+
+        t0 = perf_counter()
+        inputs = {pilot.player_id: pilot.input(world) for pilot in pilots}
+        t1 = perf_counter()
+        world.step(inputs)
+        t2 = perf_counter()
+        pilot_time += t1 - t0
+        step_time += t2 - t1
+
+        boss = next((e for e in world.level.enemies if e.alive and is_boss(e)), None)
+        if boss is not None:
+            name = boss_label(boss)
+            if name not in bosses_seen:
+                bosses_seen.append(name)
+        else:
+            name = f"vagues {len(bosses_seen) + 1}"
+        stats = phases.get(name)
+        if stats is None:
+            stats = phases[name] = PhaseStats(name)
+        stats.add(entity_counts(world))
+        if name != phase:
+            phase = name
+            if memory is not None:
+                memory.checkpoint(f"tick {world.level.timer} : {name}")
+
+    elapsed = perf_counter() - start
+    ticks = world.level.timer
+    outcome = "victoire" if world.victory else "game over" if world.game_over else "limite atteinte"
+    profiler.restore()
+    if subsystems:
+        subsystems["autre"] = max(0.0, step_time - sum(subsystems.values()))
+    return {
+        "seed": seed,
+        "players": num_players,
+        "level": level_num,
+        "ticks": ticks,
+        "outcome": outcome,
+        "bosses": bosses_seen,
+        "elapsed_s": elapsed,
+        "fps": ticks / max(elapsed, 1e-9),
+        "step_s": step_time,
+        "autopilot_s": pilot_time,
+        "phases": {name: stats.to_dict() for name, stats in phases.items()},
+        "subsystems_s": subsystems,
+    }
+
+
+def print_report(report):
+    ticks = report["ticks"]
+    print(f"Campagne niveau {report['level']} - graine {report['seed']}, "
+          f"{report['players']} joueur(s) : {report['outcome']}")
+    print(f"{ticks} ticks en {report['elapsed_s']:.2f}s -> {report['fps']:.0f} frames/s "
+          f"({report['fps'] / FPS:.1f}x temps réel)")
+    print(f"Boss rencontrés : {', '.join(report['bosses']) or 'aucun'}")
+
+    print()
+    print(f"{'phase':<12} {'ticks':>7}" + "".join(f" {key:>18}" for key in COUNTERS))
+    for name, phase in report["phases"].items():
+        cells = "".join(f" {phase['mean'][key]:>9.1f} / {phase['max'][key]:<6}" for key in COUNTERS)
+        print(f"{name:<12} {phase['ticks']:>7}{cells}")
+
+    subsystems = report["subsystems_s"]
+    if subsystems:
+        print()
+        print(f"{'sous-système':<24} {'total (s)':>10} {'µs/tick':>9} {'part':>7}")
+        step = max(report["step_s"], 1e-9)
+        for name, seconds in sorted(subsystems.items(), key=lambda item: -item[1]):
+            print(f"{name:<24} {seconds:>10.3f} {seconds / max(ticks, 1) * 1e6:>9.1f} "
+                  f"{seconds / step * 100:>6.1f}%")
+        print(f"{'(pilote automatique)':<24} {report['autopilot_s']:>10.3f} "
+              f"{report['autopilot_s'] / max(ticks, 1) * 1e6:>9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--players", type=int, default=1)
+    parser.add_argument("--level", type=int, default=1)
+    parser.add_argument("--max-ticks", type=int, default=200000,
+                        help="Arrêt de sécurité si la campagne ne se termine pas")
+    parser.add_argument("--mortal", action="store_true", help="Le joueur peut mourir")
+    parser.add_argument("--no-profile", action="store_true",
+                        help="Ne pas chronométrer les sous-systèmes (débit brut)")
+    parser.add_argument("--json", help="Écrire aussi le rapport dans ce fichier JSON")
+    parser.add_argument("--verbose", action="store_true", help="Garder les logs du jeu")
+    parser.add_argument("--memory", action="store_true",
+                        help="Suivre la mémoire (tracemalloc) à chaque transition de boss")
+    parser.add_argument("--soak", type=int, default=1, metavar="N",
+                        help="Jouer N campagnes et échouer si la mémoire retenue grossit sans limite")
+    parser.add_argument("--leak-tolerance", type=float, default=LEAK_TOLERANCE_KIB, metavar="KIO",
+                        help="Croissance moyenne tolérée par campagne pour --soak")
+    args = parser.parse_args()
+    if not level_exists(args.level):
+        parser.error(f"niveau {args.level} introuvable ({level_path(args.level)})")
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+    tracker = MemoryTracker(verbose=False) if args.memory or args.soak > 1 else None
+    retained = []
+    try:
+        if tracker is not None:
+            tracker.start()
+            tracker.checkpoint("début")
+        with quiet(not args.verbose):
+            for _ in range(args.soak):
+                report = run_campaign(args.seed, args.players, args.level, args.max_ticks,
+                                      args.mortal, not args.no_profile, tracker if args.memory else None)
+                if tracker is not None:
+                    # La partie est terminée : ne reste que ce qui survit à une campagne
+                    retained.append(tracker.checkpoint(f"fin de campagne {len(retained) + 1}")["retained"])
+    finally:
+        if tracker is not None:
+            tracker.stop()
+
+    print_report(report)
+    leak = False
+    if tracker is not None:
+        report["memory"] = tracker.checkpoints
+        print()
+        for record in tracker.checkpoints:
+            print_checkpoint(record)
+    if args.soak > 1:
+        leak = unbounded_growth(retained, args.leak_tolerance * 1024)
+        report["soak"] = {"retained": retained, "leak": leak}
+        print()
+        print("Mémoire retenue après chaque campagne : "
+              + ", ".join(f"{value / 1024:.0f}" for value in retained) + " Kio")
+        print("FUITE : la mémoire retenue grossit à chaque campagne" if leak
+              else "Pas de croissance sans limite de la mémoire retenue")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    pygame.quit()
+    if leak:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""Scénario de stress « bullet hell » : pire cas reproductible pour les projectiles.
+
+Des milliers de projectiles de chaque type de entities/projectiles.py sont
+maintenus à l'écran (les tirs sortis ou détruits sont remplacés à chaque
+frame), avec des boss qui tirent leurs patterns. Le tout tourne dans un
+World normal, graine fixe : mêmes tirs, mêmes trajectoires d'un lancement
+à l'autre. Le joueur et les boss sont invulnérables et les vagues du
+niveau coupées.
+
+La mesure monte par paliers du nombre de projectiles par type et affiche,
+pour chaque palier, le temps par frame en fonction du nombre de projectiles
+vivants : remplissage, World.step (gestion des projectiles, collisions) et
+dessin. Le même scénario s'ouvre en fenêtre depuis test_entities.py.
+
+Usage : python stress.py [--counts 100,250,500,1000] [--frames N] [--bosses 4,8,9]
+                         [-k motif] [--no-draw] [--json fichier]
+"""
+import argparse
+import json
+import os
+import random
+import re
+import time
+
+import pygame
+
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, BLACK
+from benchmarks.fixtures import PLAYER_SHOTS, Anchor, projectile_factories
+from entities import projectiles as shots
+from systems.quiet import quiet
+from systems.spawn_timeline import SpawnTimeline
+
+DEFAULT_COUNTS = (100, 250, 500, 1000)
+DEFAULT_BOSSES = (4, 8, 9)
+DEFAULT_FRAMES = 60
+# Frames jouées avant la mesure de chaque palier (entrée des boss, régime établi)
+WARMUP_FRAMES = 30
+FRAME_BUDGET_MS = 1000 / FPS
+BAR_WIDTH = 40
+
+
+def select_types(pattern=None):
+    """Types de projectiles du scénario (filtrés par une expression régulière)."""
+    names = list(projectile_factories())
+    if pattern:
+        regex = re.compile(pattern)
+        names = [name for name in names if regex.search(name)]
+    return names
+
+
+class StressScenario:
+    """World chargé de `per_type` projectiles de chaque type, maintenus à l'écran, et de boss."""
+
+    def __init__(self, per_type, types=None, bosses=DEFAULT_BOSSES, seed=0):
+        from systems.world import World
+
+        self.per_type = per_type
+        self.rng = random.Random(seed)
+        self.world = World(num_players=1, seed=seed, headless=True, combo_enabled=False)
+        level = self.world.level
+        # Pas de vagues : seuls les tirs du scénario et les boss
+        level.timeline = SpawnTimeline()
+        for number in bosses:
+            getattr(level, "spawn_boss" if number == 1 else f"spawn_boss{number}")()
+        self.bosses = {boss: boss.hp for boss in level.enemies}
+        self.player = self.world.players[0]
+        self.max_hp = self.player.hp
+        self.anchor = level.enemies[-1] if level.enemies else Anchor(SCREEN_WIDTH // 2, 150)
+
+        factories = projectile_factories()
+        self.factories = {name: factories[name] for name in (types or factories)}
+        pool = self.world.bullet_pool
+        self.pooled = {name for name in self.factories if pool.handles(getattr(shots, name))}
+
+    def __len__(self):
+        world = self.world
+        return len(world.projectiles) + len(world.enemy_projectiles) + len(world.bullet_pool)
+
+    def _counts(self):
+        counts = {}
+        for projectile in self.world.projectiles:
+            name = type(projectile).__name__
+            counts[name] = counts.get(name, 0) + 1
+        for projectile in self.world.enemy_projectiles:
+            name = type(projectile).__name__
+            counts[name] = counts.get(name, 0) + 1
+        pool = self.world.bullet_pool
+        for type_id, bullet_type in enumerate(pool.types):
+            counts[bullet_type.name] = counts.get(bullet_type.name, 0) + int(
+                (pool.type_ids[:pool.count] == type_id).sum())
+        return counts
+
+    def refill(self):
+        """Remplace les tirs sortis ou détruits pour revenir à per_type par type."""
+        world = self.world
+        rng = self.rng
+        target = self.player.rect.center
+        counts = self._counts()
+        for name, make in self.factories.items():
+            missing = self.per_type - counts.get(name, 0)
+            for _ in range(missing):
+                projectile = make(rng, target, self.anchor)
+                if name in PLAYER_SHOTS:
+                    world.projectiles.append(projectile)
+                elif name in self.pooled:
+                    world.bullet_pool.spawn(type(projectile), projectile.rect.centerx, projectile.rect.centery,
+                                            projectile.dx, projectile.dy, projectile.speed)
+                else:
+                    world.enemy_projectiles.append(projectile)
+
+    def step(self):
+        self.player.hp = self.max_hp
+        for boss, hp in self.bosses.items():
+            boss.hp = hp
+        self.world.step({self.player.player_id: (0, 0, True)})
+
+    def draw(self, surface):
+        world = self.world
+        surface.fill(BLACK)
+        world.level.draw(surface)
+        for projectile in world.projectiles:
+            projectile.draw(surface)
+        for projectile in world.enemy_projectiles:
+            projectile.draw(surface)
+        world.bullet_pool.draw(surface)
+        self.player.draw(surface)
+        for explosion in world.explosions:
+            explosion.draw(surface)
+
+    def frame(self, surface=None):
+        """Une frame : remplissage, step, dessin ; retourne les durées (ms) de chaque partie."""
+        perf_counter = time.perf_counter
+        t0 = perf_counter()
+        self.refill()
+        t1 = perf_counter()
+        self.step()
+        t2 = perf_counter()
+        if surface is not None:
+            self.draw(surface)
+        t3 = perf_counter()
+        return (t1 - t0) * 1000, (t2 - t1) * 1000, (t3 - t2) * 1000
+
+
+def run_ramp(counts=DEFAULT_COUNTS, frames=DEFAULT_FRAMES, types=None, bosses=DEFAULT_BOSSES,
+             draw=True, seed=0):
+    """Mesure chaque palier et retourne une ligne (dict) par palier."""
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)) if draw else None
+    rows = []
+    for per_type in counts:
+        scenario = StressScenario(per_type, types, bosses, seed)
+        for _ in range(WARMUP_FRAMES):
+            scenario.frame(surface)
+        totals = [0.0, 0.0, 0.0]
+        worst = 0.0
+        live = 0
+        for _ in range(frames):
+            timings = scenario.frame(surface)
+            for i, ms in enumerate(timings):
+                totals[i] += ms
+            worst = max(worst, sum(timings))
+            live += len(scenario)
+        refill_ms, step_ms, draw_ms = (total / frames for total in totals)
+        rows.append({
+            "per_type": per_type,
+            "types": len(scenario.factories),
+            "projectiles": live / frames,
+            "refill_ms": refill_ms,
+            "step_ms": step_ms,
+            "draw_ms": draw_ms,
+            "frame_ms": refill_ms + step_ms + draw_ms,
+            "worst_ms": worst,
+        })
+    return rows
+
+
+def print_ramp(rows):
+    print(f"{'par type':>8} {'projectiles':>11} {'remplissage':>11} {'step':>8} {'dessin':>8} "
+          f"{'frame':>8} {'pire':>8}  (ms, budget {FRAME_BUDGET_MS:.1f} ms = |)")
+    scale = max(max(row["frame_ms"] for row in rows), FRAME_BUDGET_MS) / BAR_WIDTH
+    budget_col = int(FRAME_BUDGET_MS / scale)
+    for row in rows:
+        step_len = int(row["step_ms"] / scale)
+        draw_len = int(row["draw_ms"] / scale)
+        other_len = int(row["frame_ms"] / scale) - step_len - draw_len
+        bar = list("#" * step_len + "=" * draw_len + "." * max(other_len, 0))
+        bar += [" "] * (BAR_WIDTH + 1 - len(bar))
+        bar[budget_col] = "|"
+        print(f"{row['per_type']:>8} {row['projectiles']:>11.0f} {row['refill_ms']:>11.2f} "
+              f"{row['step_ms']:>8.2f} {row['draw_ms']:>8.2f} {row['frame_ms']:>8.2f} "
+              f"{row['worst_ms']:>8.2f}  {''.join(bar)}")
+    print("# step   = dessin   . remplissage")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--counts", default=",".join(map(str, DEFAULT_COUNTS)),
+                        help="Paliers : nombre de projectiles par type (séparés par des virgules)")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="Frames mesurées par palier")
+    parser.add_argument("--bosses", default=",".join(map(str, DEFAULT_BOSSES)),
+                        help="Numéros des boss présents (vide : aucun)")
+    parser.add_argument("-k", dest="pattern", help="Types de projectiles retenus (expression régulière)")
+    parser.add_argument("--no-draw", action="store_true", help="Ne mesurer que la simulation")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--list", action="store_true", help="Lister les types de projectiles")
+    parser.add_argument("--json", help="Écrire aussi les mesures dans ce fichier JSON")
+    parser.add_argument("--verbose", action="store_true", help="Garder les logs du jeu")
+    args = parser.parse_args()
+
+    types = select_types(args.pattern)
+    if args.list:
+        print("\n".join(types))
+        return
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+    counts = [int(count) for count in args.counts.split(",") if count]
+    bosses = [int(number) for number in args.bosses.split(",") if number]
+    print(f"{len(types)} types de projectiles, boss : {', '.join(map(str, bosses)) or 'aucun'}")
+
+    with quiet(not args.verbose):
+        rows = run_ramp(counts, args.frames, types, bosses, not args.no_draw, args.seed)
+
+    print_ramp(rows)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2, ensure_ascii=False)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Pilote automatique : produit les inputs (dx, dy, shoot) d'un joueur à partir de l'état du World.
+
+Heuristique simple et déterministe : esquiver latéralement les tirs
+ennemis qui arrivent au-dessus du vaisseau, sinon se placer sous le boss
+(ou sous l'ennemi le plus bas de l'écran), en tirant en permanence.
+Utilisé par le simulateur de campagne sans rendu.
+"""
+import pygame
+
+from config import SCREEN_WIDTH
+from systems.enemy_registry import is_boss
+
+# Zone surveillée au-dessus du joueur pour l'esquive (pixels)
+DODGE_HEIGHT = 160
+DODGE_MARGIN = 20
+# Écart horizontal toléré avec la cible avant de bouger
+DEAD_ZONE = 5
+
+
+class Autopilot:
+    def __init__(self, player_id):
+        self.player_id = player_id
+
+    def _target_x(self, world, player):
+        on_screen = [e for e in world.level.enemies
+                     if e.alive and e.rect.bottom > 0 and 0 < e.rect.centerx < SCREEN_WIDTH]
+        if not on_screen:
+            return player.rect.centerx
+        bosses = [e for e in on_screen if is_boss(e)]
+        if bosses:
+            return bosses[0].rect.centerx
+        return max(on_screen, key=lambda e: e.rect.bottom).rect.centerx
+
+    def _threat_x(self, world, player):
+        """Abscisse moyenne des tirs ennemis dans la zone d'esquive, ou None."""
+        rect = player.rect
+        danger = pygame.Rect(rect.left - DODGE_MARGIN, rect.top - DODGE_HEIGHT,
+                             rect.width + 2 * DODGE_MARGIN, DODGE_HEIGHT + rect.height)
+        xs = [p.rect.centerx for p in world.enemy_projectiles if p.rect.colliderect(danger)]
+        pool = world.bullet_pool
+        if pool.count:
+            mask = pool.collide(danger)
+            if mask.any():
+                n = pool.count
+                xs.extend((pool.left[:n][mask] + pool.width[:n][mask] // 2).tolist())
+        if not xs:
+            return None
+        return sum(xs) / len(xs)
+
+    def input(self, world):
+        player = world.get_player(self.player_id)
+        if player is None:
+            return 0, 0, False
+        x = player.rect.centerx
+
+        threat_x = self._threat_x(world, player)
+        if threat_x is not None:
+            dx = -1 if threat_x >= x else 1
+            # Coincé contre un bord : esquiver de l'autre côté
+            if (dx < 0 and player.rect.left <= 0) or (dx > 0 and player.rect.right >= SCREEN_WIDTH):
+                dx = -dx
+            return dx, 0, True
+
+        target_x = self._target_x(world, player)
+        if target_x > x + DEAD_ZONE:
+            return 1, 0, True
+        if target_x < x - DEAD_ZONE:
+            return -1, 0, True
+        return 0, 0, True
@@ -0,0 +1,273 @@
+"""Pool vectorisé (NumPy) pour les projectiles ennemis simples.
+
+Les tirs à trajectoire linéaire (EnemyProjectile, BossProjectile...
+Boss7Projectile), à gravité (GravityProjectile) ou à rebonds
+(BouncingProjectile) ne sont plus des objets : leurs positions, vitesses,
+rebonds restants, traînées et types sont des colonnes de tableaux NumPy.
+Mise à jour, suppression hors écran et collisions avec les joueurs se font
+sur tout le tableau à la fois ; l'affichage blitte en lot des sprites
+pré-rendus par type.
+
+Les ennemis y tirent via Enemy.fire_projectile ; sans pool (écrans de
+test), les projectiles restent des objets classiques.
+"""
+import numpy as np
+import pygame
+
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from entities.projectiles import (
+    EnemyProjectile, BossProjectile, Boss2Projectile, Boss3Projectile,
+    Boss4Projectile, Boss5Projectile, Boss6Projectile, Boss7Projectile,
+    GravityProjectile, BouncingProjectile
+)
+
+POOLED_CLASSES = (
+    EnemyProjectile, BossProjectile, Boss2Projectile, Boss3Projectile,
+    Boss4Projectile, Boss5Projectile, Boss6Projectile, Boss7Projectile,
+    GravityProjectile, BouncingProjectile,
+)
+
+INITIAL_CAPACITY = 256
+
+
+class BulletType:
+    """Données partagées par tous les tirs d'une classe, tirées d'un prototype."""
+    def __init__(self, type_id, projectile_class):
+        self.type_id = type_id
+        self.name = projectile_class.__name__
+        proto = projectile_class(0, 0, 0, 0)
+        self.width = proto.rect.width
+        self.height = proto.rect.height
+        self.default_speed = proto.speed
+        self.gravity = getattr(proto, 'gravity', 0.0)
+        self.default_bounces = getattr(proto, 'bounces_left', 0)
+        self.max_trail = proto.max_trail_length
+        self.trail_cache = proto.trail_cache
+
+        # Corps du projectile : le draw() de la classe rendu une fois
+        size = max(self.width, self.height) + 8
+        self.sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        self.sprite_offset = size // 2
+        proto.rect.center = (self.sprite_offset, self.sprite_offset)
+        proto.trail = []
+        proto.draw(self.sprite)
+
+
+class BulletPool:
+    """Projectiles ennemis simples stockés en structure de tableaux."""
+
+    def __init__(self, capacity=INITIAL_CAPACITY):
+        self.types = []
+        self._types_by_class = {}
+        self.trail_max = 1
+        self.count = 0
+        self._next_id = 1
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        self.capacity = capacity
+        self.ids = np.zeros(capacity, np.int64)
+        self.type_ids = np.zeros(capacity, np.int16)
+        self.left = np.zeros(capacity, np.int64)
+        self.top = np.zeros(capacity, np.int64)
+        # Position au tick précédent, pour l'interpolation de l'affichage
+        self.prev_left = np.zeros(capacity, np.int64)
+        self.prev_top = np.zeros(capacity, np.int64)
+        self.width = np.zeros(capacity, np.int64)
+        self.height = np.zeros(capacity, np.int64)
+        self.vx = np.zeros(capacity, np.int64)        # déplacement horizontal par frame
+        self.vy = np.zeros(capacity, np.float64)      # vitesse verticale (tronquée à chaque frame)
+        self.gravity = np.zeros(capacity, np.float64)
+        self.bounces = np.zeros(capacity, np.int64)
+        self.trail_x = np.zeros((capacity, self.trail_max), np.int64)
+        self.trail_y = np.zeros((capacity, self.trail_max), np.int64)
+        self.trail_len = np.zeros(capacity, np.int64)
+        self.trail_limit = np.zeros(capacity, np.int64)
+
+    def _grow(self):
+        n = self.count
+        old = {name: getattr(self, name) for name in self._columns()}
+        self._allocate(self.capacity * 2)
+        for name, array in old.items():
+            getattr(self, name)[:n] = array[:n]
+
+    def _columns(self):
+        return ('ids', 'type_ids', 'left', 'top', 'prev_left', 'prev_top', 'width', 'height',
+                'vx', 'vy', 'gravity', 'bounces', 'trail_x', 'trail_y', 'trail_len', 'trail_limit')
+
+    def __len__(self):
+        return self.count
+
+    def handles(self, projectile_class):
+        return projectile_class in POOLED_CLASSES
+
+    def _get_type(self, projectile_class):
+        bullet_type = self._types_by_class.get(projectile_class)
+        if bullet_type is None:
+            bullet_type = BulletType(len(self.types), projectile_class)
+            self.types.append(bullet_type)
+            self._types_by_class[projectile_class] = bullet_type
+            if bullet_type.max_trail > self.trail_max:
+                self._widen_trails(bullet_type.max_trail)
+        return bullet_type
+
+    def _widen_trails(self, trail_max):
+        # Les traînées sont alignées à droite : on ajoute des colonnes à gauche
+        pad = trail_max - self.trail_max
+        self.trail_x = np.pad(self.trail_x, ((0, 0), (pad, 0)))
+        self.trail_y = np.pad(self.trail_y, ((0, 0), (pad, 0)))
+        self.trail_max = trail_max
+
+    # === Fabrique ===
+
+    def spawn(self, projectile_class, x, y, dx, dy, speed=None, bounces=None):
+        """Ajoute un tir, avec les mêmes paramètres que le constructeur de la classe."""
+        bullet_type = self._get_type(projectile_class)
+        if speed is None:
+            speed = bullet_type.default_speed
+        if bounces is None:
+            bounces = bullet_type.default_bounces
+        if self.count == self.capacity:
+            self._grow()
+
+        # Même arrondi que Rect(center=...) pour les positions flottantes
+        rect = pygame.Rect(0, 0, bullet_type.width, bullet_type.height)
+        rect.center = (x, y)
+
+        i = self.count
+        self.ids[i] = self._next_id
+        self._next_id += 1
+        self.type_ids[i] = bullet_type.type_id
+        self.left[i] = rect.left
+        self.top[i] = rect.top
+        self.prev_left[i] = rect.left
+        self.prev_top[i] = rect.top
+        self.width[i] = rect.width
+        self.height[i] = rect.height
+        self.vx[i] = int(dx * speed)
+        self.vy[i] = dy * speed
+        self.gravity[i] = bullet_type.gravity
+        self.bounces[i] = bounces
+        self.trail_len[i] = 0
+        self.trail_limit[i] = bullet_type.max_trail
+        self.count += 1
+
+    # === Simulation ===
+
+    def update(self):
+        """Avance tous les tirs d'une frame puis retire ceux sortis de l'écran."""
+        n = self.count
+        if n == 0:
+            return
+        left, top = self.left[:n], self.top[:n]
+        width, height = self.width[:n], self.height[:n]
+        self.prev_left[:n] = left
+        self.prev_top[:n] = top
+
+        # Traînée : position courante ajoutée avant le déplacement
+        trail_x, trail_y = self.trail_x[:n], self.trail_y[:n]
+        trail_x[:, :-1] = trail_x[:, 1:]
+        trail_y[:, :-1] = trail_y[:, 1:]
+        trail_x[:, -1] = left + width // 2
+        trail_y[:, -1] = top + height // 2
+        np.minimum(self.trail_len[:n] + 1, self.trail_limit[:n], out=self.trail_len[:n])
+
+        vx, vy = self.vx[:n], self.vy[:n]
+        left += vx
+        vy += self.gravity[:n]
+        top += np.trunc(vy).astype(np.int64)
+
+        # Rebonds sur les bords gauche/droit et le haut
+        bounces = self.bounces[:n]
+        can_bounce = bounces > 0
+        if can_bounce.any():
+            side = can_bounce & ((left <= 0) | (left + width >= SCREEN_WIDTH))
+            ceiling = can_bounce & (top <= 0)
+            vx[side] *= -1
+            vy[ceiling] *= -1
+            bounces -= side
+            bounces -= ceiling
+
+        self.remove((top >= SCREEN_HEIGHT) | (left >= SCREEN_WIDTH) |
+                    (left + width <= 0) | (top + height <= 0))
+
+    def collide(self, rect):
+        """Masque des tirs dont le rectangle chevauche rect."""
+        n = self.count
+        left, top = self.left[:n], self.top[:n]
+        return ((left < rect.right) & (left + self.width[:n] > rect.left) &
+                (top < rect.bottom) & (top + self.height[:n] > rect.top))
+
+    def remove(self, mask):
+        """Supprime les tirs sélectionnés par le masque, en gardant l'ordre des autres."""
+        if not mask.any():
+            return
+        keep = ~mask
+        n = int(keep.sum())
+        for name in self._columns():
+            array = getattr(self, name)
+            array[:n] = array[:self.count][keep]
+        self.count = n
+
+    def clear(self):
+        self.count = 0
+
+    # === Lecture de l'état ===
+
+    def snapshot(self):
+        """Liste de (id, centre x, centre y, nom du type) pour la diffusion réseau."""
+        n = self.count
+        centers_x = (self.left[:n] + self.width[:n] // 2).tolist()
+        centers_y = (self.top[:n] + self.height[:n] // 2).tolist()
+        names = [bullet_type.name for bullet_type in self.types]
+        return [(bullet_id, cx, cy, names[type_id]) for bullet_id, cx, cy, type_id in
+                zip(self.ids[:n].tolist(), centers_x, centers_y, self.type_ids[:n].tolist())]
+
+    def rects(self):
+        """Rectangles des tirs (pour le débogage et les tests d'état)."""
+        n = self.count
+        return [pygame.Rect(x, y, w, h) for x, y, w, h in zip(
+            self.left[:n].tolist(), self.top[:n].tolist(),
+            self.width[:n].tolist(), self.height[:n].tolist())]
+
+    def draw(self, surface, alpha=1.0):
+        """Dessine traînées puis corps de tous les tirs en deux blits groupés.
+
+        alpha : avancement entre le tick précédent (0) et l'actuel (1), comme
+        pour le RenderInterpolator des écrans.
+        """
+        n = self.count
+        if n == 0:
+            return
+        types = self.types
+        trail_max = self.trail_max
+        trail_x = self.trail_x[:n].tolist()
+        trail_y = self.trail_y[:n].tolist()
+        trail_len = self.trail_len[:n].tolist()
+        type_ids = self.type_ids[:n].tolist()
+
+        trails = []
+        for i, type_id in enumerate(type_ids):
+            length = trail_len[i]
+            if length:
+                cache = types[type_id].trail_cache
+                xs, ys = trail_x[i], trail_y[i]
+                start = trail_max - length
+                for k in range(length):
+                    trail_surf, size = cache[k]
+                    trails.append((trail_surf, (xs[start + k] - size, ys[start + k] - size)))
+        surface.blits(trails, False)
+
+        left, top = self.left[:n], self.top[:n]
+        if alpha < 1.0:
+            prev_left, prev_top = self.prev_left[:n], self.prev_top[:n]
+            left = prev_left + np.rint((left - prev_left) * alpha).astype(np.int64)
+            top = prev_top + np.rint((top - prev_top) * alpha).astype(np.int64)
+        centers_x = (left + self.width[:n] // 2).tolist()
+        centers_y = (top + self.height[:n] // 2).tolist()
+        bodies = []
+        for type_id, cx, cy in zip(type_ids, centers_x, centers_y):
+            bullet_type = types[type_id]
+            offset = bullet_type.sprite_offset
+            bodies.append((bullet_type.sprite, (cx - offset, cy - offset)))
+        surface.blits(bodies, False)
@@ -1,11 +1,11 @@
-import pygame
-
 from config import SCREEN_WIDTH, YELLOW
+from . import sim_clock
 
 
 class ComboSystem:
     """Système de combo - se termine après 5s d'inactivité ou si un tir rate"""
-    def __init__(self):
+    def __init__(self, clock=None):
+        self.clock = clock or sim_clock.current()
         self.count = 0
         self.last_hit_time = 0
         self.timeout = 5000  # 5 secondes en millisecondes
@@ -13,7 +13,7 @@ class ComboSystem:
 
     def hit(self):
         """Appelé quand le joueur touche un ennemi"""
-        now = pygame.time.get_ticks()
+        now = self.clock.get_ticks()
         if not self.active:
             self.active = True
             self.count = 1
@@ -37,7 +37,7 @@ class ComboSystem:
     def update(self):
         """Met à jour le combo - vérifie le timeout"""
         if self.active:
-            now = pygame.time.get_ticks()
+            now = self.clock.get_ticks()
             if now - self.last_hit_time >= self.timeout:
                 print(f"Combo expiré ! (timeout) - Score final: {self.count}")
                 self.reset()
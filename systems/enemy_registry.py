@@ -0,0 +1,78 @@
+"""Registre des types d'ennemis : comportement résolu une fois par classe.
+
+Chaque classe d'ennemi est décrite par un EnemyKind (signature de mise à
+jour, boss ou non, explosions de mort, drapeau de défaite du niveau).
+La boucle de jeu fait un simple lookup par type au lieu d'enchaîner les
+isinstance ; ajouter un ennemi revient à ajouter une ligne ici.
+"""
+from entities.enemy import ShootingEnemy, DashEnemy
+from entities.bosses import Boss, Boss2, Boss3, Boss4, Boss5, Boss6, Boss7, Boss8, Boss9
+
+# Signatures de mise à jour
+UPDATE_SIMPLE = "simple"  # enemy.update(), appelé par Level.update
+UPDATE_TARGET = "target"  # enemy.update(cible, projectiles_ennemis)
+UPDATE_DUAL = "dual"      # enemy.update(joueur1, projectiles_ennemis, joueur2)
+UPDATE_DASH = "dash"      # enemy.update() par le niveau + update_with_player(cible)
+
+
+class EnemyKind:
+    """Description du comportement d'une classe d'ennemi."""
+    def __init__(self, update=UPDATE_SIMPLE, is_boss=False, death_explosions=None,
+                 defeat_flag=None, ends_game=False):
+        self.update = update
+        self.is_boss = is_boss
+        # (nombre, étendue en pixels, durée en ms) des explosions à la mort du boss
+        self.death_explosions = death_explosions
+        # Attribut du Level passé à True quand l'ennemi est vaincu
+        self.defeat_flag = defeat_flag
+        self.ends_game = ends_game
+        # Mis à jour par Level.update (sans cible)
+        self.level_update = update in (UPDATE_SIMPLE, UPDATE_DASH)
+
+
+DEFAULT_KIND = EnemyKind()
+
+_registry = {}
+# Classe concrète -> EnemyKind, rempli au premier lookup de chaque classe
+_resolved = {}
+
+
+def register(cls, kind):
+    """Associe un EnemyKind à une classe (et à ses sous-classes non enregistrées)."""
+    _registry[cls] = kind
+    _resolved.clear()
+
+
+def resolve(cls):
+    """Retourne l'EnemyKind d'une classe en remontant son MRO."""
+    kind = _resolved.get(cls)
+    if kind is None:
+        kind = next((_registry[base] for base in cls.__mro__ if base in _registry), DEFAULT_KIND)
+        _resolved[cls] = kind
+    return kind
+
+
+def kind_of(enemy):
+    """EnemyKind d'une instance : un lookup dans un dict après le premier appel."""
+    kind = _resolved.get(type(enemy))
+    if kind is None:
+        kind = resolve(type(enemy))
+    return kind
+
+
+def is_boss(enemy):
+    return kind_of(enemy).is_boss
+
+
+register(ShootingEnemy, EnemyKind(update=UPDATE_TARGET))
+register(DashEnemy, EnemyKind(update=UPDATE_DASH))
+
+register(Boss, EnemyKind(UPDATE_DUAL, True, (5, 100, 500), "boss1_defeated"))
+register(Boss2, EnemyKind(UPDATE_TARGET, True, (8, 120, 600), "boss2_defeated"))
+register(Boss3, EnemyKind(UPDATE_TARGET, True, (12, 140, 700), "boss3_defeated"))
+register(Boss4, EnemyKind(UPDATE_TARGET, True, (20, 160, 800), "boss4_defeated"))
+register(Boss5, EnemyKind(UPDATE_TARGET, True, (30, 180, 1000), "boss5_defeated"))
+register(Boss6, EnemyKind(UPDATE_TARGET, True, (40, 200, 1200), "boss6_defeated"))
+register(Boss7, EnemyKind(UPDATE_TARGET, True, (50, 180, 1300), "boss7_defeated"))
+register(Boss8, EnemyKind(UPDATE_TARGET, True, (60, 200, 1500), "boss8_defeated"))
+register(Boss9, EnemyKind(UPDATE_TARGET, True, (70, 220, 1800), ends_game=True))
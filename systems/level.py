@@ -8,138 +8,193 @@ from entities.enemy import (
     ShootingEnemy, TankEnemy, DashEnemy, SplitterEnemy
 )
 from entities.bosses import Boss, Boss2, Boss3, Boss4, Boss5, Boss6, Boss7, Boss8, Boss9
+from systems.enemy_registry import kind_of, UPDATE_SIMPLE
+from systems.spawn_timeline import SpawnTimeline, STAGE_EARLY, STAGE_LATE
+from systems.level_data import level_path, load_compiled
+from systems.movement_group import MovementGroup, group_key
 from systems.movement_patterns import (
     SineWavePattern, ZigZagPattern, SwoopPattern, HorizontalWavePattern
 )
 
 
+# Drapeau de défaite -> (délai avant le boss suivant, méthode de spawn)
+BOSS_TRANSITIONS = {
+    "boss1_defeated": ("boss2_spawn_delay", "spawn_boss2"),
+    "boss2_defeated": ("boss3_spawn_delay", "spawn_boss3"),
+    "boss3_defeated": ("boss4_spawn_delay", "spawn_boss4"),
+    "boss4_defeated": ("boss5_spawn_delay", "spawn_boss5"),
+    "boss5_defeated": ("boss6_spawn_delay", "spawn_boss6"),
+    "boss6_defeated": ("boss7_spawn_delay", "spawn_boss7"),
+    "boss7_defeated": ("boss8_spawn_delay", "spawn_boss8"),
+    "boss8_defeated": ("boss9_spawn_delay", "spawn_boss9"),
+}
+
+
 class Level:
-    def __init__(self):
+    def __init__(self, seed=None, bullet_pool=None, level_num=1):
         self.background = get_shared_background()
         set_background_speed(2)  # Vitesse standard pour le jeu
         self.timer = 0
+        # Flux aléatoire propre au niveau : même graine => même partie
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+        # Pool des tirs ennemis simples (None : les tirs restent des objets)
+        self.bullet_pool = bullet_pool
         self.enemies = []
-        self.spawn_events = [
-            (180, lambda: self.spawn_enemies(3)),
-            (300, lambda: self.spawn_formation_v(5)),
-            (480, lambda: self.spawn_sine_wave_group(4)),
-            (600, lambda: self.spawn_zigzag_group(3)),
-            (720, lambda: self.spawn_formation_line(6)),
-            (840, lambda: self.spawn_swoop_attack()),
-            (900, lambda: self.spawn_shooting_enemy(1)),
-            (1020, lambda: self.spawn_horizontal_squadron()),
-            (1200, lambda: self.spawn_boss())
-        ]
-        self.spawn_events.sort(key=lambda event: event[0])
+        # Ennemis déplacés en bloc, par classe de pattern de mouvement
+        self.movement_groups = {}
+        # Vagues (levels/levelN.json) et transitions de boss, triées par tick
+        self.level_num = level_num
+        self.definition = load_compiled(level_path(level_num), WAVE_NAMES)
+        self.timeline = SpawnTimeline()
+        self._schedule_waves(self.definition.waves, 0)
 
         self.boss1_defeated = False
-        self.boss1_defeat_timer = 0
         self.boss2_spawn_delay = 600
         self.boss2_spawned = False
 
         self.boss2_defeated = False
-        self.boss2_defeat_timer = 0
         self.boss3_spawn_delay = 600
         self.boss3_spawned = False
 
         self.boss3_defeated = False
-        self.boss3_defeat_timer = 0
         self.boss4_spawn_delay = 600
         self.boss4_spawned = False
 
         self.boss4_defeated = False
-        self.boss4_defeat_timer = 0
         self.boss5_spawn_delay = 600
         self.boss5_spawned = False
 
         self.boss5_defeated = False
-        self.boss5_defeat_timer = 0
         self.boss6_spawn_delay = 600
         self.boss6_spawned = False
 
         self.boss6_defeated = False
-        self.boss6_defeat_timer = 0
         self.boss7_spawn_delay = 600
         self.boss7_spawned = False
 
         self.boss7_defeated = False
-        self.boss7_defeat_timer = 0
         self.boss8_spawn_delay = 600
         self.boss8_spawned = False
 
         self.boss8_defeated = False
-        self.boss8_defeat_timer = 0
         self.boss9_spawn_delay = 600
         self.boss9_spawned = False
 
-        # Spawns d'ennemis post-boss1 (nouveaux ennemis)
-        self.post_boss1_spawn_events = []
-        self.post_boss1_spawns_initialized = False
+    def add_enemy(self, enemy):
+        """Ajoute un ennemi au niveau en lui transmettant le générateur aléatoire et le pool de tirs."""
+        enemy.rng = self.rng
+        enemy.bullet_pool = self.bullet_pool
+        self.enemies.append(enemy)
+        key = group_key(enemy)
+        # Les ennemis déplacés aussi hors de Level.update (dash...) restent seuls
+        if key is not False and kind_of(enemy).update == UPDATE_SIMPLE:
+            group = self.movement_groups.get(key)
+            if group is None:
+                group = self.movement_groups[key] = MovementGroup(key)
+            group.add(enemy)
+
+    def on_boss_defeated(self, defeat_flag):
+        """Lève le drapeau de défaite et programme l'arrivée du boss suivant."""
+        setattr(self, defeat_flag, True)
+        transition = BOSS_TRANSITIONS.get(defeat_flag)
+        if transition is None:
+            return
+        delay_attr, spawn_method = transition
+        # Le compte à rebours démarre au tick suivant la défaite
+        self.timeline.schedule(self.timer + getattr(self, delay_attr),
+                               getattr(self, spawn_method), STAGE_LATE)
+        if defeat_flag == "boss1_defeated":
+            self.timeline.schedule(self.timer + 1, self.initialize_post_boss1_spawns, STAGE_LATE)
+
+    def _schedule_waves(self, waves, start, stage=STAGE_EARLY, group=None):
+        for tick, wave, args in waves:
+            spawn = getattr(self, "spawn_" + wave)
+            self.timeline.schedule(start + tick, lambda spawn=spawn, args=args: spawn(*args), stage, group)
+
+    def load_wave_script(self, path, start=0):
+        """Programme les vagues d'un fichier de données (ticks relatifs à start)."""
+        self._schedule_waves(load_compiled(path, WAVE_NAMES).waves, start)
+
+    def kill(self, enemy):
+        """Marque un ennemi comme mort ; il reste dans la liste jusqu'à sweep().
+        Retourne False s'il était déjà mort."""
+        if not enemy.alive:
+            return False
+        enemy.alive = False
+        if enemy.movement_group is not None:
+            enemy.movement_group.dirty = True
+        return True
+
+    def sweep(self):
+        """Retire en une passe les ennemis tués pendant le tick."""
+        self.enemies = [e for e in self.enemies if e.alive]
 
     def spawn_enemies(self, count):
         for _ in range(count):
-            x = random.randint(20, SCREEN_WIDTH - 20)
+            x = self.rng.randint(20, SCREEN_WIDTH - 20)
             enemy = BasicEnemy(x, -20)
-            self.enemies.append(enemy)
+            self.add_enemy(enemy)
         print(f'Spawned {count} enemies at timer {self.timer}')
 
     def spawn_shooting_enemy(self, count):
         for _ in range(count):
-            x = random.randint(20, SCREEN_WIDTH - 20)
+            x = self.rng.randint(20, SCREEN_WIDTH - 20)
             enemy = ShootingEnemy(x, -20)
-            self.enemies.append(enemy)
+            self.add_enemy(enemy)
         print(f'Spawned {count} shooting enemy at timer {self.timer}')
 
     def spawn_boss(self):
         boss = Boss(SCREEN_WIDTH // 2, -50)
-        self.enemies.append(boss)
+        self.add_enemy(boss)
         print(f'Spawned boss at timer {self.timer}')
 
     def spawn_boss2(self):
         boss2 = Boss2(SCREEN_WIDTH // 2, -70)
-        self.enemies.append(boss2)
+        self.add_enemy(boss2)
         self.boss2_spawned = True
+        self.timeline.cancel("post_boss1")
         print(f'Spawned Boss 2 at timer {self.timer}')
 
     def spawn_boss3(self):
         boss3 = Boss3(SCREEN_WIDTH // 2, -80)
-        self.enemies.append(boss3)
+        self.add_enemy(boss3)
         self.boss3_spawned = True
         print(f'Spawned Boss 3 at timer {self.timer}')
 
     def spawn_boss4(self):
         boss4 = Boss4(SCREEN_WIDTH // 2, -90)
-        self.enemies.append(boss4)
+        self.add_enemy(boss4)
         self.boss4_spawned = True
         print(f'Spawned Boss 4 at timer {self.timer}')
 
     def spawn_boss5(self):
         boss5 = Boss5(SCREEN_WIDTH // 2, -100)
-        self.enemies.append(boss5)
+        self.add_enemy(boss5)
         self.boss5_spawned = True
         print(f'Spawned Boss 5 at timer {self.timer}')
 
     def spawn_boss6(self):
         boss6 = Boss6(SCREEN_WIDTH // 2, -110)
-        self.enemies.append(boss6)
+        self.add_enemy(boss6)
         self.boss6_spawned = True
         print(f'Spawned Boss 6 at timer {self.timer}')
 
     def spawn_boss7(self):
         boss7 = Boss7(SCREEN_WIDTH // 2, -100)
-        self.enemies.append(boss7)
+        self.add_enemy(boss7)
         self.boss7_spawned = True
         print(f'Spawned Boss 7 at timer {self.timer}')
 
     def spawn_boss8(self):
         boss8 = Boss8(SCREEN_WIDTH // 2, -120)
-        self.enemies.append(boss8)
+        self.add_enemy(boss8)
         self.boss8_spawned = True
         print(f'Spawned Boss 8 at timer {self.timer}')
 
     def spawn_boss9(self):
         boss9 = Boss9(SCREEN_WIDTH // 2, -130)
-        self.enemies.append(boss9)
+        self.add_enemy(boss9)
         self.boss9_spawned = True
         print(f'Spawned Boss 9 at timer {self.timer}')
 
@@ -151,7 +206,7 @@ class Level:
             offset = (i - count // 2) * spacing
             y_offset = abs(i - count // 2) * 30
             enemy = FormationVEnemy(center_x + offset, -20 - y_offset)
-            self.enemies.append(enemy)
+            self.add_enemy(enemy)
         print(f'Spawned V formation with {count} enemies at timer {self.timer}')
 
     def spawn_formation_line(self, count):
@@ -160,7 +215,7 @@ class Level:
         for i in range(count):
             x = spacing * (i + 1)
             enemy = FormationLineEnemy(x, -20)
-            self.enemies.append(enemy)
+            self.add_enemy(enemy)
         print(f'Spawned line formation with {count} enemies at timer {self.timer}')
 
     def spawn_sine_wave_group(self, count):
@@ -170,7 +225,7 @@ class Level:
             x = spacing * (i + 1)
             pattern = SineWavePattern(amplitude=80, frequency=0.05, base_speed=2.5)
             enemy = SineWaveEnemy(x, -20, movement_pattern=pattern)
-            self.enemies.append(enemy)
+            self.add_enemy(enemy)
         print(f'Spawned {count} sine wave enemies at timer {self.timer}')
 
     def spawn_zigzag_group(self, count):
@@ -180,20 +235,20 @@ class Level:
             x = spacing * (i + 1)
             pattern = ZigZagPattern(amplitude=60, switch_time=25, base_speed=3)
             enemy = ZigZagEnemy(x, -20, movement_pattern=pattern)
-            self.enemies.append(enemy)
+            self.add_enemy(enemy)
         print(f'Spawned {count} zigzag enemies at timer {self.timer}')
 
     def spawn_swoop_attack(self):
         """Spawn des ennemis qui font un pique depuis les cotes"""
         pattern_right = SwoopPattern(swoop_direction=1)
         enemy_left = SwoopEnemy(50, -20, movement_pattern=pattern_right)
-        self.enemies.append(enemy_left)
+        self.add_enemy(enemy_left)
 
         pattern_left = SwoopPattern(swoop_direction=-1)
         enemy_right = SwoopEnemy(SCREEN_WIDTH - 50, -20, movement_pattern=pattern_left)
-        self.enemies.append(enemy_right)
+        self.add_enemy(enemy_right)
 
-        powerup_dropper = random.choice([enemy_left, enemy_right])
+        powerup_dropper = self.rng.choice([enemy_left, enemy_right])
         powerup_dropper.drops_powerup = True
 
         print(f'Spawned swoop attack at timer {self.timer}')
@@ -206,7 +261,7 @@ class Level:
             start_x = 50 if direction == 1 else SCREEN_WIDTH - 50
             pattern = HorizontalWavePattern(direction=direction, speed=5)
             enemy = HorizontalEnemy(start_x, y, movement_pattern=pattern)
-            self.enemies.append(enemy)
+            self.add_enemy(enemy)
         print(f'Spawned horizontal squadron at timer {self.timer}')
 
     # ===== Nouveaux ennemis post-Boss 1 =====
@@ -214,9 +269,9 @@ class Level:
     def spawn_tank_enemies(self, count):
         """Spawn des TankEnemy - ennemis blindés et résistants"""
         for _ in range(count):
-            x = random.randint(60, SCREEN_WIDTH - 60)
+            x = self.rng.randint(60, SCREEN_WIDTH - 60)
             enemy = TankEnemy(x, -30)
-            self.enemies.append(enemy)
+            self.add_enemy(enemy)
         print(f'Spawned {count} tank enemies at timer {self.timer}')
 
     def spawn_dash_enemies(self, count):
@@ -225,28 +280,28 @@ class Level:
         for i in range(count):
             x = spacing * (i + 1)
             enemy = DashEnemy(x, -20)
-            self.enemies.append(enemy)
+            self.add_enemy(enemy)
         print(f'Spawned {count} dash enemies at timer {self.timer}')
 
     def spawn_splitter_enemies(self, count):
         """Spawn des SplitterEnemy - ennemis qui se divisent"""
         for _ in range(count):
-            x = random.randint(80, SCREEN_WIDTH - 80)
+            x = self.rng.randint(80, SCREEN_WIDTH - 80)
             enemy = SplitterEnemy(x, -30)
-            self.enemies.append(enemy)
+            self.add_enemy(enemy)
         print(f'Spawned {count} splitter enemies at timer {self.timer}')
 
     def spawn_mixed_wave_post_boss1(self):
         """Spawn une vague mixte avec les nouveaux types d'ennemis"""
         # Un tank au centre
         tank = TankEnemy(SCREEN_WIDTH // 2, -30)
-        self.enemies.append(tank)
+        self.add_enemy(tank)
 
         # Deux dashers sur les côtés
         dash_left = DashEnemy(100, -50)
         dash_right = DashEnemy(SCREEN_WIDTH - 100, -50)
-        self.enemies.append(dash_left)
-        self.enemies.append(dash_right)
+        self.add_enemy(dash_left)
+        self.add_enemy(dash_right)
         print(f'Spawned mixed wave at timer {self.timer}')
 
     def spawn_tank_formation(self):
@@ -254,7 +309,7 @@ class Level:
         positions = [SCREEN_WIDTH // 4, SCREEN_WIDTH // 2, 3 * SCREEN_WIDTH // 4]
         for x in positions:
             tank = TankEnemy(x, -40)
-            self.enemies.append(tank)
+            self.add_enemy(tank)
         print(f'Spawned tank formation at timer {self.timer}')
 
     def spawn_dash_ambush(self):
@@ -263,106 +318,32 @@ class Level:
             x = 50 if i % 2 == 0 else SCREEN_WIDTH - 50
             y = -20 - (i * 40)
             dash = DashEnemy(x, y)
-            self.enemies.append(dash)
+            self.add_enemy(dash)
         print(f'Spawned dash ambush at timer {self.timer}')
 
     def initialize_post_boss1_spawns(self):
-        """Initialise les événements de spawn après la défaite du Boss 1"""
-        base_timer = self.timer
-        self.post_boss1_spawn_events = [
-            (base_timer + 120, lambda: self.spawn_tank_enemies(2)),
-            (base_timer + 240, lambda: self.spawn_dash_enemies(3)),
-            (base_timer + 360, lambda: self.spawn_splitter_enemies(2)),
-            (base_timer + 480, lambda: self.spawn_mixed_wave_post_boss1()),
-            (base_timer + 550, lambda: self.spawn_shooting_enemy(2)),
-            (base_timer + 600, lambda: self.spawn_tank_formation()),
-            (base_timer + 720, lambda: self.spawn_dash_ambush()),
-            (base_timer + 800, lambda: self.spawn_splitter_enemies(3)),
-            (base_timer + 900, lambda: self.spawn_sine_wave_group(4)),
-            (base_timer + 1000, lambda: self.spawn_tank_enemies(1)),
-            (base_timer + 1000, lambda: self.spawn_dash_enemies(2)),
-        ]
-        self.post_boss1_spawn_events.sort(key=lambda event: event[0])
-        self.post_boss1_spawns_initialized = True
+        """Programme les spawns d'ennemis après la défaite du Boss 1"""
+        # Vague interrompue par l'arrivée du Boss 2 (voir spawn_boss2)
+        self._schedule_waves(self.definition.post_boss1, self.timer, STAGE_LATE, group="post_boss1")
         print(f'Initialized post-boss1 spawn events at timer {self.timer}')
 
     def update(self):
         self.background.update()
         self.timer += 1
-        events_to_remove = []
-        for event in self.spawn_events:
-            if self.timer >= event[0]:
-                event[1]()
-                events_to_remove.append(event)
-        for event in events_to_remove:
-            self.spawn_events.remove(event)
+        self.timeline.run(self.timer, STAGE_EARLY)
+        for group in self.movement_groups.values():
+            group.update()
         for enemy in self.enemies:
-            if not isinstance(enemy, (ShootingEnemy, Boss, Boss2, Boss3, Boss4, Boss5, Boss6, Boss7, Boss8, Boss9)):
+            if enemy.movement_group is None and kind_of(enemy).level_update:
                 enemy.update()
-        self.enemies = [e for e in self.enemies if (e.rect.top < SCREEN_HEIGHT or isinstance(e, (Boss, Boss2, Boss3, Boss4, Boss5, Boss6, Boss7, Boss8, Boss9)))]
-
-        # Gestion du spawn du Boss 2 apres defaite du Boss 1
-        if self.boss1_defeated and not self.boss2_spawned:
-            # Initialiser les spawns post-boss1 une seule fois
-            if not self.post_boss1_spawns_initialized:
-                self.initialize_post_boss1_spawns()
-
-            # Exécuter les spawns post-boss1
-            events_to_remove_post = []
-            for event in self.post_boss1_spawn_events:
-                if self.timer >= event[0]:
-                    event[1]()
-                    events_to_remove_post.append(event)
-            for event in events_to_remove_post:
-                self.post_boss1_spawn_events.remove(event)
-
-            self.boss1_defeat_timer += 1
-            if self.boss1_defeat_timer >= self.boss2_spawn_delay:
-                self.spawn_boss2()
-
-        # Gestion du spawn du Boss 3 apres defaite du Boss 2
-        if self.boss2_defeated and not self.boss3_spawned:
-            self.boss2_defeat_timer += 1
-            if self.boss2_defeat_timer >= self.boss3_spawn_delay:
-                self.spawn_boss3()
-
-        # Gestion du spawn du Boss 4 apres defaite du Boss 3
-        if self.boss3_defeated and not self.boss4_spawned:
-            self.boss3_defeat_timer += 1
-            if self.boss3_defeat_timer >= self.boss4_spawn_delay:
-                self.spawn_boss4()
-
-        # Gestion du spawn du Boss 5 apres defaite du Boss 4
-        if self.boss4_defeated and not self.boss5_spawned:
-            self.boss4_defeat_timer += 1
-            if self.boss4_defeat_timer >= self.boss5_spawn_delay:
-                self.spawn_boss5()
-
-        # Gestion du spawn du Boss 6 apres defaite du Boss 5
-        if self.boss5_defeated and not self.boss6_spawned:
-            self.boss5_defeat_timer += 1
-            if self.boss5_defeat_timer >= self.boss6_spawn_delay:
-                self.spawn_boss6()
-
-        # Gestion du spawn du Boss 7 apres defaite du Boss 6
-        if self.boss6_defeated and not self.boss7_spawned:
-            self.boss6_defeat_timer += 1
-            if self.boss6_defeat_timer >= self.boss7_spawn_delay:
-                self.spawn_boss7()
-
-        # Gestion du spawn du Boss 8 apres defaite du Boss 7
-        if self.boss7_defeated and not self.boss8_spawned:
-            self.boss7_defeat_timer += 1
-            if self.boss7_defeat_timer >= self.boss8_spawn_delay:
-                self.spawn_boss8()
-
-        # Gestion du spawn du Boss 9 apres defaite du Boss 8
-        if self.boss8_defeated and not self.boss9_spawned:
-            self.boss8_defeat_timer += 1
-            if self.boss8_defeat_timer >= self.boss9_spawn_delay:
-                self.spawn_boss9()
-
-        if any(isinstance(enemy, (Boss, Boss2, Boss3, Boss4, Boss5, Boss6, Boss7, Boss8, Boss9)) for enemy in self.enemies):
+        # Les ennemis sortis par le bas sont tués (et quittent leur groupe)
+        for enemy in self.enemies:
+            if enemy.rect.top >= SCREEN_HEIGHT and not kind_of(enemy).is_boss:
+                self.kill(enemy)
+        self.sweep()
+        self.timeline.run(self.timer, STAGE_LATE)
+
+        if any(kind_of(enemy).is_boss for enemy in self.enemies):
             if self.background.speed > 0:
                 self.background.speed = max(self.background.speed - 0.05, 0)
         else:
@@ -373,3 +354,7 @@ class Level:
         self.background.draw(surface)
         for enemy in self.enemies:
             enemy.draw(surface)
+
+
+# Noms de vagues utilisables dans les fichiers de niveau (méthodes spawn_<nom>)
+WAVE_NAMES = frozenset(name[len("spawn_"):] for name in dir(Level) if name.startswith("spawn_"))
@@ -0,0 +1,155 @@
+"""Niveaux décrits par des fichiers de données (levels/levelN.json).
+
+Format (JSON) :
+
+    {
+        "name": "Première vague",
+        "waves": [[180, "enemies", 3], [300, "formation_v", 5], [1200, "boss"]],
+        "post_boss1": [[120, "tank_enemies", 2]]
+    }
+
+Chaque vague est [tick, nom, arguments...] ; le nom désigne une méthode
+spawn_<nom> de Level. Les ticks de "waves" partent du début du niveau,
+ceux de "post_boss1" de la défaite du Boss 1.
+
+Un fichier est validé puis compilé (vagues triées par tick, prêtes à
+programmer dans l'échéancier) une seule fois : le résultat est mis en
+cache sur le disque (JSON, jamais de pickle : le dossier de cache n'est
+pas de confiance) sous le hash de son contenu, et en mémoire pour la
+session. Un fichier modifié change de hash et est recompilé.
+"""
+import hashlib
+import json
+import os
+import tempfile
+
+from resource_path import resource_path
+
+LEVELS_DIR = "levels"
+
+# Dossier du cache des niveaux compilés (par défaut dans le cache utilisateur)
+LEVEL_CACHE_ENV = "SPACEWAVE_LEVEL_CACHE"
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "spacewave", "levels")
+
+# À incrémenter quand la forme compilée change (invalide le cache)
+COMPILER_VERSION = 1
+
+WAVE_SECTIONS = ("waves", "post_boss1")
+
+_compiled = {}
+
+
+class CompiledLevel:
+    """Niveau validé : vagues triées sous forme de tuples (tick, nom, arguments)."""
+    def __init__(self, name, waves, post_boss1):
+        self.name = name
+        self.waves = waves
+        self.post_boss1 = post_boss1
+
+
+def level_path(level_num):
+    return resource_path(os.path.join(LEVELS_DIR, f"level{level_num}.json"))
+
+
+def level_exists(level_num):
+    return os.path.exists(level_path(level_num))
+
+
+def _parse_wave(entry, where, wave_names):
+    if isinstance(entry, dict):
+        # Forme longue, acceptée pour les scripts écrits à la main
+        entry = [entry.get("tick"), entry.get("wave"), *entry.get("args", [])]
+    if not isinstance(entry, list) or len(entry) < 2:
+        raise ValueError(f"{where} : vague attendue sous la forme [tick, nom, arguments...]")
+    tick, name, args = entry[0], entry[1], tuple(entry[2:])
+    if not isinstance(tick, int) or isinstance(tick, bool) or tick < 0:
+        raise ValueError(f"{where} : tick invalide {tick!r}")
+    if name not in wave_names:
+        raise ValueError(f"{where} : vague inconnue {name!r}")
+    for arg in args:
+        if not isinstance(arg, (int, float)) or isinstance(arg, bool):
+            raise ValueError(f"{where} : argument non numérique {arg!r}")
+    return tick, name, args
+
+
+def compile_level(data, source, wave_names):
+    """Valide les données d'un niveau et retourne un CompiledLevel."""
+    if isinstance(data, list):
+        # Script de vagues seul
+        data = {"waves": data}
+    if not isinstance(data, dict):
+        raise ValueError(f"{source} : objet ou liste de vagues attendu")
+    unknown = set(data) - {"name", *WAVE_SECTIONS}
+    if unknown:
+        raise ValueError(f"{source} : clés inconnues {sorted(unknown)}")
+
+    sections = {}
+    for section in WAVE_SECTIONS:
+        entries = data.get(section, [])
+        if not isinstance(entries, list):
+            raise ValueError(f"{source} : '{section}' doit être une liste")
+        waves = [_parse_wave(entry, f"{source} [{section} #{i}]", wave_names)
+                 for i, entry in enumerate(entries)]
+        # Tri stable : deux vagues au même tick gardent l'ordre du fichier
+        waves.sort(key=lambda wave: wave[0])
+        sections[section] = tuple(waves)
+    return CompiledLevel(str(data.get("name", source)), sections["waves"], sections["post_boss1"])
+
+
+def _cache_dir():
+    return os.environ.get(LEVEL_CACHE_ENV, DEFAULT_CACHE_DIR)
+
+
+def _read_cache(cache_path):
+    """Niveau compilé depuis le cache, ou None si le fichier est absent ou invalide."""
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            data = json.load(f)
+        return CompiledLevel(
+            str(data["name"]),
+            *(tuple((int(tick), str(name), tuple(args)) for tick, name, args in data[section])
+              for section in WAVE_SECTIONS))
+    except (OSError, ValueError, TypeError, KeyError):
+        # Fichier tronqué ou corrompu : le niveau est recompilé
+        return None
+
+
+def _write_cache(cache_path, level):
+    """Écrit le cache de façon atomique : fichier temporaire dans le même dossier puis os.replace."""
+    tmp_path = None
+    try:
+        directory = os.path.dirname(cache_path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"name": level.name, "waves": level.waves, "post_boss1": level.post_boss1}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Cache de niveau non écrit ({e})")
+        if tmp_path is not None and os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def load_compiled(path, wave_names):
+    """Charge un niveau compilé : mémoire, puis cache disque, sinon compilation."""
+    with open(path, "rb") as f:
+        content = f.read()
+    digest = hashlib.sha256(content)
+    digest.update(f"{COMPILER_VERSION}:{','.join(sorted(wave_names))}".encode("utf-8"))
+    key = digest.hexdigest()
+
+    level = _compiled.get(key)
+    if level is not None:
+        return level
+
+    cache_path = os.path.join(_cache_dir(), f"{key}.json")
+    level = _read_cache(cache_path)
+    if level is None:
+        level = compile_level(json.loads(content.decode("utf-8")), os.path.basename(path), wave_names)
+        _write_cache(cache_path, level)
+
+    _compiled[key] = level
+    return level
@@ -0,0 +1,168 @@
+"""Suivi de la mémoire (tracemalloc) et détection de fuites, en mode opt-in.
+
+Un MemoryTracker prend un instantané aux points de contrôle choisis par
+l'appelant (transitions de boss dans le simulateur, suppression d'un lobby
+sur le serveur) et affiche, par rapport au point précédent :
+- la mémoire Python retenue après une collecte du GC ;
+- les lignes de code dont les allocations retenues ont le plus grossi ;
+- le nombre d'instances vivantes de chaque classe d'entité.
+
+unbounded_growth() décide si une suite de mesures de mémoire retenue
+(une par campagne d'un soak) grossit sans limite.
+
+Avec la variable SPACEWAVE_MEMORY=1, le serveur suit sa mémoire à chaque
+suppression de lobby.
+"""
+import gc
+import os
+import tracemalloc
+from collections import Counter
+
+MEMORY_ENV = "SPACEWAVE_MEMORY"
+
+# Nombre de lignes de croissance affichées par point de contrôle
+TOP_SITES = 10
+# Modules dont les instances sont comptées
+ENTITY_MODULE_PREFIXES = ("entities.", "graphics.effects", "systems.special_weapon", "systems.object_pool")
+
+# Allocations propres au suivi (relevés compris), exclues des instantanés
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def entity_counts():
+    """Nombre d'instances vivantes par classe d'entité (objets suivis par le GC)."""
+    counts = Counter()
+    for obj in gc.get_objects():
+        cls = type(obj)
+        module = cls.__module__
+        if isinstance(module, str) and module.startswith(ENTITY_MODULE_PREFIXES):
+            counts[cls.__name__] += 1
+    return counts
+
+
+def unbounded_growth(samples, tolerance, warmup=1):
+    """Vrai si la mémoire retenue (octets, une mesure par itération) grossit sans limite.
+
+    Les `warmup` premières mesures sont ignorées (caches de sprites et de
+    polices remplis au premier passage). Une fuite se traduit par une
+    croissance à chaque itération : la croissance moyenne par itération
+    doit dépasser tolerance et aucune itération ne doit la faire baisser
+    franchement.
+    """
+    samples = samples[warmup:]
+    if len(samples) < 3:
+        return False
+    deltas = [after - before for before, after in zip(samples, samples[1:])]
+    mean_growth = (samples[-1] - samples[0]) / len(deltas)
+    return mean_growth > tolerance and min(deltas) > -tolerance
+
+
+class MemoryTracker:
+    """Points de contrôle tracemalloc ; chaque point est comparé au précédent."""
+
+    def __init__(self, frames=1, top=TOP_SITES, verbose=True):
+        self.frames = frames
+        self.top = top
+        self.verbose = verbose
+        self.checkpoints = []
+        self._snapshot = None
+        self._counts = Counter()
+        self._started_here = False
+
+    @property
+    def active(self):
+        return tracemalloc.is_tracing()
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_here = True
+        self._snapshot = None
+        self._counts = Counter()
+
+    def stop(self):
+        if self._started_here:
+            tracemalloc.stop()
+            self._started_here = False
+        self._snapshot = None
+
+    def checkpoint(self, label):
+        """Mesure la mémoire retenue et ce qui a grossi depuis le point précédent ; retourne le relevé."""
+        if not tracemalloc.is_tracing():
+            return None
+        gc.collect()
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        counts = entity_counts()
+        retained = sum(stat.size for stat in snapshot.statistics("filename"))
+
+        growth = []
+        if self._snapshot is not None:
+            for stat in snapshot.compare_to(self._snapshot, "lineno"):
+                if stat.size_diff <= 0:
+                    continue
+                frame = stat.traceback[0]
+                growth.append({"site": f"{frame.filename}:{frame.lineno}",
+                               "size_diff": stat.size_diff, "count_diff": stat.count_diff})
+                if len(growth) >= self.top:
+                    break
+
+        previous = self.checkpoints[-1]["retained"] if self.checkpoints else retained
+        record = {
+            "label": label,
+            "retained": retained,
+            "retained_diff": retained - previous,
+            "peak": tracemalloc.get_traced_memory()[1],
+            "growth": growth,
+            "objects": dict(counts),
+            "objects_diff": {name: counts[name] - self._counts[name]
+                             for name in counts.keys() | self._counts.keys()
+                             if counts[name] != self._counts[name]},
+        }
+        self.checkpoints.append(record)
+        self._snapshot = snapshot
+        self._counts = counts
+        if self.verbose:
+            print_checkpoint(record)
+        return record
+
+
+def _short(path):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.relpath(path, root) if path.startswith(root) else path
+
+
+def print_checkpoint(record):
+    print(f"[Mémoire] {record['label']} : {record['retained'] / 1024:.0f} Kio retenus "
+          f"({record['retained_diff'] / 1024:+.0f} Kio), pic {record['peak'] / 1024:.0f} Kio")
+    for site in record["growth"]:
+        filename, _, lineno = site["site"].rpartition(":")
+        print(f"    {site['size_diff'] / 1024:+9.1f} Kio {site['count_diff']:+7} blocs  {_short(filename)}:{lineno}")
+    changed = sorted(record["objects_diff"].items(), key=lambda item: -abs(item[1]))
+    if changed:
+        print("    objets : " + ", ".join(f"{name} {record['objects'].get(name, 0)} ({diff:+})"
+                                        for name, diff in changed[:8]))
+
+
+_tracker = None
+
+
+def tracker():
+    """MemoryTracker global (None si le suivi n'est pas activé)."""
+    return _tracker
+
+
+def enable_from_env():
+    """Démarre le suivi global si SPACEWAVE_MEMORY est défini."""
+    global _tracker
+    if not os.environ.get(MEMORY_ENV):
+        return None
+    _tracker = MemoryTracker()
+    _tracker.start()
+    _tracker.checkpoint("démarrage")
+    return _tracker
@@ -0,0 +1,101 @@
+"""Déplacement groupé des ennemis à pattern de mouvement.
+
+Les ennemis sans comportement propre (Enemy.update de base) qui partagent
+une classe de MovementPattern sont rangés dans un MovementGroup : positions,
+timers et paramètres du pattern sont des colonnes NumPy, et tout le groupe
+avance d'une frame en une seule évaluation vectorisée du pattern au lieu
+d'un appel update() par ennemi. Les ennemis sans pattern (descente en
+ligne droite, formations en V ou en ligne) forment le groupe de clé None.
+
+Le groupe fait foi pour la position de ses membres ; les rects sont
+réécrits à la fin de chaque update() du groupe, avant les collisions et
+l'affichage. Un membre tué est retiré au update() suivant.
+"""
+import numpy as np
+
+from entities.enemy import Enemy
+
+
+def _defines_update_group(pattern_class):
+    """Vrai si la classe qui fournit update() fournit aussi sa version groupée."""
+    for base in pattern_class.__mro__:
+        if "update" in vars(base):
+            return vars(base).get("update_group") is not None
+    return False
+
+
+_capable = {}
+
+
+def group_key(enemy):
+    """Clé du groupe d'un ennemi (classe de son pattern, ou None), ou False s'il doit rester seul."""
+    if type(enemy).update is not Enemy.update:
+        return False
+    pattern = enemy.movement_pattern
+    if not pattern:
+        return None
+    pattern_class = type(pattern)
+    capable = _capable.get(pattern_class)
+    if capable is None:
+        capable = _capable[pattern_class] = _defines_update_group(pattern_class)
+    return pattern_class if capable else False
+
+
+class MovementGroup:
+    def __init__(self, pattern_class=None):
+        self.pattern_class = pattern_class
+        self.fields = pattern_class.group_fields if pattern_class else ("speed",)
+        self.members = []
+        self.dirty = False
+        self.x = np.zeros(0, np.int64)
+        self.y = np.zeros(0, np.int64)
+        self.width = np.zeros(0, np.int64)
+        self.height = np.zeros(0, np.int64)
+        self.start_x = np.zeros(0, np.float64)
+        self.start_y = np.zeros(0, np.float64)
+        self.timer = np.zeros(0, np.int64)
+        self.params = {name: np.zeros(0, np.float64) for name in self.fields}
+
+    def __len__(self):
+        return len(self.members)
+
+    def add(self, enemy):
+        """Intègre un ennemi (au spawn) en copiant son état dans les colonnes."""
+        enemy.movement_group = self
+        self.members.append(enemy)
+        rect = enemy.rect
+        self.x = np.append(self.x, rect.x)
+        self.y = np.append(self.y, rect.y)
+        self.width = np.append(self.width, rect.width)
+        self.height = np.append(self.height, rect.height)
+        self.start_x = np.append(self.start_x, enemy.start_x)
+        self.start_y = np.append(self.start_y, enemy.start_y)
+        self.timer = np.append(self.timer, enemy.timer)
+        source = enemy.movement_pattern if self.pattern_class else enemy
+        for name in self.fields:
+            self.params[name] = np.append(self.params[name], getattr(source, name))
+
+    def _prune(self):
+        keep = np.fromiter((enemy.alive for enemy in self.members), bool, len(self.members))
+        self.members = [enemy for enemy in self.members if enemy.alive]
+        for name in ("x", "y", "width", "height", "start_x", "start_y", "timer"):
+            setattr(self, name, getattr(self, name)[keep])
+        for name in self.fields:
+            self.params[name] = self.params[name][keep]
+        self.dirty = False
+
+    def update(self):
+        """Équivalent de enemy.update() pour tous les membres."""
+        if self.dirty:
+            self._prune()
+        if not self.members:
+            return
+        self.timer += 1
+        if self.pattern_class is None:
+            # Enemy.update sans pattern : descente à vitesse constante
+            self.y = np.trunc(self.y + self.params["speed"]).astype(np.int64)
+        else:
+            self.pattern_class.update_group(self)
+        for enemy, x, y, timer in zip(self.members, self.x.tolist(), self.y.tolist(), self.timer.tolist()):
+            enemy.rect.topleft = (x, y)
+            enemy.timer = timer
@@ -1,10 +1,26 @@
 import math
 
+import numpy as np
+
 from config import SCREEN_WIDTH
 
 
+def _trunc(values):
+    """Conversion en entiers comme une affectation de flottant dans un pygame.Rect"""
+    return np.trunc(values).astype(np.int64)
+
+
 class MovementPattern:
-    """Classe de base pour les patterns de mouvement"""
+    """Classe de base pour les patterns de mouvement
+
+    update(enemy) déplace un ennemi ; update_group(group) fait la même chose
+    pour tout un MovementGroup d'un coup, sur ses tableaux x, y, timer...
+    Les attributs listés dans group_fields sont copiés par ennemi dans
+    group.params à l'entrée dans le groupe.
+    """
+    group_fields = ()
+    update_group = None
+
     def update(self, enemy):
         pass
 
@@ -16,11 +32,19 @@ class SineWavePattern(MovementPattern):
         self.frequency = frequency
         self.base_speed = base_speed
 
+    group_fields = ("amplitude", "frequency", "base_speed")
+
     def update(self, enemy):
         enemy.rect.y += self.base_speed
         offset_x = math.sin(enemy.timer * self.frequency) * self.amplitude
         enemy.rect.x = enemy.start_x + offset_x
 
+    @staticmethod
+    def update_group(group):
+        p = group.params
+        group.y = _trunc(group.y + p["base_speed"])
+        group.x = _trunc(group.start_x + np.sin(group.timer * p["frequency"]) * p["amplitude"])
+
 
 class ZigZagPattern(MovementPattern):
     """Mouvement en zigzag"""
@@ -29,11 +53,19 @@ class ZigZagPattern(MovementPattern):
         self.switch_time = switch_time
         self.base_speed = base_speed
 
+    group_fields = ("switch_time", "base_speed")
+
     def update(self, enemy):
         enemy.rect.y += self.base_speed
         direction = 1 if (enemy.timer // self.switch_time) % 2 == 0 else -1
         enemy.rect.x += direction * 3
 
+    @staticmethod
+    def update_group(group):
+        p = group.params
+        group.y = _trunc(group.y + p["base_speed"])
+        group.x += np.where((group.timer // p["switch_time"]) % 2 == 0, 3, -3)
+
 
 class CirclePattern(MovementPattern):
     """Mouvement circulaire"""
@@ -42,6 +74,8 @@ class CirclePattern(MovementPattern):
         self.angular_speed = angular_speed
         self.base_speed = base_speed
 
+    group_fields = ("radius", "angular_speed", "base_speed")
+
     def update(self, enemy):
         enemy.rect.y += self.base_speed
         angle = enemy.timer * self.angular_speed
@@ -50,6 +84,14 @@ class CirclePattern(MovementPattern):
         enemy.rect.x = enemy.start_x + offset_x
         enemy.rect.centery = enemy.start_y + (enemy.timer * self.base_speed) + offset_y
 
+    @staticmethod
+    def update_group(group):
+        p = group.params
+        angle = group.timer * p["angular_speed"]
+        group.x = _trunc(group.start_x + np.cos(angle) * p["radius"])
+        centery = _trunc(group.start_y + (group.timer * p["base_speed"]) + np.sin(angle) * p["radius"])
+        group.y = centery - group.height // 2
+
 
 class SwoopPattern(MovementPattern):
     """Mouvement en piqué puis remontée latérale"""
@@ -57,6 +99,8 @@ class SwoopPattern(MovementPattern):
         self.swoop_direction = swoop_direction  # 1 pour droite, -1 pour gauche
         self.phase = 0
 
+    group_fields = ("swoop_direction",)
+
     def update(self, enemy):
         if enemy.timer < 60:
             enemy.rect.y += 5
@@ -67,6 +111,15 @@ class SwoopPattern(MovementPattern):
             enemy.rect.y -= 1
             enemy.rect.x += self.swoop_direction * 3
 
+    @staticmethod
+    def update_group(group):
+        timer = group.timer
+        direction = group.params["swoop_direction"]
+        dive = timer < 60
+        turn = ~dive & (timer < 120)
+        group.y += np.where(dive, 5, np.where(turn, 2, -1))
+        group.x = _trunc(group.x + direction * np.where(dive, 0, np.where(turn, 4, 3)))
+
 
 class HorizontalWavePattern(MovementPattern):
     """Se déplace horizontalement avec légère descente"""
@@ -74,8 +127,19 @@ class HorizontalWavePattern(MovementPattern):
         self.direction = direction
         self.speed = speed
 
+    # direction est modifiée par le groupe : l'instance n'est plus lue ensuite
+    group_fields = ("direction", "speed")
+
     def update(self, enemy):
         enemy.rect.x += self.direction * self.speed
         enemy.rect.y += 1
         if enemy.rect.left <= 0 or enemy.rect.right >= SCREEN_WIDTH:
             self.direction *= -1
+
+    @staticmethod
+    def update_group(group):
+        direction = group.params["direction"]
+        group.x = _trunc(group.x + direction * group.params["speed"])
+        group.y += 1
+        edge = (group.x <= 0) | (group.x + group.width >= SCREEN_WIDTH)
+        direction[edge] *= -1
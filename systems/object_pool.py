@@ -0,0 +1,87 @@
+"""Pools d'objets (listes libres) pour les entités créées et jetées en masse.
+
+Tirs du joueur, explosions, éclats de SplittingProjectile et projectiles
+synchronisés côté client sont recyclés au lieu d'être réalloués : acquire()
+réutilise un objet libéré en le réinitialisant via sa méthode reset(...),
+qui prend les mêmes paramètres que le constructeur.
+"""
+
+# Nombre maximum d'objets gardés en réserve par classe
+MAX_FREE = 512
+
+
+class ObjectPool:
+    """Liste libre typée : un pool par classe."""
+
+    def __init__(self, cls, max_free=MAX_FREE):
+        self.cls = cls
+        self.max_free = max_free
+        self._free = []
+        self.acquired = 0
+        self.released = 0
+        self.created = 0
+        self.dropped = 0
+
+    def acquire(self, *args, **kwargs):
+        """Retourne un objet prêt à l'emploi, recyclé si possible."""
+        self.acquired += 1
+        if self._free:
+            obj = self._free.pop()
+            obj._in_pool = False
+            obj.reset(*args, **kwargs)
+            return obj
+        self.created += 1
+        return self.cls(*args, **kwargs)
+
+    def release(self, obj):
+        """Rend un objet au pool ; il ne doit plus être référencé ailleurs."""
+        if getattr(obj, '_in_pool', False):
+            return
+        if len(self._free) >= self.max_free:
+            self.dropped += 1
+            return
+        obj._in_pool = True
+        self._free.append(obj)
+        self.released += 1
+
+    def stats(self):
+        return {
+            "acquired": self.acquired,
+            "released": self.released,
+            "created": self.created,
+            "dropped": self.dropped,
+            "free": len(self._free),
+        }
+
+
+_pools = {}
+
+
+def get_pool(cls):
+    pool = _pools.get(cls)
+    if pool is None:
+        pool = ObjectPool(cls)
+        _pools[cls] = pool
+    return pool
+
+
+def acquire(cls, *args, **kwargs):
+    """Équivalent recyclé de cls(*args, **kwargs)."""
+    return get_pool(cls).acquire(*args, **kwargs)
+
+
+def release(obj):
+    """Rend obj au pool de sa classe (ignoré si la classe n'est pas poolée)."""
+    pool = _pools.get(type(obj))
+    if pool is not None:
+        pool.release(obj)
+
+
+def release_all(objects):
+    for obj in objects:
+        release(obj)
+
+
+def pool_stats():
+    """Compteurs acquire/release par classe, pour le diagnostic."""
+    return {cls.__name__: pool.stats() for cls, pool in _pools.items()}
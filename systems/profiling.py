@@ -0,0 +1,89 @@
+"""Chronométrage des sous-systèmes, sans coût quand il est inactif.
+
+Les méthodes à mesurer sont remplacées sur l'instance (pas sur la classe)
+par une version chronométrée ; restore() supprime ces remplacements. Le
+code du jeu n'a donc ni appel de chronomètre ni test « profilage actif ? »
+sur son chemin normal. Utilisé par le simulateur de campagne et par
+l'overlay de performances.
+
+Les temps sont exclusifs : une méthode chronométrée appelée par une autre
+(le fond, mis à jour par Level.update) n'est comptée que sous son propre
+libellé, et la somme des libellés ne compte rien deux fois.
+"""
+import time
+
+# Sous-systèmes de World.step : (libellé, chemin de la méthode depuis le World)
+WORLD_SUBSYSTEMS = (
+    ("joueurs", "_update_players"),
+    ("niveau", "level.update"),
+    ("tirs joueur", "_update_projectiles"),
+    ("ennemis", "_update_enemies"),
+    ("tirs ennemis", "_update_enemy_projectiles"),
+    ("collisions tirs", "_check_projectile_collisions"),
+    ("collisions tirs ennemis", "_check_enemy_projectile_collisions"),
+    ("collisions ennemis", "_check_enemy_collisions"),
+    ("laser", "_check_laser_collision"),
+    ("explosions", "_update_explosions"),
+    ("power-ups", "_update_powerups"),
+    ("combo", "combo.update"),
+    ("arme spéciale", "special_weapon.update"),
+    ("nettoyage", "_sweep"),
+)
+
+
+def resolve(root, path):
+    """(objet, nom de méthode) désignés par un chemin pointé depuis root."""
+    owner_path, _, method = path.rpartition(".")
+    owner = root
+    for attr in filter(None, owner_path.split(".")):
+        owner = getattr(owner, attr)
+    return owner, method
+
+
+class SubsystemTimer:
+    """Temps cumulé (secondes) par libellé, pour les méthodes instrumentées."""
+
+    def __init__(self):
+        self.totals = {}
+        self._patched = []
+        # Temps des appels chronométrés imbriqués, par niveau d'appel en cours
+        self._children = []
+
+    def instrument(self, owner, method, name):
+        """Chronomètre owner.method() sous le libellé name (cumulé avec les autres méthodes du même libellé)."""
+        func = getattr(owner, method)
+        totals = self.totals
+        totals.setdefault(name, 0.0)
+        children = self._children
+        perf_counter = time.perf_counter
+
+        def timed(*args, **kwargs):
+            children.append(0.0)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                totals[name] += elapsed - children.pop()
+                if children:
+                    children[-1] += elapsed
+
+        setattr(owner, method, timed)
+        self._patched.append((owner, method))
+
+    def instrument_paths(self, root, subsystems):
+        for name, path in subsystems:
+            self.instrument(*resolve(root, path), name)
+
+    def restore(self):
+        """Retire les versions chronométrées (les méthodes de la classe reprennent la main)."""
+        for owner, method in reversed(self._patched):
+            try:
+                delattr(owner, method)
+            except AttributeError:
+                pass
+        self._patched.clear()
+
+    def reset(self):
+        for name in self.totals:
+            self.totals[name] = 0.0
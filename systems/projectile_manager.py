@@ -5,48 +5,92 @@ Permet de gérer tous les projectiles depuis un seul endroit.
 
 import inspect
 from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from systems.steering import update_homing
 from entities.projectiles import (
     HomingProjectile, EdgeRollerProjectile, BallBreakerProjectile,
     SplittingProjectile, MirrorProjectile, BlackHoleProjectile, PulseWaveProjectile
 )
 
 
-def update_enemy_projectiles(projectiles, player_position):
+# Conventions d'appel de update() selon les paramètres attendus
+UPDATE_PLAIN = 0       # update() - Ex: EnemyProjectile standard
+UPDATE_PLAYER = 1      # update(player_position) - Ex: HomingProjectile
+UPDATE_OTHERS = 2      # update(other_projectiles) - Ex: BallBreakerProjectile (reçoit les balles)
+UPDATE_BOTH = 3        # update(player_position, other_projectiles) - Ex: EdgeRollerProjectile
+
+# Classe de projectile -> convention d'appel, résolue une seule fois par classe
+_update_modes = {}
+
+# Seules collisions entre projectiles : les balles du Boss 7 rebondissent l'une sur l'autre
+BALL_CLASSES = (EdgeRollerProjectile, BallBreakerProjectile)
+
+
+def get_update_mode(projectile_class):
+    """
+    Retourne la convention d'appel de update() pour une classe de projectile.
+
+    Une classe peut la déclarer explicitement via l'attribut `update_mode` ;
+    sinon elle est déduite de la signature de update() au premier appel
+    puis mise en cache.
+    """
+    mode = _update_modes.get(projectile_class)
+    if mode is None:
+        mode = getattr(projectile_class, 'update_mode', None)
+        if mode is None:
+            params = inspect.signature(projectile_class.update).parameters
+            mode = (UPDATE_PLAYER if 'player_position' in params else UPDATE_PLAIN) | \
+                   (UPDATE_OTHERS if 'other_projectiles' in params else UPDATE_PLAIN)
+        _update_modes[projectile_class] = mode
+    return mode
+
+
+def update_enemy_projectiles(projectiles, player_position, player_positions=None):
     """
-    Met à jour tous les projectiles ennemis en détectant automatiquement
-    leurs besoins via introspection.
+    Met à jour tous les projectiles ennemis selon la convention d'appel
+    de leur classe (voir get_update_mode).
 
     Args:
         projectiles: Liste des projectiles ennemis à mettre à jour
         player_position: Tuple (x, y) de la position du joueur
+        player_positions: En multijoueur, positions de tous les joueurs vivants ;
+            chaque projectile vise alors le plus proche horizontalement
 
     Returns:
         Liste mise à jour des projectiles (incluant les nouveaux projectiles issus de divisions)
     """
-    # Mise à jour de chaque projectile
-    for proj in projectiles:
-        # Obtenir la signature de la méthode update
-        update_method = proj.update
-        sig = inspect.signature(update_method)
-        params = list(sig.parameters.keys())
-
-        # Appeler update() avec les bons paramètres selon ce que le projectile attend
-        if 'player_position' in params and 'other_projectiles' in params:
-            # Le projectile a besoin de la position du joueur ET des autres projectiles
-            # Ex: EdgeRollerProjectile
-            proj.update(player_position, projectiles)
-        elif 'player_position' in params:
-            # Le projectile a besoin seulement de la position du joueur
-            # Ex: HomingProjectile
-            proj.update(player_position)
-        elif 'other_projectiles' in params:
-            # Le projectile a besoin seulement des autres projectiles
-            # Ex: BallBreakerProjectile
-            proj.update(projectiles)
-        else:
-            # Le projectile n'a besoin de rien
-            # Ex: EnemyProjectile standard
+    modes = _update_modes
+    # Tirs à tête chercheuse guidés en lot (NumPy), sautés dans la boucle
+    batched = update_homing(projectiles, player_position, player_positions)
+    if batched:
+        skip = set(map(id, batched))
+        pending = [proj for proj in projectiles if id(proj) not in skip]
+    else:
+        pending = projectiles
+    balls = None
+    for proj in pending:
+        mode = modes.get(proj.__class__)
+        if mode is None:
+            mode = get_update_mode(proj.__class__)
+
+        if mode == UPDATE_PLAIN:
             proj.update()
+            continue
+
+        if mode & UPDATE_OTHERS and balls is None:
+            # Index des balles (ordre de la liste) : chaque balle ne parcourt que
+            # les autres balles et non tous les tirs à l'écran
+            balls = [p for p in projectiles if isinstance(p, BALL_CLASSES)]
+
+        if mode & UPDATE_PLAYER:
+            target = player_position
+            if player_positions:
+                target = min(player_positions, key=lambda p: abs(p[0] - proj.rect.centerx))
+            if mode & UPDATE_OTHERS:
+                proj.update(target, balls)
+            else:
+                proj.update(target)
+        else:
+            proj.update(balls)
 
     # Gérer les projectiles qui se divisent
     new_split = []
@@ -85,7 +129,7 @@ def filter_enemy_projectiles(projectiles):
     )]
 
 
-def manage_enemy_projectiles(projectiles, player_position):
+def manage_enemy_projectiles(projectiles, player_position, player_positions=None):
     """
     Fonction principale pour gérer tous les projectiles ennemis :
     - Met à jour tous les projectiles
@@ -95,12 +139,13 @@ def manage_enemy_projectiles(projectiles, player_position):
     Args:
         projectiles: Liste des projectiles ennemis
         player_position: Tuple (x, y) de la position du joueur
+        player_positions: Positions de tous les joueurs vivants (multijoueur)
 
     Returns:
         Liste mise à jour et filtrée des projectiles
     """
     # Mettre à jour et gérer les divisions
-    projectiles = update_enemy_projectiles(projectiles, player_position)
+    projectiles = update_enemy_projectiles(projectiles, player_position, player_positions)
 
     # Filtrer les projectiles
     projectiles = filter_enemy_projectiles(projectiles)
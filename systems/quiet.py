@@ -0,0 +1,19 @@
+"""Mise en sourdine des logs du jeu (print) pour les outils en ligne de commande.
+
+Le jeu journalise par print (spawns, boss, power-ups...). Simulateur,
+replays, stress test et benchmarks les coupent pendant la simulation avec
+`with quiet():` : la sortie standard est redirigée vers os.devnull, puis
+rétablie même en cas d'exception.
+"""
+import contextlib
+import os
+
+
+@contextlib.contextmanager
+def quiet(active=True):
+    """Redirige la sortie standard vers os.devnull (sans effet si active est faux)."""
+    if not active:
+        yield
+        return
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        yield
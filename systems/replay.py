@@ -0,0 +1,198 @@
+"""Enregistrement des inputs et rejeu déterministe des parties (solo et lobby).
+
+Une partie est entièrement décrite par sa graine et le flux d'inputs par tick :
+le fichier de replay ne contient que ces deux éléments, compressés
+(palette des combinaisons d'inputs + encodage par plages, puis gzip).
+
+Usage : python -m systems.replay chemin/vers/partie.replay.gz [--max-ticks N]
+"""
+import gzip
+import json
+import os
+import time
+
+import pygame
+
+from config import FPS, SCREEN_WIDTH, SCREEN_HEIGHT
+from systems.quiet import quiet
+
+# 2 : les particules du réacteur ne tirent plus du générateur de la simulation
+REPLAY_VERSION = 2
+
+# Dossier où sauvegarder automatiquement les parties (désactivé si non défini)
+REPLAY_DIR_ENV = "SPACEWAVE_REPLAY_DIR"
+
+# Input neutre (aucun déplacement, pas de tir)
+IDLE_INPUT = (0, 0, False)
+
+
+class InputRecorder:
+    """Enregistre le flux d'inputs d'une partie, tick par tick.
+
+    Chaque frame est un tuple contenant un input (dx, dy, shoot) par joueur,
+    ou None si le joueur a quitté la partie.
+    """
+    def __init__(self, seed, mode="solo", players=1, level_num=1):
+        self.seed = seed
+        self.mode = mode
+        self.players = players
+        self.level_num = level_num
+        self.palette = []
+        self._palette_index = {}
+        self.runs = []  # [index dans la palette, nombre de ticks]
+        self.ticks = 0
+        self.saved = False
+
+    def record(self, frame):
+        """Ajoute les inputs d'un tick de simulation."""
+        frame = tuple(
+            None if inp is None else (inp[0], inp[1], bool(inp[2]))
+            for inp in frame
+        )
+        index = self._palette_index.get(frame)
+        if index is None:
+            index = len(self.palette)
+            self.palette.append(frame)
+            self._palette_index[frame] = index
+
+        if self.runs and self.runs[-1][0] == index:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([index, 1])
+        self.ticks += 1
+
+    def to_dict(self):
+        return {
+            "version": REPLAY_VERSION,
+            "mode": self.mode,
+            "seed": self.seed,
+            "players": self.players,
+            "level": self.level_num,
+            "ticks": self.ticks,
+            "palette": [[None if inp is None else list(inp) for inp in frame]
+                        for frame in self.palette],
+            "runs": self.runs,
+        }
+
+    def save(self, path):
+        """Écrit le replay compressé sur le disque."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+        self.saved = True
+        return path
+
+
+def save_if_enabled(recorder, name):
+    """Sauvegarde le replay dans SPACEWAVE_REPLAY_DIR si la variable est définie."""
+    directory = os.environ.get(REPLAY_DIR_ENV)
+    if not directory or recorder is None or recorder.saved:
+        return None
+    filename = f"{name}-{time.strftime('%Y%m%d-%H%M%S')}-{recorder.seed}.replay.gz"
+    path = recorder.save(os.path.join(directory, filename))
+    print(f"Replay sauvegardé : {path} ({recorder.ticks} ticks)")
+    return path
+
+
+class Replay:
+    """Replay chargé depuis le disque."""
+    def __init__(self, data):
+        if data.get("version") != REPLAY_VERSION:
+            raise ValueError(f"Version de replay non supportée : {data.get('version')}")
+        self.mode = data["mode"]
+        self.seed = data["seed"]
+        self.players = data["players"]
+        self.level_num = data.get("level", 1)
+        self.ticks = data["ticks"]
+        self.palette = [
+            tuple(None if inp is None else (inp[0], inp[1], inp[2]) for inp in frame)
+            for frame in data["palette"]
+        ]
+        self.runs = data["runs"]
+
+    @classmethod
+    def load(cls, path):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def frames(self):
+        """Itère sur les inputs de chaque tick, dans l'ordre."""
+        for index, count in self.runs:
+            frame = self.palette[index]
+            for _ in range(count):
+                yield frame
+
+
+def replay_solo(replay, max_ticks=None):
+    """Rejoue une partie solo via GameScreen, sans rendu. Retourne l'écran final."""
+    from screens.game_screen import GameScreen
+
+    frames = replay.frames()
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    game = GameScreen(surface, seed=replay.seed, level_num=replay.level_num,
+                      input_source=(frame[0] or IDLE_INPUT for frame in frames))
+    for _ in range(replay.ticks if max_ticks is None else min(max_ticks, replay.ticks)):
+        game.update()
+        if game.game_over or game.victory:
+            break
+    return game
+
+
+def replay_lobby(replay, max_ticks=None):
+    """Rejoue une partie multijoueur avec la même simulation que le serveur."""
+    from systems.world import World
+
+    # Même initialisation que GameServer._start_game
+    world = World(num_players=replay.players, seed=replay.seed,
+                  headless=True, combo_enabled=False)
+    for tick, frame in enumerate(replay.frames()):
+        if max_ticks is not None and tick >= max_ticks:
+            break
+        inputs = {}
+        for slot, inp in enumerate(frame):
+            if inp is None:
+                # Joueur parti en cours de partie
+                world.remove_player(world.get_player(slot + 1))
+            else:
+                inputs[slot + 1] = inp
+        world.step(inputs)
+        if world.game_over or world.victory:
+            break
+    return world
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Rejoue une partie enregistrée sans rendu.")
+    parser.add_argument("path", help="Fichier .replay.gz")
+    parser.add_argument("--max-ticks", type=int, default=None)
+    parser.add_argument("--verbose", action="store_true", help="Garder les logs du jeu")
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+    replay = Replay.load(args.path)
+    print(f"Replay {replay.mode} - graine {replay.seed}, {replay.ticks} ticks, "
+          f"{replay.players} joueur(s)")
+
+    start = time.perf_counter()
+    with quiet(not args.verbose):
+        if replay.mode == "lobby":
+            result = replay_lobby(replay, args.max_ticks)
+        else:
+            result = replay_solo(replay, args.max_ticks)
+    elapsed = time.perf_counter() - start
+
+    outcome = "victoire" if result.victory else "game over" if result.game_over else "en cours"
+    timer = result.level.timer
+    print(f"Terminé : {timer} ticks en {elapsed:.2f}s "
+          f"({timer / FPS / max(elapsed, 1e-9):.1f}x temps réel) - {outcome}")
+
+
+if __name__ == "__main__":
+    main()
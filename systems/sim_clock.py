@@ -0,0 +1,61 @@
+"""Horloge de simulation : le temps du jeu avance avec les ticks, pas avec le mur.
+
+Les durées de la simulation (cadence de tir, invulnérabilité, power-ups,
+combo, explosions) restent exprimées en millisecondes, mais elles sont
+lues sur une SimClock qui avance de 1000 / FPS ms par tick simulé. Une
+partie en pause ne fait plus expirer les power-ups, une simulation sans
+rendu tourne aussi vite que le CPU le permet, et le serveur comme les
+replays retrouvent exactement les mêmes durées.
+
+Chaque World possède sa SimClock et la passe à ses joueurs et à son
+combo. Les objets créés pendant un tick sans recevoir d'horloge (explosions
+des boss, par exemple) prennent l'horloge courante, installée par
+World.step. Hors de toute simulation, l'horloge courante est l'horloge
+murale de pygame.
+"""
+import pygame
+
+from config import FPS
+
+
+class WallClock:
+    """Temps réel (pygame.time.get_ticks), pour le code hors simulation."""
+
+    def get_ticks(self):
+        return pygame.time.get_ticks()
+
+
+class SimClock:
+    """Horloge dérivée du numéro de tick."""
+
+    def __init__(self, fps=FPS):
+        self.fps = fps
+        self.tick = 0
+        self._previous = []
+
+    def advance(self, ticks=1):
+        self.tick += ticks
+
+    def get_ticks(self):
+        """Millisecondes de simulation écoulées (même unité que pygame.time.get_ticks)."""
+        return self.tick * 1000 // self.fps
+
+    def __enter__(self):
+        """Installe l'horloge comme horloge courante (réentrant)."""
+        global _current
+        self._previous.append(_current)
+        _current = self
+        return self
+
+    def __exit__(self, *exc):
+        global _current
+        _current = self._previous.pop()
+
+
+WALL_CLOCK = WallClock()
+_current = WALL_CLOCK
+
+
+def current():
+    """Horloge courante : celle de la simulation en cours, sinon l'horloge murale."""
+    return _current
@@ -0,0 +1,98 @@
+"""Grille de hachage spatial uniforme pour la détection de collisions (broadphase).
+
+Les objets sont rangés dans des cellules carrées selon leur rectangle ;
+une requête ne renvoie que les objets des cellules touchées, et seul ce
+sous-ensemble passe par le test exact (colliderect, distance...).
+
+Les résultats sont rendus dans l'ordre d'insertion : parcourir les
+candidats revient à parcourir la liste d'origine en sautant les objets
+trop éloignés, ce qui garde la simulation identique (replays).
+"""
+
+# 800x1000 => 10 x 13 cellules ; un ennemi standard (40 px) en touche 1 à 4
+CELL_SIZE = 80
+
+
+class SpatialHash:
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        # id(objet) -> (ordre d'insertion, objet, clés des cellules)
+        self._entries = {}
+        self._next_order = 0
+
+    @classmethod
+    def from_objects(cls, objects, cell_size=CELL_SIZE):
+        """Construit une grille contenant les objets (indexés par leur rect)."""
+        grid = cls(cell_size)
+        for obj in objects:
+            grid.insert(obj)
+        return grid
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, obj):
+        return id(obj) in self._entries
+
+    def clear(self):
+        self.cells.clear()
+        self._entries.clear()
+        self._next_order = 0
+
+    def _cell_keys(self, left, top, right, bottom):
+        size = self.cell_size
+        x0, x1 = int(left // size), int(max(right - 1, left) // size)
+        y0, y1 = int(top // size), int(max(bottom - 1, top) // size)
+        return [(cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)]
+
+    def insert(self, obj, rect=None):
+        """Ajoute un objet ; rect remplace obj.rect comme zone couverte."""
+        if id(obj) in self._entries:
+            self.remove(obj)
+        rect = rect if rect is not None else obj.rect
+        keys = self._cell_keys(rect.left, rect.top, rect.right, rect.bottom)
+        entry = (self._next_order, obj, keys)
+        self._next_order += 1
+        self._entries[id(obj)] = entry
+        for key in keys:
+            bucket = self.cells.get(key)
+            if bucket is None:
+                self.cells[key] = [entry]
+            else:
+                bucket.append(entry)
+
+    def remove(self, obj):
+        entry = self._entries.pop(id(obj), None)
+        if entry is None:
+            return
+        for key in entry[2]:
+            bucket = self.cells[key]
+            bucket.remove(entry)
+            if not bucket:
+                del self.cells[key]
+
+    def _query(self, boxes):
+        cells = self.cells
+        found = {}
+        for left, top, right, bottom in boxes:
+            for key in self._cell_keys(left, top, right, bottom):
+                bucket = cells.get(key)
+                if bucket:
+                    for order, obj, _ in bucket:
+                        found[order] = obj
+        if len(found) < 2:
+            return list(found.values())
+        return [found[order] for order in sorted(found)]
+
+    def query_rect(self, rect):
+        """Objets dont les cellules recoupent le rectangle (à confirmer par un test exact)."""
+        return self._query(((rect.left, rect.top, rect.right, rect.bottom),))
+
+    def query_rects(self, rects):
+        """Union des candidats de plusieurs rectangles, dans l'ordre d'insertion."""
+        return self._query([(r.left, r.top, r.right, r.bottom) for r in rects])
+
+    def query_radius(self, x, y, radius):
+        """Objets proches du cercle (x, y, radius) (à confirmer par un test de distance)."""
+        return self._query(((x - radius, y - radius, x + radius + 1, y + radius + 1),))
@@ -0,0 +1,48 @@
+"""Échéancier des spawns du niveau (file de priorité par tick).
+
+Chaque événement est rangé dans un tas par (tick, étape, ordre
+d'insertion) : programmer un événement coûte O(log n) et, à chaque frame,
+savoir s'il y a quelque chose à déclencher revient à regarder le sommet du
+tas. Un niveau très long ne coûte donc rien tant que ses vagues ne sont
+pas dues.
+
+Deux étapes par tick, pour garder l'ordre historique de Level.update :
+- STAGE_EARLY : avant la mise à jour des ennemis (vagues du niveau) ;
+- STAGE_LATE : après (vagues post-boss, arrivée du boss suivant).
+"""
+import heapq
+
+STAGE_EARLY = 0
+STAGE_LATE = 1
+
+
+class SpawnTimeline:
+    def __init__(self):
+        self._heap = []
+        self._next_order = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+    def schedule(self, tick, action, stage=STAGE_EARLY, group=None):
+        """Programme action() au tick donné ; group permet d'annuler un lot d'événements."""
+        heapq.heappush(self._heap, (tick, stage, self._next_order, action, group))
+        self._next_order += 1
+
+    def cancel(self, group):
+        """Retire tous les événements encore en attente d'un groupe."""
+        heap = [event for event in self._heap if event[4] != group]
+        if len(heap) != len(self._heap):
+            heapq.heapify(heap)
+            self._heap = heap
+
+    def next_tick(self):
+        return self._heap[0][0] if self._heap else None
+
+    def run(self, tick, stage):
+        """Déclenche, dans l'ordre, les événements dus jusqu'à (tick, stage) inclus."""
+        heap = self._heap
+        while heap and (heap[0][0], heap[0][1]) <= (tick, stage):
+            action = heapq.heappop(heap)[3]
+            action()
+
@@ -116,9 +116,9 @@ class SpecialWeapon:
     """Arme speciale permanente assignee au joueur pour toute la partie.
     Se declenche quand le combo atteint un multiple du milestone."""
 
-    def __init__(self, weapon_type=None):
+    def __init__(self, weapon_type=None, rng=None):
         if weapon_type is None:
-            weapon_type = random.choice(list(SPECIAL_WEAPONS.keys()))
+            weapon_type = (rng or random).choice(list(SPECIAL_WEAPONS.keys()))
         self.weapon_type = weapon_type
         self.config = SPECIAL_WEAPONS[weapon_type]
         self.milestone = self.config["milestone"]
@@ -152,6 +152,7 @@ class SpecialWeapon:
     def _fire_la_vague(self, player, projectile_list):
         """Tire 10 projectiles paralleles repartis sur la largeur de l'ecran."""
         from entities.projectiles import Projectile
+        from systems import object_pool
 
         num_shots = 10
         margin = 40
@@ -160,7 +161,7 @@ class SpecialWeapon:
 
         for i in range(num_shots):
             x = margin + i * spacing
-            proj = Projectile(int(x), y, speed=12)
+            proj = object_pool.acquire(Projectile, int(x), y, speed=12)
             proj.is_special_weapon = True
             proj.image.fill((0, 150, 255))
             projectile_list.append(proj)
@@ -0,0 +1,83 @@
+"""Guidage vectorisé (NumPy) des projectiles à tête chercheuse.
+
+Pendant leur phase de guidage, les HomingProjectile recalculent chaque
+frame la direction vers le joueur visé (normalisation, virage progressif,
+renormalisation). steer() fait ce calcul pour tous les tirs en une passe
+NumPy, avec les mêmes opérations flottantes que HomingProjectile.update :
+trajectoires identiques, parties et replays inchangés.
+
+Les positions et directions sont relues sur les objets puis réécrites (le
+reste du jeu, collisions et rendu, continue de lire rect, dx et dy).
+"""
+import numpy as np
+
+from entities.projectiles import HomingProjectile
+
+# En dessous, relire et réécrire les objets coûte plus que le calcul en lot ne fait gagner
+BATCH_MIN = 96
+
+
+def nearest_targets(xs, targets):
+    """Cible de chaque tir : la position la plus proche horizontalement (la première en cas d'égalité)."""
+    targets = np.asarray(targets, dtype=np.int64)
+    if len(targets) == 1:
+        return np.full(len(xs), targets[0, 0]), np.full(len(xs), targets[0, 1])
+    nearest = np.abs(xs[:, None] - targets[None, :, 0]).argmin(axis=1)
+    return targets[nearest, 0], targets[nearest, 1]
+
+
+def steer(cx, cy, dx, dy, tx, ty, turn):
+    """Nouvelles directions (dx, dy) après un virage de `turn` vers les cibles (tx, ty)."""
+    target_dx = tx - cx
+    target_dy = ty - cy
+    dist = np.sqrt((target_dx * target_dx + target_dy * target_dy).astype(np.float64))
+    seen = dist > 0
+    safe = np.where(seen, dist, 1.0)
+    new_dx = dx + (target_dx / safe - dx) * turn
+    new_dy = dy + (target_dy / safe - dy) * turn
+    d = np.sqrt(new_dx * new_dx + new_dy * new_dy)
+    scale = np.where(d > 0, d, 1.0)
+    new_dx = np.where(d > 0, new_dx / scale, new_dx)
+    new_dy = np.where(d > 0, new_dy / scale, new_dy)
+    # Tir exactement sur sa cible : direction inchangée
+    return np.where(seen, new_dx, dx), np.where(seen, new_dy, dy)
+
+
+def update_homing(projectiles, player_position, player_positions=None):
+    """Fait avancer d'une frame les HomingProjectile en phase de guidage, en lot.
+
+    Retourne les tirs traités ; les autres (phase de vol libre, sous-classes)
+    restent à mettre à jour par l'appelant.
+    """
+    if not player_position:
+        return ()
+    homing = [p for p in projectiles
+              if p.__class__ is HomingProjectile and p.timer + 1 < p.homing_duration]
+    if len(homing) < BATCH_MIN:
+        return ()
+
+    for proj in homing:
+        proj.timer += 1
+        proj.update_trail()
+
+    n = len(homing)
+    rects = [proj.rect for proj in homing]
+    cx = np.fromiter((rect.centerx for rect in rects), np.int64, n)
+    cy = np.fromiter((rect.centery for rect in rects), np.int64, n)
+    dx = np.fromiter((proj.dx for proj in homing), np.float64, n)
+    dy = np.fromiter((proj.dy for proj in homing), np.float64, n)
+    speed = np.fromiter((proj.speed for proj in homing), np.float64, n)
+    turn = np.fromiter((proj.turn_speed for proj in homing), np.float64, n)
+    tx, ty = nearest_targets(cx, player_positions or (player_position,))
+
+    dx, dy = steer(cx, cy, dx, dy, tx, ty, turn)
+    # int() des objets : troncature vers zéro
+    step_x = (dx * speed).astype(np.int64).tolist()
+    step_y = (dy * speed).astype(np.int64).tolist()
+
+    for proj, rect, new_dx, new_dy, sx, sy in zip(homing, rects, dx.tolist(), dy.tolist(), step_x, step_y):
+        proj.dx = new_dx
+        proj.dy = new_dy
+        rect.x += sx
+        rect.y += sy
+    return homing
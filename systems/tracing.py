@@ -0,0 +1,237 @@
+"""Traces d'exécution au format Chrome (chrome://tracing, Perfetto), sans coût quand elles sont coupées.
+
+Deux façons de produire des spans (intervalles nommés) :
+- span(nom) : gestionnaire de contexte pour une phase de code (boucle de
+  Screen.run). Tracing coupé, il retourne un contexte vide partagé ;
+- les points de trace : méthodes et fonctions chaudes (Level.update,
+  manage_enemy_projectiles, passes de collision, update/draw et patterns
+  des boss, dessin des fonds, boucle du serveur). enable() les remplace
+  par une version tracée et disable() remet les originaux : tracing
+  coupé, elles s'exécutent sans aucune indirection.
+
+Les ramasse-miettes du GC sont enregistrés aussi, pour distinguer un
+saccadement dû à un pattern de boss d'une collecte.
+
+Les spans vont dans un tampon circulaire (les plus anciens sont écrasés) ;
+dump() l'écrit en JSON « trace event » à la demande (F9 en jeu, SIGUSR1
+pour le serveur). Avec la variable SPACEWAVE_TRACE=fichier.json, le
+tracing démarre avec le jeu (ou le serveur) et le tampon est écrit dans
+ce fichier à la sortie.
+"""
+import atexit
+import gc
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+TRACE_ENV = "SPACEWAVE_TRACE"
+
+# Nombre de spans gardés (les plus récents)
+DEFAULT_CAPACITY = 200000
+
+# Points de trace fixes : (module, attribut pointé, catégorie). Seuls les
+# modules déjà importés sont instrumentés.
+TRACE_POINTS = (
+    ("systems.level", "Level.update", "simulation"),
+    # Nom global lu par World._update_enemy_projectiles
+    ("systems.world", "manage_enemy_projectiles", "simulation"),
+    ("systems.world", "World._check_projectile_collisions", "collisions"),
+    ("systems.world", "World._check_enemy_projectile_collisions", "collisions"),
+    ("systems.world", "World._check_enemy_collisions", "collisions"),
+    ("systems.world", "World._check_laser_collision", "collisions"),
+)
+
+# Méthodes des boss tracées (en plus des préfixes de patterns ci-dessous)
+BOSS_METHODS = ("update", "draw", "shoot", "shoot_pattern", "update_death", "update_pattern_sequence")
+BOSS_PATTERN_PREFIXES = ("pattern_", "_fire_", "_update_")
+
+enabled = False
+_events = deque(maxlen=DEFAULT_CAPACITY)
+_patched = []
+_gc_start = {}
+
+
+class _Span:
+    __slots__ = ("name", "cat", "start")
+
+    def __init__(self, name, cat):
+        self.name = name
+        self.cat = cat
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        _events.append((self.name, self.cat, self.start, end - self.start, threading.get_ident(), None))
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name, cat="jeu"):
+    """with span("draw"): ... ; ne coûte qu'un appel quand le tracing est coupé."""
+    if not enabled:
+        return _NULL_SPAN
+    return _Span(name, cat)
+
+
+def _traced(func, name, cat):
+    perf_counter_ns = time.perf_counter_ns
+    get_ident = threading.get_ident
+    append = _events.append
+
+    if inspect.iscoroutinefunction(func):
+        async def traced(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                append((name, cat, start, perf_counter_ns() - start, get_ident(), None))
+    else:
+        def traced(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                append((name, cat, start, perf_counter_ns() - start, get_ident(), None))
+    traced.__wrapped__ = func
+    return traced
+
+
+def _patch(owner, attr, name, cat):
+    original = vars(owner).get(attr) if isinstance(owner, type) else getattr(owner, attr, None)
+    if original is None or not callable(original):
+        return
+    setattr(owner, attr, _traced(original, name, cat))
+    _patched.append((owner, attr, original))
+
+
+def _boss_points():
+    bosses = sys.modules.get("entities.bosses")
+    if bosses is None:
+        return []
+    points = []
+    for cls in vars(bosses).values():
+        if not isinstance(cls, type):
+            continue
+        for attr, value in vars(cls).items():
+            if callable(value) and (attr in BOSS_METHODS or attr.startswith(BOSS_PATTERN_PREFIXES)):
+                points.append((cls, attr, f"{cls.__name__}.{attr}", "boss"))
+    return points
+
+
+def _background_points():
+    background = sys.modules.get("graphics.background")
+    if background is None:
+        return []
+    return [(cls, "draw", f"{cls.__name__}.draw", "rendu")
+            for cls in vars(background).values()
+            if isinstance(cls, type) and cls.__module__ == background.__name__ and "draw" in vars(cls)]
+
+
+def _fixed_points():
+    points = []
+    for module_name, path, cat in TRACE_POINTS:
+        owner = sys.modules.get(module_name)
+        if owner is None:
+            continue
+        owner_path, _, attr = path.rpartition(".")
+        for part in filter(None, owner_path.split(".")):
+            owner = getattr(owner, part)
+        points.append((owner, attr, path, cat))
+    return points
+
+
+def _on_gc(phase, info):
+    if phase == "start":
+        _gc_start[threading.get_ident()] = time.perf_counter_ns()
+        return
+    start = _gc_start.pop(threading.get_ident(), None)
+    if start is not None:
+        args = {"génération": info.get("generation"), "collectés": info.get("collected")}
+        _events.append((f"GC gen {info.get('generation')}", "gc", start,
+                        time.perf_counter_ns() - start, threading.get_ident(), args))
+
+
+def enable(extra_points=(), capacity=DEFAULT_CAPACITY):
+    """Active le tracing. extra_points : (objet, attribut, catégorie) à tracer en plus."""
+    global enabled, _events
+    if enabled:
+        return
+    if _events.maxlen != capacity:
+        _events = deque(maxlen=capacity)
+    points = _fixed_points() + _boss_points() + _background_points()
+    for owner, attr, cat in extra_points:
+        owner_name = owner.__name__ if isinstance(owner, type) else type(owner).__name__
+        points.append((owner, attr, f"{owner_name}.{attr}", cat))
+    for owner, attr, name, cat in points:
+        _patch(owner, attr, name, cat)
+    gc.callbacks.append(_on_gc)
+    enabled = True
+
+
+def disable():
+    """Coupe le tracing et remet les fonctions d'origine ; le tampon est conservé."""
+    global enabled
+    if not enabled:
+        return
+    for owner, attr, original in reversed(_patched):
+        setattr(owner, attr, original)
+    _patched.clear()
+    if _on_gc in gc.callbacks:
+        gc.callbacks.remove(_on_gc)
+    _gc_start.clear()
+    enabled = False
+
+
+def clear():
+    _events.clear()
+
+
+def trace_events():
+    """Contenu du tampon au format Chrome trace event (durées en microsecondes)."""
+    pid = os.getpid()
+    events = []
+    for name, cat, start, duration, tid, args in list(_events):
+        event = {"name": name, "cat": cat, "ph": "X", "ts": start / 1000,
+                 "dur": duration / 1000, "pid": pid, "tid": tid}
+        if args:
+            event["args"] = args
+        events.append(event)
+    return events
+
+
+def dump(path=None):
+    """Écrit le tampon dans un fichier JSON lisible par chrome://tracing ou Perfetto. Retourne le chemin."""
+    if path is None:
+        path = time.strftime("trace-%Y%m%d-%H%M%S.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": trace_events(), "displayTimeUnit": "ms"}, f)
+    print(f"Trace écrite : {path} ({len(_events)} spans)")
+    return path
+
+
+def enable_from_env(extra_points=()):
+    """Active le tracing si SPACEWAVE_TRACE est défini, avec écriture du fichier à la sortie."""
+    path = os.environ.get(TRACE_ENV)
+    if not path:
+        return False
+    enable(extra_points)
+    atexit.register(dump, path)
+    return True
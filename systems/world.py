@@ -0,0 +1,421 @@
+"""Simulation du jeu sans rendu, partagée par le solo, le serveur et game.py.
+
+Le World contient tout l'état de la partie (niveau, joueurs, projectiles,
+explosions, power-ups) et avance d'un tick avec step(inputs). Les écrans et
+le serveur ne font que fournir les inputs et lire l'état pour l'afficher
+ou le diffuser.
+"""
+import math
+from itertools import islice
+
+import pygame
+
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from systems.level import Level
+from systems.combo import ComboSystem
+from systems.special_weapon import SpecialWeapon
+from systems.projectile_manager import manage_enemy_projectiles
+from systems.enemy_registry import kind_of, UPDATE_SIMPLE, UPDATE_DASH, UPDATE_DUAL
+from systems.spatial_hash import SpatialHash
+from systems.bullet_pool import BulletPool
+from systems import object_pool
+from systems.sim_clock import SimClock
+from entities.player import Player
+from entities.powerup import PowerUp
+from entities.bosses import Boss3, Boss4
+from entities.enemy import SplitterEnemy
+from entities.projectiles import RicochetProjectile, MissileProjectile, PulseWaveProjectile
+from graphics.effects import Explosion
+
+# Power-ups lâchés par les ennemis abattus par un tir / percutés par un joueur
+SHOT_POWER_TYPES = ['double', 'triple', 'spread', 'ricochet', 'missile']
+CONTACT_POWER_TYPES = ['double', 'triple', 'spread']
+
+IDLE_INPUT = (0, 0, False)
+
+
+class World:
+    """État complet d'une partie et logique de mise à jour (un tick = une frame à 60 FPS)."""
+
+    def __init__(self, num_players=1, seed=None, headless=False, combo_enabled=True, level_num=1):
+        # Tirs ennemis simples (structure de tableaux) ; les autres restent dans enemy_projectiles
+        self.bullet_pool = BulletPool()
+        # Temps de la partie : avance d'un tick à chaque step(), s'arrête avec elle
+        self.clock = SimClock()
+        self.level = Level(seed=seed, bullet_pool=self.bullet_pool, level_num=level_num)
+        self.rng = self.level.rng
+
+        if num_players == 1:
+            positions = [(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100)]
+        else:
+            positions = [(SCREEN_WIDTH * (i + 1) // (num_players + 1), SCREEN_HEIGHT - 100)
+                         for i in range(num_players)]
+        self.players = [
+            Player(x, y, player_id=i + 1, is_local=True, headless=headless, rng=self.rng,
+                   clock=self.clock)
+            for i, (x, y) in enumerate(positions)
+        ]
+
+        self.projectiles = []
+        self.enemy_projectiles = []
+        self.explosions = []
+        self.powerups = []
+        # Objets poolés sortis du jeu pendant le tick, rendus à la fin de step()
+        self._released = []
+
+        # Broadphase des ennemis, reconstruite à chaque tick avant les collisions
+        self.enemy_grid = SpatialHash()
+
+        # Combo et arme spéciale (solo uniquement : déclenchés pour le premier joueur)
+        self.combo_enabled = combo_enabled
+        self.combo = ComboSystem(clock=self.clock)
+        self.special_weapon = SpecialWeapon(rng=self.rng)
+
+        self.game_over = False
+        self.victory = False
+
+    # === Joueurs ===
+
+    def get_player(self, player_id):
+        for player in self.players:
+            if player.player_id == player_id:
+                return player
+        return None
+
+    def remove_player(self, player):
+        """Retire un joueur qui a quitté la partie."""
+        if player in self.players:
+            self.players.remove(player)
+
+    def alive_players(self):
+        return [p for p in self.players if p.hp > 0]
+
+    def _target_for(self, x, alive):
+        """Position du joueur vivant le plus proche horizontalement."""
+        if not alive:
+            return self.players[0].rect.center if self.players else (SCREEN_WIDTH // 2, SCREEN_HEIGHT)
+        if len(alive) == 1:
+            return alive[0].rect.center
+        return min(alive, key=lambda p: abs(p.rect.centerx - x)).rect.center
+
+    def _damage_player(self, player, amount):
+        player.hp -= amount
+        if player.hp <= 0:
+            if not player.is_crashing:
+                player.start_crash()
+        else:
+            player.invulnerable = True
+            player.invuln_start = self.clock.get_ticks()
+
+    # === Tick de simulation ===
+
+    def step(self, inputs):
+        """Avance la simulation d'un tick.
+
+        inputs : dict player_id -> (dx, dy, shoot). Un joueur absent du dict
+        ne bouge pas et ne tire pas.
+        """
+        if self.game_over or self.victory:
+            return
+
+        # Les objets créés pendant le tick sans horloge explicite prennent celle de la partie
+        with self.clock:
+            self._update_players(inputs)
+            self.level.update()
+            self._update_projectiles()
+            self._update_enemies()
+            self._update_enemy_projectiles()
+            self.enemy_grid = SpatialHash.from_objects(e for e in self.level.enemies if e.alive)
+            self._check_projectile_collisions()
+            self._check_enemy_projectile_collisions()
+            self._check_enemy_collisions()
+            self._check_laser_collision()
+            self._update_explosions()
+            self._update_powerups()
+            if self.combo_enabled:
+                self.combo.update()
+                self.special_weapon.update()
+            self._sweep()
+            object_pool.release_all(self._released)
+            self._released.clear()
+        self.clock.advance()
+
+        if self.players and all(p.hp <= 0 and not p.is_crashing for p in self.players):
+            self.game_over = True
+
+    def _update_players(self, inputs):
+        for player in self.players:
+            if player.is_crashing:
+                if player.update():
+                    # Animation de crash terminée
+                    player.is_crashing = False
+            elif player.hp > 0:
+                player.set_input(*inputs.get(player.player_id, IDLE_INPUT))
+                if player.wants_to_shoot:
+                    player.shoot(self.projectiles)
+                player.update()
+
+    def _update_projectiles(self):
+        for projectile in self.projectiles:
+            projectile.update()
+
+        # Détecter les tirs qui quittent l'écran sans toucher
+        removed = [p for p in self.projectiles if p.rect.bottom <= 0]
+        for projectile in removed:
+            projectile.alive = False
+        self._released.extend(removed)
+        tirs_rates = sum(1 for p in removed if not getattr(p, 'is_special_weapon', False))
+        if tirs_rates > 0 and self.combo_enabled:
+            self.combo.miss()
+
+    def _boss_explosions(self, enemy, count, size, duration):
+        for _ in range(count):
+            rand_x = enemy.rect.left + self.rng.randint(0, size)
+            rand_y = enemy.rect.top + self.rng.randint(0, size)
+            self._explode(rand_x, rand_y, duration=duration)
+
+    def _update_enemies(self):
+        alive = self.alive_players()
+        for enemy in self.level.enemies:
+            kind = kind_of(enemy)
+            if kind.update == UPDATE_SIMPLE:
+                continue  # Déjà mis à jour par Level.update
+            target = self._target_for(enemy.rect.centerx, alive)
+            if kind.update == UPDATE_DASH:
+                enemy.update_with_player(target)
+                continue
+            if kind.update == UPDATE_DUAL:
+                # Le Boss 1 suit les deux joueurs du regard
+                first = alive[0].rect.center if alive else target
+                second = alive[1].rect.center if len(alive) > 1 else None
+                result = enemy.update(first, self.enemy_projectiles, second)
+            else:
+                result = enemy.update(target, self.enemy_projectiles)
+            if kind.is_boss and result is True:
+                self.level.kill(enemy)
+                self._boss_explosions(enemy, *kind.death_explosions)
+                if kind.defeat_flag:
+                    self.level.on_boss_defeated(kind.defeat_flag)
+                if kind.ends_game:
+                    self.victory = True
+
+    def _update_enemy_projectiles(self):
+        # Utiliser le gestionnaire centralisé pour mettre à jour et filtrer les projectiles
+        alive = self.alive_players()
+        previous = self.enemy_projectiles
+        self.enemy_projectiles = manage_enemy_projectiles(
+            previous,
+            self._target_for(SCREEN_WIDTH // 2, alive),
+            [p.rect.center for p in alive] if len(alive) > 1 else None
+        )
+        kept = set(map(id, self.enemy_projectiles))
+        self._released.extend(p for p in previous if id(p) not in kept)
+        self.bullet_pool.update()
+
+    # === Collisions ===
+
+    def _on_hit(self):
+        """Un tir du joueur a touché : combo et déclenchement de l'arme spéciale."""
+        if not self.combo_enabled:
+            return
+        new_count = self.combo.hit()
+        if self.special_weapon.check_trigger(new_count) and self.players:
+            self.special_weapon.activate(self.players[0], self.projectiles)
+
+    def _damage_boss(self, boss, amount):
+        boss.take_damage(amount)
+        if boss.hp <= 0 and not boss.is_dying:
+            boss.is_dying = True
+
+    def _kill_enemy(self, enemy, power_types):
+        """Mort d'un ennemi standard : power-up éventuel, division, retrait."""
+        if getattr(enemy, 'drops_powerup', False):
+            chosen_power = self.rng.choice(power_types)
+            self.powerups.append(PowerUp(enemy.rect.centerx, enemy.rect.centery, chosen_power))
+        # Gérer la division du SplitterEnemy
+        if isinstance(enemy, SplitterEnemy):
+            for mini in enemy.split():
+                self.level.add_enemy(mini)
+                self.enemy_grid.insert(mini)
+        self.enemy_grid.remove(enemy)
+        self.level.kill(enemy)
+
+    def _shoot_enemy(self, enemy):
+        """Un tir standard (ou ricochet) touche un ennemi."""
+        if kind_of(enemy).is_boss:
+            self._damage_boss(enemy, 1)
+        else:
+            enemy.hp -= 1
+            if enemy.hp <= 0:
+                self._kill_enemy(enemy, SHOT_POWER_TYPES)
+                self._explode(enemy.rect.centerx, enemy.rect.centery)
+            else:
+                self._explode(enemy.rect.centerx, enemy.rect.centery, duration=150)
+
+    def _remove_projectile(self, projectile):
+        if projectile.alive:
+            projectile.alive = False
+            self._released.append(projectile)
+
+    def _explode(self, x, y, duration=300):
+        self.explosions.append(object_pool.acquire(Explosion, x, y, duration, self.clock))
+
+    def _check_projectile_collisions(self):
+        # Les tirs ajoutés pendant la passe (arme spéciale) ne sont testés qu'au tick suivant
+        for projectile in islice(self.projectiles, len(self.projectiles)):
+            if not projectile.alive:
+                continue
+            for enemy in self.enemy_grid.query_rect(projectile.rect):
+                if projectile.rect.colliderect(enemy.rect):
+                    if kind_of(enemy).is_boss and enemy.is_dying:
+                        continue
+
+                    # Gerer le missile : explosion AOE au point d'impact
+                    if isinstance(projectile, MissileProjectile):
+                        impact_x, impact_y = projectile.rect.centerx, projectile.rect.centery
+                        self._remove_projectile(projectile)
+                        self._explode(impact_x, impact_y)
+                        self._on_hit()
+                        # Degats AOE a tous les ennemis dans le rayon
+                        radius = projectile.aoe_radius
+                        for aoe_enemy in self.enemy_grid.query_radius(impact_x, impact_y, radius):
+                            dx = aoe_enemy.rect.centerx - impact_x
+                            dy = aoe_enemy.rect.centery - impact_y
+                            if math.sqrt(dx * dx + dy * dy) <= radius:
+                                if kind_of(aoe_enemy).is_boss:
+                                    if not aoe_enemy.is_dying:
+                                        self._damage_boss(aoe_enemy, projectile.aoe_damage)
+                                else:
+                                    aoe_enemy.hp -= projectile.aoe_damage
+                                    if aoe_enemy.hp <= 0:
+                                        self._kill_enemy(aoe_enemy, SHOT_POWER_TYPES)
+                                        self._explode(aoe_enemy.rect.centerx, aoe_enemy.rect.centery)
+                    # Gerer le ricochet : le projectile rebondit au lieu d'etre detruit
+                    elif isinstance(projectile, RicochetProjectile):
+                        if not projectile.ricochet():
+                            self._remove_projectile(projectile)
+                        self._on_hit()
+                        self._shoot_enemy(enemy)
+                    else:
+                        self._remove_projectile(projectile)
+                        self._on_hit()
+                        self._shoot_enemy(enemy)
+                    break
+
+    def _check_enemy_projectile_collisions(self):
+        alive = self.alive_players()
+        if not alive:
+            return
+        grid = SpatialHash()
+        for e_proj in self.enemy_projectiles:
+            if isinstance(e_proj, PulseWaveProjectile):
+                grid.insert(e_proj, e_proj.get_bounds())
+            else:
+                grid.insert(e_proj)
+
+        # Seuls les projectiles proches d'au moins un joueur sont testés
+        for e_proj in grid.query_rects([p.rect for p in alive]):
+            for player in self.alive_players():
+                if isinstance(e_proj, PulseWaveProjectile):
+                    # Onde de choc : touche sans être détruite
+                    if e_proj.check_collision(player.rect) and not player.invulnerable:
+                        self._damage_player(player, 1)
+                        break
+                elif e_proj.rect.colliderect(player.rect):
+                    e_proj.alive = False
+                    self._released.append(e_proj)
+                    if not player.invulnerable:
+                        self._damage_player(player, 1)
+                    break
+
+        # Tirs du pool : un masque par joueur, chaque tir ne touche que le premier
+        for player in self.alive_players():
+            hits = self.bullet_pool.collide(player.rect)
+            if hits.any():
+                self.bullet_pool.remove(hits)
+                if not player.invulnerable and player.hp > 0:
+                    self._damage_player(player, 1)
+
+    def _check_enemy_collisions(self):
+        alive = self.alive_players()
+        for enemy in self.enemy_grid.query_rects([p.rect for p in alive]):
+            for player in self.alive_players():
+                if not enemy.rect.colliderect(player.rect):
+                    continue
+                if kind_of(enemy).is_boss and enemy.is_dying:
+                    continue
+                # Collision avec Boss4 en charge = degats massifs
+                if isinstance(enemy, Boss4) and enemy.charging:
+                    if not player.invulnerable:
+                        self._damage_player(player, 3)
+                    continue
+                if player.invulnerable:
+                    continue
+
+                if kind_of(enemy).is_boss:
+                    self._damage_boss(enemy, player.contact_damage)
+                else:
+                    enemy.hp -= player.contact_damage
+                impact_x = (player.rect.centerx + enemy.rect.centerx) // 2
+                impact_y = (player.rect.centery + enemy.rect.centery) // 2
+                self._explode(impact_x, impact_y)
+                if enemy.hp <= 0 and not kind_of(enemy).is_boss:
+                    self._kill_enemy(enemy, CONTACT_POWER_TYPES)
+                self._damage_player(player, player.contact_damage)
+                if not enemy.alive:
+                    break
+
+    def _check_laser_collision(self):
+        # Collision laser du Boss3 avec les joueurs
+        for enemy in self.level.enemies:
+            if isinstance(enemy, Boss3) and enemy.laser_active and enemy.alive:
+                laser_rect = pygame.Rect(enemy.laser_target_x - 25, 0, 50, SCREEN_HEIGHT)
+                for player in self.alive_players():
+                    if not player.invulnerable and player.rect.colliderect(laser_rect):
+                        self._damage_player(player, 2)
+
+        # Collision laser du joueur (arme speciale) avec les ennemis
+        if self.combo_enabled and self.special_weapon.active_laser:
+            laser_rect = self.special_weapon.active_laser.get_rect()
+            for enemy in self.enemy_grid.query_rect(laser_rect):
+                if self.special_weapon.check_laser_collision(enemy):
+                    if kind_of(enemy).is_boss:
+                        if enemy.is_dying:
+                            continue
+                        self._damage_boss(enemy, 1)
+                    else:
+                        enemy.hp -= 1
+                        if enemy.hp <= 0:
+                            self._kill_enemy(enemy, SHOT_POWER_TYPES)
+                            self._explode(enemy.rect.centerx, enemy.rect.centery)
+
+    def _update_explosions(self):
+        for exp in self.explosions:
+            exp.update()
+        running = []
+        for exp in self.explosions:
+            if exp.is_finished():
+                self._released.append(exp)
+            else:
+                running.append(exp)
+        self.explosions = running
+
+    def _update_powerups(self):
+        alive = self.alive_players()
+        for powerup in self.powerups:
+            powerup.update()
+            if powerup.rect.top >= SCREEN_HEIGHT:
+                powerup.alive = False
+                continue
+            for player in alive:
+                if powerup.rect.colliderect(player.rect):
+                    player.apply_powerup(powerup.power_type)
+                    powerup.alive = False
+                    break
+
+    def _sweep(self):
+        """Balayage de fin de tick : retire en une passe par liste les entités marquées mortes."""
+        self.projectiles = [p for p in self.projectiles if p.alive]
+        self.enemy_projectiles = [p for p in self.enemy_projectiles if p.alive]
+        self.powerups = [p for p in self.powerups if p.alive]
+        self.level.sweep()
@@ -28,10 +28,12 @@ from entities.enemy import (
     RipperEnemy, ChainEnemy
 )
 from entities.bosses import Boss, Boss2, Boss3, Boss4, Boss5, Boss6, Boss7, Boss8, Boss9
+from systems.spatial_hash import SpatialHash
 from graphics.background import Background
 from graphics.effects import Explosion
 from systems.combo import ComboSystem
 from systems.projectile_manager import manage_enemy_projectiles
+from stress import StressScenario, DEFAULT_COUNTS, FRAME_BUDGET_MS
 
 
 def get_pattern_name(enemy):
@@ -175,6 +177,8 @@ def show_menu(screen, font):
         ("8 - Boss 8 (Leviathan)",           (100, 200, 255)),
         ("9 - Boss 9 (Void Phoenix)",        (180, 100, 255)),
         ("",                                 WHITE),
+        ("F8 - Stress bullet-hell",          (255, 80, 80)),
+        ("",                                 WHITE),
         ("ESC - Quitter",                    (100, 100, 100)),
     ]
     for i, (text, color) in enumerate(boss_items):
@@ -476,9 +480,11 @@ def run_test(entity_type):
         projectiles = [p for p in projectiles if p.rect.bottom > 0]
 
         # Effet magnétique
+        projectile_grid = SpatialHash.from_objects(projectiles)
         for enemy in enemies:
             if isinstance(enemy, MagnetEnemy):
-                enemy.apply_magnet(projectiles)
+                enemy.apply_magnet(projectiles, projectile_grid)
+        enemy_grid = SpatialHash.from_objects(enemies)
 
         # Update ennemis
         for enemy in enemies[:]:
@@ -591,7 +597,7 @@ def run_test(entity_type):
             elif isinstance(enemy, OrbiterEnemy):
                 enemy.update(player.rect.center, enemy_projectiles)
             elif isinstance(enemy, HealerEnemy):
-                enemy.update(enemies)
+                enemy.update(enemies, enemy_grid)
             elif isinstance(enemy, OverchargedEnemy):
                 enemy.update(enemy_projectiles)
             elif isinstance(enemy, SentinelEnemy):
@@ -949,6 +955,56 @@ def run_test(entity_type):
     return False
 
 
+def run_stress_test():
+    """Scénario de stress (voir stress.py) : tous les types de projectiles en masse et boss 4, 8, 9"""
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Test - Stress bullet-hell")
+    clock = pygame.time.Clock()
+    small_font = pygame.font.SysFont(None, 24)
+
+    per_type = DEFAULT_COUNTS[0]
+    scenario = StressScenario(per_type)
+    timings = (0.0, 0.0, 0.0)
+
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    return True  # Retour au menu
+                if event.key in (pygame.K_UP, pygame.K_DOWN):
+                    # Nouveau scénario (même graine) avec deux fois plus / moins de tirs par type
+                    per_type = per_type * 2 if event.key == pygame.K_UP else max(1, per_type // 2)
+                    scenario = StressScenario(per_type)
+                if event.key == pygame.K_r:
+                    scenario = StressScenario(per_type)
+
+        timings = scenario.frame(screen)
+        refill_ms, step_ms, draw_ms = timings
+        frame_ms = sum(timings)
+
+        lines = [
+            (f"Projectiles: {len(scenario)} ({per_type} x {len(scenario.factories)} types)", WHITE),
+            (f"Frame: {frame_ms:.1f} ms ({clock.get_fps():.0f} FPS)",
+             (255, 100, 100) if frame_ms > FRAME_BUDGET_MS else WHITE),
+            (f"Step: {step_ms:.1f} ms | Dessin: {draw_ms:.1f} ms | Remplissage: {refill_ms:.1f} ms",
+             (150, 150, 150)),
+        ]
+        panel = pygame.Surface((470, len(lines) * 22 + 8), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 190))
+        screen.blit(panel, (4, 4))
+        for i, (text, color) in enumerate(lines):
+            screen.blit(small_font.render(text, True, color), (10, 10 + i * 22))
+
+        instr = small_font.render("ESC: Menu | HAUT/BAS: x2 / ÷2 tirs par type | R: Relancer", True, (150, 150, 150))
+        screen.blit(instr, (10, SCREEN_HEIGHT - 25))
+
+        pygame.display.flip()
+        clock.tick(FPS)
+
+
 def main():
     pygame.init()
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -1098,6 +1154,9 @@ def main():
                 elif event.key == pygame.K_F7:
                     if not run_test("Binôme"):
                         running = False
+                elif event.key == pygame.K_F8:
+                    if not run_stress_test():
+                        running = False
 
     pygame.quit()
 